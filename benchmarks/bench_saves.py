@@ -0,0 +1,148 @@
+"""
+Compares save and load time as well as file size of the `GameSave`,
+`PickleGameSave` and `BinaryGameSave` backends for a large game save, with
+and without compression.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_saves [--items 10000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pyglet
+
+pyglet.options["shadow_window"] = False
+
+from cme.resource_ import (BinaryGameSave, GameSave,  # noqa: E402
+                           PickleGameSave, codec, compression)
+
+
+def make_state(items: int) -> dict[str, Any]:
+    """A save with a big inventory and world state."""
+    rng = random.Random(42)
+    return {
+        "player": {"name": "Milly", "level": 42, "xp": 123456, "hp": 87.5},
+        "inventory": [
+            {
+                "id": rng.randrange(10_000),
+                "name": f"item_{i}",
+                "count": rng.randrange(1, 99),
+                "durability": rng.random(),
+                "enchanted": rng.random() < 0.1,
+            }
+            for i in range(items)
+        ],
+        "world": {
+            "tiles": [
+                [rng.randrange(16) for _ in range(128)] for _ in range(128)
+            ],
+            "flags": {f"quest_{i}": rng.random() < 0.5 for i in range(500)},
+        },
+    }
+
+
+class JsonSave(GameSave):
+    def __init__(self, state: dict[str, Any]) -> None:
+        self.state = state
+
+    def update(self, **kwargs: Any) -> None:
+        self.state.update(kwargs)
+
+    def _serialize(self) -> dict[str, Any]:
+        return self.state
+
+    @classmethod
+    def _deserialize(cls, dictionary: dict[str, Any]) -> JsonSave:
+        return cls(dictionary)
+
+    @staticmethod
+    def defaults() -> dict[str, Any]:
+        return {}
+
+
+class PickleSave(PickleGameSave):
+    def __init__(self, state: dict[str, Any]) -> None:
+        self.state = state
+
+    def update(self, **kwargs: Any) -> None:
+        self.state.update(kwargs)
+
+    @staticmethod
+    def defaults() -> dict[str, Any]:
+        return {}
+
+
+class BinarySave(BinaryGameSave):
+    def __init__(self, state: dict[str, Any]) -> None:
+        self.state = state
+
+    def update(self, **kwargs: Any) -> None:
+        self.state.update(kwargs)
+
+    def _serialize(self) -> dict[str, Any]:
+        return self.state
+
+    @classmethod
+    def _deserialize(cls, dictionary: dict[str, Any]) -> BinarySave:
+        return cls(dictionary)
+
+    @staticmethod
+    def defaults() -> dict[str, Any]:
+        return {}
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    state = make_state(args.items)
+    binary_name = (
+        "BinaryGameSave (msgpack)" if codec.ACCELERATED
+        else "BinaryGameSave (pure python)"
+    )
+    backends: list[tuple[str, Any, Optional[compression.Compression]]] = [
+        ("GameSave (json)", JsonSave, None),
+        ("PickleGameSave", PickleSave, None),
+        (binary_name, BinarySave, None),
+    ]
+    for method in compression.available_compressions():
+        backends.append((f"GameSave (json, {method})", JsonSave, method))
+        backends.append((f"PickleGameSave ({method})", PickleSave, method))
+    print(f"{'backend':<30}{'save ms':>10}{'load ms':>10}{'size KiB':>10}")
+    with tempfile.TemporaryDirectory() as tempdir:
+        for name, cls, compression_ in backends:
+            file = Path(tempdir) / name
+            game_save = cls(state)
+            game_save.COMPRESSION = compression_
+            save_time = best_of(
+                args.repeat, lambda: game_save.save_to_file(file)
+            )
+            load_time = best_of(args.repeat, lambda: cls.from_file(file))
+            size = file.stat().st_size
+            print(
+                f"{name:<30}{save_time * 1000:>10.1f}"
+                f"{load_time * 1000:>10.1f}{size / 1024:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
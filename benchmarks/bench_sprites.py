@@ -0,0 +1,139 @@
+"""
+Benchmarks of the per frame hot paths of sprites: the updaters,
+`AnimatedSprite.update_animation()` and `Animator.update()`, each at 100,
+1k, 10k and 100k sprites. One benchmark round is one frame.
+
+Runs headless, the sprites use small stand-in textures that are never drawn.
+Run from the repository root:
+
+    python -m pytest benchmarks/bench_sprites.py
+
+Set `CME_BENCH_MAX_SPRITES` (e.g. to 10000) to skip the bigger counts.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import random
+from typing import Any
+
+import arcade
+import pytest
+from arcade.types import LBWH
+from PIL import Image
+
+from cme.sprite import (AnimatedSprite, Animator, SimpleUpdater, Sprite,
+                        StrictCollisionUpdater, TopDownUpdater, Updater,
+                        WallBounceUpdater)
+
+SPRITE_COUNTS = [
+    count for count in (100, 1_000, 10_000, 100_000)
+    if count <= int(os.environ.get("CME_BENCH_MAX_SPRITES", 100_000))
+]
+DELTA_TIME = 1 / 60
+WORLD = LBWH(0, 0, 8192, 8192)
+
+
+@functools.cache
+def stand_in_texture(color: tuple[int, int, int, int]) -> arcade.Texture:
+    return arcade.Texture(Image.new("RGBA", (16, 16), color))
+
+
+@functools.cache
+def walls() -> arcade.SpriteList[Sprite]:
+    """Scattered walls, spatially hashed like real level geometry."""
+    rng = random.Random(0)
+    wall_list: arcade.SpriteList[Sprite] = arcade.SpriteList(
+        use_spatial_hash=True, lazy=True
+    )
+    for _ in range(500):
+        wall_list.append(Sprite(
+            stand_in_texture((128, 128, 128, 255)),
+            center_x=rng.uniform(WORLD.left, WORLD.right),
+            center_y=rng.uniform(WORLD.bottom, WORLD.top),
+        ))
+    return wall_list
+
+
+def make_sprites(count: int) -> list[Any]:
+    rng = random.Random(count)
+    texture = stand_in_texture((255, 0, 0, 255))
+    sprites = []
+    for _ in range(count):
+        sprite = arcade.Sprite(
+            texture,
+            center_x=rng.uniform(WORLD.left + 16, WORLD.right - 16),
+            center_y=rng.uniform(WORLD.bottom + 16, WORLD.top - 16),
+        )
+        sprite.change_x = rng.uniform(-200, 200)
+        sprite.change_y = rng.uniform(-200, 200)
+        sprite.change_angle = rng.uniform(-90, 90)
+        sprites.append(sprite)
+    return sprites
+
+
+def make_animated_sprites(count: int) -> list[AnimatedSprite]:
+    textures: list[tuple[arcade.Texture, ...]] = [
+        (stand_in_texture((i * 60, 0, 0, 255)),) for i in range(4)
+    ]
+    sprites = []
+    for _ in range(count):
+        sprite = AnimatedSprite()
+        sprite.add_textures({"walking": textures})
+        sprite.state = "walking"
+        sprite.animation_speed = 0  # Switch texture on every update
+        sprites.append(sprite)
+    return sprites
+
+
+UPDATERS: dict[str, Any] = {
+    "SimpleUpdater": lambda: SimpleUpdater(),
+    "WallBounceUpdater": lambda: WallBounceUpdater(WORLD),
+    "StrictCollisionUpdater": lambda: StrictCollisionUpdater(walls()),
+    "TopDownUpdater": lambda: TopDownUpdater(walls(), WORLD),
+}
+
+
+@pytest.mark.parametrize("count", SPRITE_COUNTS)
+@pytest.mark.parametrize("updater_name", list(UPDATERS))
+def test_updater(benchmark: Any, updater_name: str, count: int) -> None:
+    updater: Updater = UPDATERS[updater_name]()
+    sprites = make_sprites(count)
+    benchmark.extra_info["sprites"] = count
+
+    def frame() -> None:
+        update = updater.update
+        for sprite in sprites:
+            update(sprite, DELTA_TIME)
+
+    benchmark(frame)
+
+
+@pytest.mark.parametrize("count", SPRITE_COUNTS)
+def test_update_animation(benchmark: Any, count: int) -> None:
+    sprites = make_animated_sprites(count)
+    benchmark.extra_info["sprites"] = count
+
+    def frame() -> None:
+        for sprite in sprites:
+            sprite.update_animation(DELTA_TIME)
+
+    benchmark(frame)
+
+
+@pytest.mark.parametrize("count", SPRITE_COUNTS)
+def test_animator_update(benchmark: Any, count: int) -> None:
+    sprites = make_sprites(count)
+    # Long enough to never finish while benchmarking
+    animators = [
+        Animator(sprite, 1e9, center_x=0, center_y=0, angle=360)
+        for sprite in sprites
+    ]
+    benchmark.extra_info["sprites"] = count
+
+    def frame() -> None:
+        for animator in animators:
+            animator.update(DELTA_TIME)
+
+    benchmark(frame)
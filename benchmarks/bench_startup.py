@@ -0,0 +1,217 @@
+"""
+Measures import times of cme and its subpackages as well as the durations of
+the startup phases of a game, and compares them against a stored baseline.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup [--repeat 5] [--save-baseline]
+
+Every measurement runs in a fresh interpreter and the median of `--repeat`
+runs is reported. Cold imports start with an empty bytecode cache, warm
+imports with an already populated one. Creating the first window is skipped
+if no display is available, unless `--headless` is given (requires EGL).
+
+Baselines are machine specific and ignored by git. Save one with
+`--save-baseline` before a change, then run again afterwards. The exit status
+is 1 if any measurement regressed by more than `--tolerance`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+MODULES = [
+    "cme",
+    "cme.resource_",
+    "cme.localization",
+    "cme.concurrency",
+    "cme.logger",
+    "cme.color",
+    "cme.key",
+    "cme.sprite",
+    "cme.text",
+    "cme.gui",
+    "cme.window",
+]
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "startup.json"
+
+# Differences below this are noise, no matter the relative change
+MIN_REGRESSION = 0.002
+
+_IMPORT_CODE = """\
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def run_phases() -> None:
+    """
+    Run the startup phases of a game and print their durations as json.
+    Executed in a child process.
+    """
+    import time
+
+    times: dict[str, Optional[float]] = {}
+    tempdir = Path(tempfile.mkdtemp())
+
+    def phase(name: str, start: float) -> float:
+        now = time.perf_counter()
+        times[name] = now - start
+        return now
+
+    start = time.perf_counter()
+    import cme
+    start = phase("import cme", start)
+    cme.init_cme("cme_startup_benchmark")
+    start = phase("init_cme", start)
+    from cme import logger
+    logger.configure_logger(logs_path=tempdir)
+    start = phase("configure_logger", start)
+    from cme import resource_
+    resource_.set_assets_path(tempdir)
+    start = phase("set_assets_path", start)
+    from cme import window
+    start = phase("import cme.window", start)
+    try:
+        first_window = window.Window(visible=False)
+    except Exception:
+        times["first Window"] = None  # No display available
+    else:
+        phase("first Window", start)
+        first_window.close()  # type: ignore[no-untyped-call]
+    print(json.dumps(times))
+
+
+def _run(code: str, env: dict[str, str]) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def measure_import(module: str, cold: bool, repeat: int) -> float:
+    code = _IMPORT_CODE.format(module=module)
+    times = []
+    with tempfile.TemporaryDirectory() as warm_cache:
+        env = {**os.environ, "PYTHONPYCACHEPREFIX": warm_cache}
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        if not cold:
+            _run(code, env)  # Populate the cache
+        for _ in range(repeat):
+            if cold:
+                with tempfile.TemporaryDirectory() as cold_cache:
+                    env["PYTHONPYCACHEPREFIX"] = cold_cache
+                    times.append(float(_run(code, env)))
+            else:
+                times.append(float(_run(code, env)))
+    return statistics.median(times)
+
+
+def measure_phases(repeat: int) -> dict[str, Optional[float]]:
+    code = "from benchmarks.bench_startup import run_phases; run_phases()"
+    runs: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        output = json.loads(_run(code, dict(os.environ)))
+        for name, value in output.items():
+            runs.setdefault(name, [])
+            if value is not None:
+                runs[name].append(value)
+    return {
+        name: statistics.median(values) if values else None
+        for name, values in runs.items()
+    }
+
+
+def compare(
+    results: dict[str, Optional[float]],
+    baseline: dict[str, Optional[float]],
+    tolerance: float,
+) -> list[str]:
+    """Print a comparison table and return the regressed measurements."""
+    regressions = []
+    print(f"{'measurement':<40}{'ms':>10}{'baseline':>10}{'change':>10}")
+    for name, value in results.items():
+        old = baseline.get(name)
+        if value is None:
+            print(f"{name:<40}{'skipped':>10}")
+            continue
+        line = f"{name:<40}{value * 1000:>10.1f}"
+        if old:
+            change = value / old - 1
+            line += f"{old * 1000:>10.1f}{change:>+10.0%}"
+            if change > tolerance and value - old > MIN_REGRESSION:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2,
+        help="Allowed relative slowdown before failing, defaults to 0.2",
+    )
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="Create the window without a display using EGL",
+    )
+    args = parser.parse_args()
+
+    # Arcade can't create its shadow window without a display
+    os.environ.setdefault("PYGLET_SHADOW_WINDOW", "0")
+    if args.headless:
+        os.environ["PYGLET_HEADLESS"] = "1"
+
+    results: dict[str, Optional[float]] = {}
+    for module in MODULES:
+        for cold in (True, False):
+            name = f"import {module} ({'cold' if cold else 'warm'})"
+            results[name] = measure_import(module, cold, args.repeat)
+    results.update(
+        {f"phase {name}": value
+         for name, value in measure_phases(args.repeat).items()}
+    )
+
+    baseline: dict[str, Any] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("python") != platform.python_version():
+            print(
+                f"Baseline was recorded with Python {baseline.get('python')}, "
+                "results may not be comparable."
+            )
+    regressions = compare(results, baseline.get("results", {}), args.tolerance)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }, indent=2))
+        print(f"Saved baseline to {args.baseline}")
+    elif regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
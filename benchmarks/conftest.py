@@ -0,0 +1,88 @@
+"""
+Configuration of the pytest based benchmarks (`bench_*.py`, run them by
+passing the file to pytest explicitly).
+
+If pytest-benchmark is installed its `benchmark` fixture is used. Otherwise
+a minimal replacement with the same calling convention times the benchmarks
+and a summary is printed at the end of the session.
+"""
+
+import pyglet
+
+pyglet.options["shadow_window"] = False
+
+import statistics  # noqa: E402
+import time  # noqa: E402
+from typing import Any, Callable, Optional  # noqa: E402
+
+import pytest  # noqa: E402
+
+# Frame budget used to report how many sprites fit into a frame
+FRAME_TIME = 1 / 60
+
+
+class FallbackBenchmark:
+    """
+    Stand-in for the `benchmark` fixture of pytest-benchmark. Calls the
+    function at least `min_rounds` times and until `min_time` seconds have
+    passed, after one warmup call.
+    """
+    def __init__(
+        self,
+        name: str,
+        min_rounds: int = 3,
+        max_rounds: int = 1000,
+        min_time: float = 0.5,
+    ) -> None:
+        self.name = name
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self.min_time = min_time
+        self.extra_info: dict[str, Any] = {}
+        self.times: list[float] = []
+
+    def __call__(self, func: Callable[..., Any], *args: Any,
+                 **kwargs: Any) -> Any:
+        result = func(*args, **kwargs)
+        deadline = time.perf_counter() + self.min_time
+        while len(self.times) < self.min_rounds or (
+            len(self.times) < self.max_rounds
+            and time.perf_counter() < deadline
+        ):
+            start = time.perf_counter()
+            func(*args, **kwargs)
+            self.times.append(time.perf_counter() - start)
+        _RESULTS.append(self)
+        return result
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.times)
+
+
+_RESULTS: list[FallbackBenchmark] = []
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    @pytest.fixture
+    def benchmark(request: pytest.FixtureRequest) -> FallbackBenchmark:
+        return FallbackBenchmark(request.node.name)
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if not _RESULTS:
+        return
+    write = terminalreporter.write_line
+    terminalreporter.section("benchmarks")
+    write(
+        f"{'benchmark':<52}{'rounds':>7}{'ms/frame':>11}"
+        f"{'sprites/frame @60fps':>22}"
+    )
+    for result in _RESULTS:
+        line = f"{result.name:<52}{len(result.times):>7}"
+        line += f"{result.mean * 1000:>11.3f}"
+        sprites: Optional[int] = result.extra_info.get("sprites")
+        if sprites:
+            line += f"{int(sprites * FRAME_TIME / result.mean):>22,}"
+        write(line)
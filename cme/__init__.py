@@ -1,8 +1,15 @@
 """
 The Chilly Milly Engine Python Game Library.
+
+Subpackages and the arcade exports below are imported on first access, so
+tools and worker processes that e.g. only need saves don't pay for importing
+arcade.
 """
 
+import importlib
 import sys
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
 
 if sys.version_info[0] < 3 or (
     sys.version_info[0] == 3 and sys.version_info[1] < 7
@@ -10,13 +17,8 @@ if sys.version_info[0] < 3 or (
     sys.exit("Chilly Milly Engine requires Python 3.7 or above.")
 
 
-# Check for arcade-accelerate
-ACCELERATED = False
-try:
-    import arcade_accelerate  # noqa
-    ACCELERATED = True
-except ModuleNotFoundError:
-    pass
+# Check for arcade-accelerate without importing it
+ACCELERATED = find_spec("arcade_accelerate") is not None
 
 
 def init_cme(
@@ -25,13 +27,75 @@ def init_cme(
     from . import config
     config.app_name = app_name
 
-# Exports
-from arcade import (check_for_collision, check_for_collision_with_list,  # noqa
-                    check_for_collision_with_lists, csscolor, disable_timings,
-                    enable_timings, exit, get_display_size, get_fps,
-                    get_window, gl, run, tilemap, types)
+    # Just in case someone wants to package their game
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+
+if TYPE_CHECKING:
+    from arcade import (check_for_collision, check_for_collision_with_list,
+                        check_for_collision_with_lists, csscolor,
+                        disable_timings, enable_timings, exit,
+                        get_display_size, get_fps, get_window, gl, run,
+                        tilemap, types)
+
+    from . import color, key
+
+# Exports, imported from arcade on first access
+_ARCADE_EXPORTS = {
+    "check_for_collision",
+    "check_for_collision_with_list",
+    "check_for_collision_with_lists",
+    "csscolor",
+    "disable_timings",
+    "enable_timings",
+    "exit",
+    "get_display_size",
+    "get_fps",
+    "get_window",
+    "gl",
+    "run",
+    "tilemap",
+    "types",
+}
+_SUBPACKAGES = {
+    "camera",
+    "color",
+    "concurrency",
+    "config",
+    "enums",
+    "font",
+    "gui",
+    "key",
+    "localization",
+    "logger",
+    "pathfinding",
+    "resource_",
+    "shapes",
+    "sound",
+    "sprite",
+    "text",
+    "texture",
+    "utils",
+    "version",
+    "view",
+    "window",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _ARCADE_EXPORTS:
+        value = getattr(importlib.import_module("arcade"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_ARCADE_EXPORTS, *_SUBPACKAGES])
 
-from . import color, key  # noqa
 
 __all__ = [
     "check_for_collision",
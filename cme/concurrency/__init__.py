@@ -2,15 +2,66 @@
 Functionality for concurrent code execution utilizing asyncronous programming,
 threads and multiprocessing.
 """
-from .multiprocesses import setup_worker_process, start_worker_process
-from .schedule import schedule_interval, schedule_once, unschedule
-from .threads import start_helper_thread
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .multiprocesses import setup_worker_process, start_worker_process
+    from .schedule import schedule_interval, schedule_once, unschedule
+    from .scripts import (Script, ScriptEvent, ScriptRunner, Tween, WaitEvent,
+                          WaitFrames, WaitSeconds, WaitTween)
+    from .threads import start_helper_thread
+
+# Exports are imported on first access, as `schedule` imports arcade and
+# worker processes shouldn't pay for it
+_EXPORTS = {
+    "setup_worker_process": "multiprocesses",
+    "start_worker_process": "multiprocesses",
+    "schedule_interval": "schedule",
+    "schedule_once": "schedule",
+    "unschedule": "schedule",
+    "Script": "scripts",
+    "ScriptEvent": "scripts",
+    "ScriptRunner": "scripts",
+    "Tween": "scripts",
+    "WaitEvent": "scripts",
+    "WaitFrames": "scripts",
+    "WaitSeconds": "scripts",
+    "WaitTween": "scripts",
+    "start_helper_thread": "threads",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "schedule_interval",
     "schedule_once",
+    "Script",
+    "ScriptEvent",
+    "ScriptRunner",
     "setup_worker_process",
     "start_helper_thread",
     "start_worker_process",
+    "Tween",
     "unschedule",
+    "WaitEvent",
+    "WaitFrames",
+    "WaitSeconds",
+    "WaitTween",
 ]
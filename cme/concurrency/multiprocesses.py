@@ -3,13 +3,12 @@ Multiprocessing solution for concurrency problems. Allows the program to make
 use of multiple CPUs.
 """
 
+from __future__ import annotations
 
 import multiprocessing
+from pathlib import Path
 from typing import Any, Callable, Iterable, Mapping, Optional
 
-# Just in case someone wants to package their game
-multiprocessing.freeze_support()
-
 
 def start_worker_process(
     *,
@@ -27,21 +26,20 @@ def start_worker_process(
     finished. Be aware that you cannot change things over different processes.
     For that, use the multiprocessing.Queue object returned by this function,
     as it contains the target's return value.
+    If tracing is enabled (see `cme.logger.tracing`) the process is traced as
+    a span, and its events are exported with the ones of this process.
     """
-    def wrapper(
-        queue: multiprocessing.Queue[Any],
-        *args: tuple[Any],
-        **kwargs: Mapping[Any, Any],
-    ) -> None:
-        output = target(*args, **kwargs)
-        queue.put(output)
-        if callback:
-            callback()
+    from ..logger import tracing
+    span_name = name or str(getattr(target, "__qualname__", "worker process"))
     queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
     process = multiprocessing.Process(
-        target=wrapper,
+        target=_run_worker,
         name=name,
-        args=(queue, *args),
+        # Passed explicitly, spawned processes don't inherit the tracing state
+        args=(
+            queue, target, callback, span_name, tracing.trace_directory(),
+            *args,
+        ),
         kwargs=kwargs,
         daemon=daemon,
     )
@@ -49,6 +47,26 @@ def start_worker_process(
     return queue
 
 
+def _run_worker(
+    queue: multiprocessing.Queue[Any],
+    target: Callable[..., Any],
+    callback: Optional[Callable[[], None]],
+    span_name: str,
+    trace_directory: Optional[Path],
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    from ..logger import tracing
+    if trace_directory is not None:
+        tracing.enable_tracing(trace_directory)
+    with tracing.span(span_name, "process"):
+        output = target(*args, **kwargs)
+    tracing.dump_process_trace()
+    queue.put(output)
+    if callback:
+        callback()
+
+
 def setup_worker_process(
     *,
     target: Callable[[], Any],
@@ -0,0 +1,352 @@
+"""
+Generator based scripts for sequenced gameplay like cutscenes or AI routines.
+Instead of chaining `schedule_once` and `Animator` callbacks, a script is a
+single generator function yielding what it wants to wait for:
+
+```python
+def cutscene(npc, door_opened):
+    npc.say("Hello")
+    yield WaitSeconds(2)
+    yield WaitTween(Animator(npc, 1, center_x=200))
+    yield WaitEvent(door_opened)
+    npc.say("Bye")
+
+
+runner = ScriptRunner()
+runner.start(cutscene(npc, door_opened))
+
+# Somewhere in on_update()
+runner.update(delta_time)
+```
+
+All scripts of a runner are resumed from its `update()` method, so thousands
+of concurrent scripts only cost a single loop per frame. Scripts are not
+thread safe and should only be touched from the main thread.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Any, Generator, Optional, Protocol
+
+from .. import logger
+
+ScriptGenerator = Generator[Any, None, None]
+
+
+class Tween(Protocol):
+    """Anything that can be waited for using `WaitTween`, e.g. `Animator`."""
+    @property
+    def finished(self) -> bool:
+        ...
+
+    def update(self, delta_time: float) -> None:
+        ...
+
+
+class WaitSeconds:
+    """Resume the script after `seconds` of game time have passed."""
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+
+class WaitFrames:
+    """Resume the script after `frames` calls to `ScriptRunner.update()`."""
+    __slots__ = ("frames",)
+
+    def __init__(self, frames: int) -> None:
+        self.frames = frames
+
+
+class WaitTween:
+    """
+    Resume the script as soon as `tween.finished` is True. If `drive` is True
+    the runner also calls `tween.update(delta_time)` once every frame, even
+    if multiple scripts wait for it, so the tween doesn't have to be updated
+    elsewhere.
+    """
+    __slots__ = ("tween", "drive")
+
+    def __init__(self, tween: Tween, drive: bool = True) -> None:
+        self.tween = tween
+        self.drive = drive
+
+
+class WaitEvent:
+    """Resume the script once `event` has been set."""
+    __slots__ = ("event",)
+
+    def __init__(self, event: ScriptEvent) -> None:
+        self.event = event
+
+
+class ScriptEvent:
+    """
+    A flag scripts can wait for. Setting it resumes all waiting scripts in
+    the next frame of their runner.
+    """
+    def __init__(self) -> None:
+        self._is_set = False
+        self._waiters: list[tuple[ScriptRunner, Script]] = []
+
+    def is_set(self) -> bool:
+        return self._is_set
+
+    def set(self) -> None:
+        self._is_set = True
+        waiters, self._waiters = self._waiters, []
+        for runner, script in waiters:
+            script._event = None
+            runner._ready.append(script)
+
+    def clear(self) -> None:
+        self._is_set = False
+
+
+class Script:
+    """Handle to a running script, returned by `ScriptRunner.start()`."""
+    __slots__ = ("_gen", "_runner", "_finished", "_event", "name")
+    name: str
+
+    def __init__(
+        self,
+        gen: ScriptGenerator,
+        runner: ScriptRunner,
+        name: Optional[str] = None,
+    ) -> None:
+        self._gen = gen
+        self._runner = runner
+        self._finished = False
+        # The event the script is waiting for, if any
+        self._event: Optional[ScriptEvent] = None
+        self.name = name or str(getattr(gen, "__name__", gen))
+
+    @property
+    def finished(self) -> bool:
+        """Whether the script has returned, failed or was cancelled."""
+        return self._finished
+
+    def cancel(self) -> None:
+        """
+        Stop the script. The generator is closed, so `finally` blocks inside
+        the script still run. A script cancelling itself is closed as soon as
+        it yields.
+        """
+        if self._finished:
+            return
+        self._finished = True
+        self._runner._remove(self)
+
+
+class ScriptRunner:
+    """
+    Resumes scripts depending on what they yielded last:
+
+    - `None`: Resume next frame
+    - `int` or `float` / `WaitSeconds`: Resume after that many seconds
+    - `WaitFrames`: Resume after that many frames
+    - `WaitTween` or any `Tween` (e.g. `Animator`): Resume when finished
+    - `WaitEvent` or a `ScriptEvent`: Resume when the event is set
+
+    Newly started scripts run until their first yield on the next `update()`.
+    """
+    def __init__(self) -> None:
+        self._time = 0.0
+        self._frame = 0
+        # Scripts that have not finished yet, in the order they were started
+        self._scripts: dict[Script, None] = {}
+        # The script running right now and the ones due in this update
+        self._current: Optional[Script] = None
+        self._resuming: list[Script] = []
+        self._ready: list[Script] = []
+        self._timers: list[tuple[float, int, Script]] = []
+        self._frame_timers: list[tuple[int, int, Script]] = []
+        self._tweens: list[tuple[Tween, bool, Script]] = []
+        # Tie breaker so the heaps never have to compare Script objects
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        """Amount of scripts that have not finished yet."""
+        return len(self._scripts)
+
+    @property
+    def time(self) -> float:
+        """Seconds of game time this runner has been updated for."""
+        return self._time
+
+    def start(
+        self,
+        gen: ScriptGenerator,
+        name: Optional[str] = None,
+    ) -> Script:
+        """
+        Start a script from a generator object (not the generator function).
+        """
+        script = Script(gen, self, name)
+        self._scripts[script] = None
+        self._ready.append(script)
+        return script
+
+    def stop_all(self) -> None:
+        """
+        Cancel all scripts of this runner, including the one calling this.
+        """
+        scripts = list(self._scripts)
+        self._scripts.clear()
+        self._ready.clear()
+        self._resuming.clear()
+        self._timers.clear()
+        self._frame_timers.clear()
+        self._tweens.clear()
+        events = {script._event for script in scripts if script._event}
+        for event in events:
+            event._waiters = [
+                waiter for waiter in event._waiters if waiter[0] is not self
+            ]
+        for script in scripts:
+            script._finished = True
+            script._event = None
+            if script is not self._current:
+                script._gen.close()
+
+    def _remove(self, script: Script) -> None:
+        """Forget a cancelled script and close it unless it's running."""
+        self._scripts.pop(script, None)
+        if script._event is not None:
+            script._event._waiters.remove((self, script))
+            script._event = None
+        self._remove_timer(self._timers, script)
+        self._remove_timer(self._frame_timers, script)
+        if script in self._ready:
+            self._ready.remove(script)
+        self._tweens = [
+            entry for entry in self._tweens if entry[2] is not script
+        ]
+        if script is not self._current:
+            script._gen.close()
+
+    @staticmethod
+    def _remove_timer(
+        heap: list[tuple[Any, int, Script]],
+        script: Script,
+    ) -> None:
+        for index, entry in enumerate(heap):
+            if entry[2] is script:
+                heap[index] = heap[-1]
+                heap.pop()
+                heapq.heapify(heap)
+                return
+
+    def update(self, delta_time: float) -> None:
+        """Advance the clock and resume all scripts that are due."""
+        self._time += delta_time
+        self._frame += 1
+
+        ready, self._ready = self._ready, []
+        self._resuming = ready
+
+        timers = self._timers
+        while timers and timers[0][0] <= self._time:
+            ready.append(heapq.heappop(timers)[2])
+
+        frame_timers = self._frame_timers
+        while frame_timers and frame_timers[0][0] <= self._frame:
+            ready.append(heapq.heappop(frame_timers)[2])
+
+        if self._tweens:
+            # Tweens waited for by multiple scripts are updated once
+            driven = {
+                id(tween): tween for tween, drive, script in self._tweens
+                if drive and not script._finished
+            }
+            for tween in driven.values():
+                if not tween.finished:
+                    tween.update(delta_time)
+            waiting = []
+            for entry in self._tweens:
+                tween, _, script = entry
+                if script._finished:
+                    continue
+                if tween.finished:
+                    ready.append(script)
+                else:
+                    waiting.append(entry)
+            self._tweens = waiting
+
+        for script in ready:
+            if not script._finished:
+                self._step(script)
+        self._resuming = []
+
+    def _step(self, script: Script) -> None:
+        self._current = script
+        try:
+            instruction = next(script._gen)
+        except StopIteration:
+            self._finish(script)
+            return
+        except Exception:
+            logger.error(
+                f"Script `{script.name}` raised an exception and was "
+                "stopped.",
+                exc_info=True,
+            )
+            self._finish(script)
+            return
+        finally:
+            self._current = None
+        if script._finished:
+            # Cancelled itself, it couldn't be closed while running
+            script._gen.close()
+            return
+        self._wait(script, instruction)
+
+    def _finish(self, script: Script) -> None:
+        script._finished = True
+        self._scripts.pop(script, None)
+
+    def _wait(self, script: Script, instruction: Any) -> None:
+        if instruction is None:
+            self._ready.append(script)
+        elif (
+            isinstance(instruction, (int, float))
+            and not isinstance(instruction, bool)
+        ):
+            heapq.heappush(self._timers, (
+                self._time + instruction, next(self._counter), script
+            ))
+        elif isinstance(instruction, WaitSeconds):
+            heapq.heappush(self._timers, (
+                self._time + instruction.seconds, next(self._counter), script
+            ))
+        elif isinstance(instruction, WaitFrames):
+            heapq.heappush(self._frame_timers, (
+                self._frame + instruction.frames, next(self._counter), script
+            ))
+        elif isinstance(instruction, WaitTween):
+            self._tweens.append(
+                (instruction.tween, instruction.drive, script)
+            )
+        elif isinstance(instruction, (WaitEvent, ScriptEvent)):
+            event = (
+                instruction.event if isinstance(instruction, WaitEvent)
+                else instruction
+            )
+            if event.is_set():
+                self._ready.append(script)
+            else:
+                script._event = event
+                event._waiters.append((self, script))
+        elif hasattr(instruction, "finished") and hasattr(
+            instruction, "update"
+        ):
+            self._tweens.append((instruction, True, script))
+        else:
+            script.cancel()
+            logger.error(
+                f"Script `{script.name}` yielded "
+                f"unsupported instruction `{instruction!r}` and was stopped."
+            )
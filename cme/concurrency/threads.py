@@ -8,7 +8,7 @@ from typing import Any, Callable, Iterable, Mapping, Optional
 
 def start_helper_thread(
     *,
-    target: Callable[[Any], Any],
+    target: Callable[..., Any],
     name: Optional[str] = None,
     args: Iterable[Any] = (),
     kwargs: Optional[Mapping[str, Any]] = None,
@@ -22,9 +22,15 @@ def start_helper_thread(
     You can specify a `callback` function to get notified when the thread has
     finished. The callback should take one argument, which is the return value
     of the target thread.
+    The thread is traced as a span if tracing is enabled, see
+    `cme.logger.tracing`.
     """
+    span_name = name or str(getattr(target, "__qualname__", "helper thread"))
+
     def wrapper(*args: tuple[Any], **kwargs: Mapping[Any, Any]) -> None:
-        output = target(*args, **kwargs)
+        from ..logger import tracing
+        with tracing.span(span_name, "thread"):
+            output = target(*args, **kwargs)
         if callback:
             callback(output)
 
@@ -1,10 +1,28 @@
 """
-Exports all font related functions from the arcade library.
+Provides font loading, text measurement based on cached font metrics and
+pre-rasterized glyph atlases.
 """
 
 
-from arcade import load_font
+from .atlas import (DEFAULT_CHARACTERS, Glyph, GlyphAtlas, clear_glyph_atlases,
+                    get_glyph_atlas)
+from .font import load_font
+from .metrics import (FONT_SIZE_CACHE_SIZE, REFERENCE_SIZE, FontMetrics,
+                      clear_font_metrics, get_font_metrics, measure_text_exact,
+                      optimal_font_size)
 
 __all__ = [
+    "clear_font_metrics",
+    "clear_glyph_atlases",
+    "DEFAULT_CHARACTERS",
+    "FONT_SIZE_CACHE_SIZE",
+    "FontMetrics",
+    "get_font_metrics",
+    "get_glyph_atlas",
+    "Glyph",
+    "GlyphAtlas",
     "load_font",
+    "measure_text_exact",
+    "optimal_font_size",
+    "REFERENCE_SIZE",
 ]
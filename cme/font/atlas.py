@@ -0,0 +1,139 @@
+"""
+Pre-rasterized glyphs of a font at a fixed size, for `cme.text.BitmapText`.
+
+Every glyph is rasterized once into a white arcade Texture, which arcade
+packs into the texture atlas of the SpriteList drawing it. Colors are applied
+by tinting the sprites.
+
+Rasterizing glyphs requires an OpenGL context, e.g. an open window.
+"""
+
+from __future__ import annotations
+
+import string
+
+import arcade
+import pyglet
+from arcade.hitbox import algo_bounding_box
+from PIL import Image
+
+# Characters rasterized up front, others are rasterized on first use
+DEFAULT_CHARACTERS = (
+    string.digits + string.ascii_letters + string.punctuation + " "
+)
+
+
+class Glyph:
+    """Texture and placement of a single rasterized character."""
+    __slots__ = ("texture", "advance", "center_x", "center_y")
+
+    def __init__(
+        self,
+        texture: arcade.Texture,
+        advance: float,
+        center_x: float,
+        center_y: float,
+    ) -> None:
+        self.texture = texture
+        self.advance = advance
+        # Center of the texture relative to the pen position on the baseline
+        self.center_x = center_x
+        self.center_y = center_y
+
+
+class GlyphAtlas:
+    """
+    Glyphs of a font at a fixed size. Get instances with
+    `get_glyph_atlas()`, so every font and size is rasterized only once.
+    """
+    def __init__(
+        self,
+        font_name: str,
+        font_size: float,
+        bold: bool = False,
+        italic: bool = False,
+        characters: str = DEFAULT_CHARACTERS,
+    ) -> None:
+        self.font_name = font_name
+        self.font_size = font_size
+        self.bold = bold
+        self.italic = italic
+        self._font = pyglet.font.load(
+            font_name, font_size, bold=bold, italic=italic
+        )
+        self.ascent: float = self._font.ascent
+        self.descent: float = self._font.descent
+        self._glyphs: dict[str, Glyph] = {}
+        for char in characters:
+            self.glyph(char)
+
+    @property
+    def line_height(self) -> float:
+        return self.ascent - self.descent
+
+    def glyph(self, char: str) -> Glyph:
+        """The glyph of a character, rasterized on first use."""
+        try:
+            return self._glyphs[char]
+        except KeyError:
+            glyph = self._glyphs[char] = self._rasterize(char)
+            return glyph
+
+    def text_width(self, text: str) -> float:
+        return sum(self.glyph(char).advance for char in text)
+
+    def _rasterize(self, char: str) -> Glyph:
+        font_glyph = self._font.get_glyphs(char)[0]
+        left, bottom, right, top = font_glyph.vertices
+        width, height = font_glyph.width, font_glyph.height
+        name = (
+            f"cme-glyph-{_generation}-{self.font_name}-{self.font_size}-"
+            f"{self.bold}-{self.italic}-{ord(char)}"
+        )
+        if width and height:
+            data = font_glyph.get_image_data()
+            rgba = Image.frombytes(
+                "RGBA", (width, height), data.get_data("RGBA", width * 4)
+            ).transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+            # Font renderers differ in the color they use, only keep coverage
+            image = Image.new("RGBA", (width, height), (255, 255, 255, 0))
+            image.putalpha(rgba.getchannel("A"))
+        else:  # Whitespace
+            image = Image.new("RGBA", (1, 1), (255, 255, 255, 0))
+        texture = arcade.Texture(
+            image, hit_box_algorithm=algo_bounding_box, hash=name
+        )
+        return Glyph(
+            texture,
+            float(font_glyph.advance),
+            (left + right) / 2,
+            (bottom + top) / 2,
+        )
+
+
+_ATLASES: dict[tuple[str, float, bool, bool], GlyphAtlas] = {}
+# Part of the texture hashes, so glyphs of reloaded fonts aren't mistaken
+# for the old ones already in a texture atlas
+_generation = 0
+
+
+def get_glyph_atlas(
+    font_name: str,
+    font_size: float,
+    bold: bool = False,
+    italic: bool = False,
+) -> GlyphAtlas:
+    """Returns the cached glyphs of a font, rasterizing it on first use."""
+    key = (font_name, font_size, bold, italic)
+    try:
+        return _ATLASES[key]
+    except KeyError:
+        atlas = _ATLASES[key] = GlyphAtlas(font_name, font_size, bold, italic)
+        return atlas
+
+
+def clear_glyph_atlases() -> None:
+    """Forget all cached glyph atlases, e.g. because a font was loaded."""
+    global _generation
+    _generation += 1
+    _ATLASES.clear()
@@ -0,0 +1,22 @@
+"""
+Font loading.
+"""
+
+from pathlib import Path
+
+import arcade
+
+from .atlas import clear_glyph_atlases
+from .metrics import clear_font_metrics
+
+
+def load_font(path: str | Path) -> None:
+    """
+    Load the fonts in a file (usually .ttf) into the global font registry,
+    see `arcade.load_font()`. Cached font metrics, optimal font sizes and
+    glyph atlases are cleared, as the file may provide a font with an already
+    measured name.
+    """
+    arcade.load_font(path)
+    clear_font_metrics()
+    clear_glyph_atlases()
@@ -0,0 +1,178 @@
+"""
+Text measurement without laying out pyglet Labels.
+
+Glyph advances and line metrics of a font are measured once at
+`REFERENCE_SIZE` and scaled linearly to other sizes. Fonts are hinted, so
+the real size of a text is off by a pixel or so per glyph. Use
+`measure_text_exact()` where exact values are needed, it measures the font at
+the requested size but still doesn't lay out a Label.
+
+Results of `optimal_font_size()` are memoized, so widgets relayouting with
+unchanged text and size (e.g. on every resize event) don't measure again.
+Fonts loaded using `cme.font.load_font()` clear all caches, as they may
+replace fonts of the same name.
+
+Measuring glyphs requires an OpenGL context, e.g. an open window.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+
+import pyglet
+
+# Big enough that rounding glyph advances to whole pixels doesn't matter
+REFERENCE_SIZE = 96
+# Amount of (text, font, box, ...) combinations to remember optimal sizes for
+FONT_SIZE_CACHE_SIZE = 2048
+
+
+class FontMetrics:
+    """
+    Cached glyph advances and line metrics of a font at `REFERENCE_SIZE`.
+    Get instances with `get_font_metrics()`.
+    """
+    def __init__(
+        self,
+        font_name: str,
+        bold: bool = False,
+        italic: bool = False,
+    ) -> None:
+        self.font_name = font_name
+        self.bold = bold
+        self.italic = italic
+        self._font = pyglet.font.load(
+            font_name, REFERENCE_SIZE, bold=bold, italic=italic
+        )
+        self.ascent: float = self._font.ascent
+        self.descent: float = self._font.descent
+        self._advances: dict[str, float] = {}
+
+    @property
+    def line_height(self) -> float:
+        """Height of a line at `REFERENCE_SIZE`."""
+        return self.ascent - self.descent
+
+    def advance(self, char: str) -> float:
+        """Advance of a character at `REFERENCE_SIZE`."""
+        try:
+            return self._advances[char]
+        except KeyError:
+            advance = self._advances[char] = float(
+                self._font.get_glyphs(char)[0].advance
+            )
+            return advance
+
+    def text_width(self, text: str, font_size: float) -> float:
+        """Width of a single line of text."""
+        advances = self._advances
+        width = 0.0
+        for char in text:
+            try:
+                width += advances[char]
+            except KeyError:
+                width += self.advance(char)
+        return width * font_size / REFERENCE_SIZE
+
+    def measure(
+        self,
+        text: str,
+        font_size: float,
+        multiline: bool = False,
+    ) -> tuple[float, float]:
+        """
+        Content width and height of `text` at `font_size`. Multiline text is
+        split at newlines, but not wrapped.
+        """
+        lines = text.split("\n") if multiline else [text]
+        width = max(self.text_width(line, font_size) for line in lines)
+        height = self.line_height * len(lines) * font_size / REFERENCE_SIZE
+        return width, height
+
+
+_METRICS: dict[tuple[str, bool, bool], FontMetrics] = {}
+
+
+def get_font_metrics(
+    font_name: str,
+    bold: bool = False,
+    italic: bool = False,
+) -> FontMetrics:
+    """Returns the cached metrics of a font, measuring it on first use."""
+    key = (font_name, bold, italic)
+    try:
+        return _METRICS[key]
+    except KeyError:
+        metrics = _METRICS[key] = FontMetrics(font_name, bold, italic)
+        return metrics
+
+
+def clear_font_metrics() -> None:
+    """
+    Forget all cached metrics and optimal font sizes, e.g. because a font
+    with a cached name has been loaded.
+    """
+    _METRICS.clear()
+    optimal_font_size.cache_clear()
+
+
+def measure_text_exact(
+    text: str,
+    font_name: str,
+    font_size: float,
+    multiline: bool = False,
+) -> tuple[float, float]:
+    """
+    Content width and height of `text` as a Label would lay it out, using the
+    glyphs of the font at exactly `font_size`.
+    """
+    font = pyglet.font.load(font_name, font_size)
+    lines = text.split("\n") if multiline else [text]
+    width = max(
+        sum(glyph.advance for glyph in font.get_glyphs(line))
+        for line in lines
+    )
+    return width, (font.ascent - font.descent) * len(lines)
+
+
+@functools.lru_cache(maxsize=FONT_SIZE_CACHE_SIZE)
+def optimal_font_size(
+    text: str,
+    font_name: str,
+    container_width: float,
+    container_height: float,
+    max_size: float = 512,
+    multiline: bool = False,
+    exact: bool = True,
+) -> float:
+    """
+    The biggest whole font size (or `max_size`) at which `text` fits into the
+    container. It is estimated from the cached font metrics. If `exact` is
+    True the text is then measured once at the estimated size (rasterizing
+    its glyphs, see `measure_text_exact()`). If hinting makes it too big, the
+    size is scaled down by the measured overflow, so the result fits but may
+    be a size smaller than the biggest fitting one.
+    """
+    metrics = get_font_metrics(font_name)
+    width, height = metrics.measure(text, REFERENCE_SIZE, multiline)
+    limit = math.inf
+    if width > 0:
+        limit = container_width * REFERENCE_SIZE / width
+    if height > 0:
+        limit = min(limit, container_height * REFERENCE_SIZE / height)
+    if limit >= max_size:
+        size = max_size
+    else:
+        size = max(1.0, float(math.floor(limit)))
+    if not exact or size == 1:
+        return size
+
+    width, height = measure_text_exact(text, font_name, size, multiline)
+    if width <= container_width and height <= container_height:
+        return size
+    ratio = min(
+        container_width / width if width > 0 else math.inf,
+        container_height / height if height > 0 else math.inf,
+    )
+    return max(1.0, min(size - 1, float(math.floor(size * ratio))))
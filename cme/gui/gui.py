@@ -12,6 +12,7 @@ from arcade.gui.surface import Surface
 from arcade.math import get_distance
 
 from cme import csscolor, key, shapes
+from cme.logger.instrumentation import instrumented
 from cme.texture import Texture
 from cme.utils import get_optimal_font_size, point_in_rect
 
@@ -209,6 +210,7 @@ class UIBlinkingLabel(gui.UILabel):
     def do_fade(self, value: bool) -> None:
         self._do_fade = value
 
+    @instrumented()
     def on_update(self, delta_time: float) -> None:
         if self.blink_speed <= 0:
             return
@@ -315,6 +317,7 @@ class UIToolTipButton(gui.UITextureButton):
         """
         return self._tooltip_label
 
+    @instrumented()
     def do_render(self, surface: Surface) -> None:
         super().do_render(surface)
         if self.get_current_state() == "hover":
@@ -733,6 +736,7 @@ class UIFineColoredSlider(gui.UIWidget):
                 self.width - 2 * self.cursor_radius
             )
 
+    @instrumented()
     def do_render(self, surface: Surface) -> None:
         self.prepare_render(surface)  # type: ignore
 
@@ -1047,5 +1051,6 @@ class UIEmptySpace(gui.UIWidget):
             height=height,
         )
 
+    @instrumented()
     def do_render(self, surface: Surface) -> None:
         self.prepare_render(surface)  # type: ignore[no-untyped-call]
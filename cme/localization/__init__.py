@@ -8,11 +8,41 @@ langcode = <string in lang_COUNTRY format e.g. 'en_US'>
 
 [strings]
 ```
+
+LanguageStore loads a language and the default language once and falls back
+to the default language for missing keys, nested tables become dotted keys.
+Language files can be compiled into memory mapped binary catalogs loading
+faster, see `catalog`. Strings
+with fields and plurals are formatted using compiled templates, see
+`formatting`. LocalizationService switches languages in the background and
+updates bound widgets.
 """
 
+from .catalog import (Catalog, catalog_path, compile_catalog, compile_catalogs,
+                      load_catalog, load_strings)
+from .formatting import (PLURAL_RULES, Formatter, Template, compile_template,
+                         get_plural_rule, plural_category)
 from .language_handler import DEFAULT_LANGUAGE, LangDict
+from .service import LocalizationService, SwitchListener
+from .store import LanguageStore, flatten_strings
 
 __all__ = [
+    "Catalog",
+    "catalog_path",
+    "compile_catalog",
+    "compile_catalogs",
+    "compile_template",
     "DEFAULT_LANGUAGE",
+    "flatten_strings",
+    "Formatter",
+    "get_plural_rule",
     "LangDict",
+    "LanguageStore",
+    "load_catalog",
+    "load_strings",
+    "LocalizationService",
+    "PLURAL_RULES",
+    "plural_category",
+    "SwitchListener",
+    "Template",
 ]
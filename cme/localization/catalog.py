@@ -0,0 +1,272 @@
+"""
+Compiles language files into binary catalogs, which load without parsing
+TOML.
+
+A catalog `<langcode>.cmecat` is written next to `<langcode>.toml`. It holds
+the flattened strings (see `flatten_strings()`) in a string table, indexed by
+a hash table. Catalogs are memory mapped and strings are only decoded when
+they're looked up. Catalogs whose language file changed since compiling are
+stale and ignored, `load_strings()` then falls back to the language file.
+
+Compile all language files of a directory with:
+
+    python -m cme.localization.catalog <languages path>
+
+Layout (little endian):
+
+    header   magic, version, entry count, slot count, source mtime (ns),
+             source size, meta offset and length
+    slots    one u32 per slot, 0 if empty, otherwise entry index + 1
+    entries  key offset and length, value offset and length (u32 each)
+    strings  utf-8 keys, values and the json encoded meta table
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib  # type: ignore[no-redef]
+
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Mapping, Optional
+
+from .. import logger
+from ..resource_.writer import atomic_write
+
+CATALOG_SUFFIX = ".cmecat"
+MAGIC = b"CMEC"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHxxIIQQII")
+_SLOT = struct.Struct("<I")
+_ENTRY = struct.Struct("<IIII")
+
+
+def _hash(key: bytes) -> int:
+    # Stable between runs, unlike hash()
+    return int.from_bytes(
+        hashlib.blake2b(key, digest_size=8).digest(), "little"
+    )
+
+
+def _slot_count(count: int) -> int:
+    slots = 8
+    while slots < count * 2:  # At most half full, keeps probing short
+        slots *= 2
+    return slots
+
+
+def catalog_path(toml_path: Path | str) -> Path:
+    """Path of the catalog of a language file."""
+    return Path(toml_path).with_suffix(CATALOG_SUFFIX)
+
+
+def compile_catalog(
+    toml_path: Path | str,
+    output: Optional[Path | str] = None,
+) -> Path:
+    """
+    Compile a language file into a catalog, written to `output` (defaults to
+    `catalog_path(toml_path)`) atomically. Returns the path of the catalog.
+    """
+    from .store import flatten_strings
+
+    toml_path = Path(toml_path)
+    output = catalog_path(toml_path) if output is None else Path(output)
+    stat = toml_path.stat()
+    with open(toml_path, mode="rb") as fp:
+        data = tomllib.load(fp)
+    strings = flatten_strings(data["strings"])
+
+    slot_count = _slot_count(len(strings))
+    mask = slot_count - 1
+    slots = [0] * slot_count
+    entries = bytearray()
+    table = bytearray()
+    for index, (key, value) in enumerate(strings.items()):
+        key_bytes = key.encode("utf-8")
+        value_bytes = value.encode("utf-8")
+        entries += _ENTRY.pack(
+            len(table), len(key_bytes),
+            len(table) + len(key_bytes), len(value_bytes),
+        )
+        table += key_bytes + value_bytes
+        slot = _hash(key_bytes) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+    meta = json.dumps(data.get("meta", {})).encode("utf-8")
+    meta_offset = len(table)
+    table += meta
+
+    header = _HEADER.pack(
+        MAGIC, VERSION, len(strings), slot_count,
+        stat.st_mtime_ns, stat.st_size, meta_offset, len(meta),
+    )
+
+    def write(fp: BinaryIO) -> None:
+        fp.write(header)
+        fp.write(struct.pack(f"<{slot_count}I", *slots))
+        fp.write(entries)
+        fp.write(table)
+
+    atomic_write(output, write)
+    return output
+
+
+def compile_catalogs(langs_path: Path | str) -> list[Path]:
+    """Compile all language files in a directory."""
+    return [
+        compile_catalog(file)
+        for file in sorted(Path(langs_path).iterdir())
+        if file.is_file() and file.suffix == ".toml"
+    ]
+
+
+class Catalog(Mapping[str, str]):
+    """
+    Read-only, memory mapped strings of a compiled catalog. Strings are
+    decoded on their first lookup and remembered afterwards.
+    """
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        with open(self.path, mode="rb") as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count: int
+        self._slot_count: int
+        self.source_mtime_ns: int
+        self.source_size: int
+        (
+            magic, version, self._count, self._slot_count,
+            self.source_mtime_ns, self.source_size,
+            meta_offset, meta_length,
+        ) = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} catalog")
+        self._entries_start = _HEADER.size + self._slot_count * _SLOT.size
+        self._table_start = self._entries_start + self._count * _ENTRY.size
+        meta_start = self._table_start + meta_offset
+        self.meta: dict[str, Any] = json.loads(
+            self._map[meta_start:meta_start + meta_length]
+        )
+        self._cache: dict[str, str] = {}
+
+    def is_stale(self, toml_path: Path | str) -> bool:
+        """Whether the language file changed since compiling the catalog."""
+        try:
+            stat = Path(toml_path).stat()
+        except FileNotFoundError:
+            return False  # Catalogs may be shipped without language files
+        return (stat.st_mtime_ns, stat.st_size) != (
+            self.source_mtime_ns, self.source_size
+        )
+
+    def _key(self, index: int) -> str:
+        key_offset, key_length, _, _ = _ENTRY.unpack_from(
+            self._map, self._entries_start + index * _ENTRY.size
+        )
+        start = self._table_start + key_offset
+        return self._map[start:start + key_length].decode("utf-8")
+
+    def _entry(self, index: int) -> tuple[str, str]:
+        key_offset, key_length, value_offset, value_length = (
+            _ENTRY.unpack_from(
+                self._map, self._entries_start + index * _ENTRY.size
+            )
+        )
+        start = self._table_start
+        return (
+            self._map[start + key_offset:start + key_offset + key_length]
+            .decode("utf-8"),
+            self._map[start + value_offset:start + value_offset + value_length]
+            .decode("utf-8"),
+        )
+
+    def _find(self, key: str) -> Optional[str]:
+        mask = self._slot_count - 1
+        slot = _hash(key.encode("utf-8")) & mask
+        while True:
+            (index,) = _SLOT.unpack_from(
+                self._map, _HEADER.size + slot * _SLOT.size
+            )
+            if not index:
+                return None
+            entry_key, value = self._entry(index - 1)
+            if entry_key == key:
+                return value
+            slot = (slot + 1) & mask
+
+    def __getitem__(self, key: str) -> str:
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._find(key)
+            if value is None:
+                raise KeyError(
+                    f"Language string `{key}` does not exist."
+                ) from None
+            self._cache[key] = value
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._key(index)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def to_dict(self) -> dict[str, str]:
+        """Decode all strings at once."""
+        return dict(self._entry(index) for index in range(self._count))
+
+    def close(self) -> None:
+        self._map.close()
+
+
+def load_catalog(toml_path: Path | str) -> Optional[Catalog]:
+    """
+    The catalog of a language file, or None if there is none or it is stale
+    or unreadable.
+    """
+    path = catalog_path(toml_path)
+    if not path.exists():
+        return None
+    try:
+        catalog = Catalog(path)
+    except (OSError, ValueError, struct.error):
+        logger.warning(f"Ignoring unreadable catalog {path}", exc_info=True)
+        return None
+    if catalog.is_stale(toml_path):
+        logger.info(f"Catalog {path} is stale, using {toml_path}")
+        catalog.close()
+        return None
+    return catalog
+
+
+def load_strings(toml_path: Path | str) -> Mapping[str, str]:
+    """
+    Flattened strings of a language file. That's its catalog if it has an up
+    to date one, which stays memory mapped until it's closed or garbage
+    collected. Otherwise the language file is parsed into a dict.
+    """
+    catalog = load_catalog(toml_path)
+    if catalog is not None:
+        return catalog
+    from .language_handler import LangDict
+    from .store import flatten_strings
+    return flatten_strings(LangDict.from_file(toml_path))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python -m cme.localization.catalog <languages path>")
+    for compiled in compile_catalogs(sys.argv[1]):
+        print(f"Compiled {compiled}")
@@ -0,0 +1,356 @@
+"""
+Compiled message templates with plural support for language strings.
+
+Templates use `str.format` style keyword fields, like `{name}`,
+`{name!r:spec}` or `{player.name}` (with `{{` and `}}` for literal braces),
+and plural selections in ICU style:
+
+```toml
+coins = "{n, plural, =0 {No coins} one {# coin} other {# coins}}"
+```
+
+A selection picks the branch of the exact value (`=0`) or of the plural
+category of the value in the language, falling back to `other`. `#` inside a
+branch is replaced by the value. Strings are parsed once into a `Template`,
+which remembers its last result, so formatting with unchanged values every
+frame doesn't build any string.
+"""
+
+from __future__ import annotations
+
+from _string import formatter_field_name_split
+from typing import Any, Callable, Mapping, Optional, Union
+
+PluralRule = Callable[[float], str]
+
+
+def _one_if_1(n: float) -> str:
+    return "one" if n == 1 else "other"
+
+
+def _one_if_0_or_1(n: float) -> str:
+    return "one" if 0 <= n < 2 else "other"
+
+
+def _east_slavic(n: float) -> str:
+    if n != int(n):
+        return "other"
+    n = int(n)
+    if n % 10 == 1 and n % 100 != 11:
+        return "one"
+    if 2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14:
+        return "few"
+    return "many"
+
+
+def _polish(n: float) -> str:
+    if n != int(n):
+        return "other"
+    n = int(n)
+    if n == 1:
+        return "one"
+    if 2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14:
+        return "few"
+    return "many"
+
+
+def _czech(n: float) -> str:
+    if n == 1:
+        return "one"
+    if n in (2, 3, 4):
+        return "few"
+    return "other"
+
+
+def _other(n: float) -> str:
+    return "other"
+
+
+# Plural rules by language (the part of the langcode before `_`), after
+# CLDR. Languages not listed use the english rule.
+PLURAL_RULES: dict[str, PluralRule] = {
+    "be": _east_slavic,
+    "cs": _czech,
+    "fr": _one_if_0_or_1,
+    "ja": _other,
+    "ko": _other,
+    "pl": _polish,
+    "ru": _east_slavic,
+    "sk": _czech,
+    "th": _other,
+    "uk": _east_slavic,
+    "vi": _other,
+    "zh": _other,
+}
+
+
+def get_plural_rule(langcode: str) -> PluralRule:
+    return PLURAL_RULES.get(langcode.split("_")[0], _one_if_1)
+
+
+def plural_category(langcode: str, n: float) -> str:
+    """The CLDR plural category (e.g. `one` or `other`) of `n`."""
+    return get_plural_rule(langcode)(n)
+
+
+_CONVERSIONS: dict[str, Callable[[Any], str]] = {
+    "r": repr, "s": str, "a": ascii,
+}
+
+
+class _Field:
+    __slots__ = ("name", "path", "conversion", "spec")
+
+    def __init__(
+        self,
+        name: str,
+        path: list[tuple[bool, int | str]],
+        conversion: Optional[Callable[[Any], str]],
+        spec: str,
+    ) -> None:
+        self.name = name
+        # (is attribute, attribute name or index) of `.name` and `[index]`
+        self.path = path
+        self.conversion = conversion
+        self.spec = spec
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        value = values[self.name]
+        for is_attribute, key in self.path:
+            value = getattr(value, str(key)) if is_attribute else value[key]
+        if self.conversion is not None:
+            value = self.conversion(value)
+        return format(value, self.spec)
+
+
+class _Number:
+    """`#` inside a plural branch."""
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        return format(values[self.name])
+
+
+class _Plural:
+    __slots__ = ("name", "rule", "exact", "branches")
+
+    def __init__(
+        self,
+        name: str,
+        rule: PluralRule,
+        exact: dict[float, list[_Part]],
+        branches: dict[str, list[_Part]],
+    ) -> None:
+        if "other" not in branches:
+            raise ValueError(f"Plural of `{name}` is missing `other`")
+        self.name = name
+        self.rule = rule
+        self.exact = exact
+        self.branches = branches
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        n = values[self.name]
+        parts = self.exact.get(n)
+        if parts is None:
+            parts = self.branches.get(self.rule(n), self.branches["other"])
+        return _render(parts, values)
+
+
+_Part = Union[str, _Field, _Number, _Plural]
+
+
+def _render(parts: list[_Part], values: Mapping[str, Any]) -> str:
+    return "".join([
+        part if isinstance(part, str) else part.render(values)
+        for part in parts
+    ])
+
+
+class _Parser:
+    def __init__(self, text: str, rule: PluralRule) -> None:
+        self.text = text
+        self.rule = rule
+        self.pos = 0
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at {self.pos} in {self.text!r}")
+
+    def parse(self, plural: Optional[str] = None) -> list[_Part]:
+        """
+        Parse until the end of the text, or the `}` ending the branch of the
+        plural of `plural`.
+        """
+        text = self.text
+        parts: list[_Part] = []
+        literal: list[str] = []
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char == "{" and text.startswith("{{", self.pos):
+                literal.append("{")
+                self.pos += 2
+            elif char == "}" and plural is not None:
+                break
+            elif char == "}" and text.startswith("}}", self.pos):
+                literal.append("}")
+                self.pos += 2
+            elif char == "}":
+                raise self.error("Single `}`")
+            elif char == "{" or (char == "#" and plural is not None):
+                if literal:
+                    parts.append("".join(literal))
+                    literal.clear()
+                if char == "{":
+                    parts.append(self.parse_field())
+                elif plural is not None:
+                    parts.append(_Number(plural))
+                    self.pos += 1
+            else:
+                literal.append(char)
+                self.pos += 1
+        else:
+            if plural is not None:
+                raise self.error("Unclosed plural branch")
+        if literal:
+            parts.append("".join(literal))
+        return parts
+
+    def parse_field(self) -> _Part:
+        text = self.text
+        self.pos += 1  # {
+        end = self.pos
+        brackets = False
+        while end < len(text) and (brackets or text[end] not in "}:,!"):
+            if text[end] in "[]":
+                brackets = text[end] == "["
+            end += 1
+        if end == len(text):
+            raise self.error("Unclosed field")
+        field = text[self.pos:end].strip()
+        self.pos = end
+        if text[end] == ",":
+            return self.parse_plural(field)
+
+        first, rest = formatter_field_name_split(field)
+        if not isinstance(first, str) or not first:
+            raise self.error("Positional fields are not supported")
+        path = list(rest)
+        conversion = None
+        if text[end] == "!":
+            conversion = _CONVERSIONS.get(text[end + 1:end + 2])
+            end += 2
+            if conversion is None or end >= len(text) or (
+                text[end] not in "}:"
+            ):
+                raise self.error("Invalid conversion")
+        close = text.find("}", end)
+        if close == -1:
+            raise self.error("Unclosed field")
+        self.pos = close + 1
+        return _Field(first, path, conversion, text[end + 1:close])
+
+    def parse_plural(self, name: str) -> _Plural:
+        text = self.text
+        self.pos += 1  # ,
+        kind_end = text.find(",", self.pos)
+        if kind_end == -1 or text[self.pos:kind_end].strip() != "plural":
+            raise self.error(f"Expected `plural` for `{name}`")
+        self.pos = kind_end + 1
+        exact: dict[float, list[_Part]] = {}
+        branches: dict[str, list[_Part]] = {}
+        while True:
+            while self.pos < len(text) and text[self.pos].isspace():
+                self.pos += 1
+            if self.pos >= len(text):
+                raise self.error("Unclosed plural")
+            if text[self.pos] == "}":
+                self.pos += 1
+                return _Plural(name, self.rule, exact, branches)
+            start = self.pos
+            open_ = text.find("{", start)
+            if open_ == -1:
+                raise self.error("Expected plural branch")
+            selector = text[start:open_].strip()
+            self.pos = open_ + 1
+            parts = self.parse(plural=name)
+            self.pos += 1  # } of the branch
+            if selector.startswith("="):
+                exact[float(selector[1:])] = parts
+            else:
+                branches[selector] = parts
+
+
+class Template:
+    """
+    A language string parsed into literals, fields and plural selections.
+    Create instances with `compile_template()` or `Formatter.template()`.
+    """
+    __slots__ = ("text", "_parts", "_last_key", "_last_result")
+
+    def __init__(self, text: str, langcode: str) -> None:
+        self.text = text
+        self._parts = _Parser(text, get_plural_rule(langcode)).parse()
+        self._last_key: Optional[_MemoKey] = None
+        self._last_result = ""
+
+    def format(self, **values: Any) -> str:
+        """
+        Fill in the values. Returns the previous result again if the values
+        are equal to the previous ones and all of them are immutable scalars
+        (str, int, float, bool or None).
+        """
+        key = _memo_key(values)
+        if key is not None and key == self._last_key:
+            return self._last_result
+        result = _render(self._parts, values)
+        self._last_key = key
+        self._last_result = result
+        return result
+
+
+_MemoKey = tuple[tuple[str, type, Any], ...]
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _memo_key(values: dict[str, Any]) -> Optional[_MemoKey]:
+    # Includes the types, as e.g. 1 == 1.0 == True but they format differently
+    key = []
+    for name, value in values.items():
+        if type(value) not in _IMMUTABLE_TYPES:
+            return None  # Could be mutated in place, no snapshot is cheap
+        key.append((name, type(value), value))
+    return tuple(key)
+
+
+def compile_template(text: str, langcode: str) -> Template:
+    """Parse a language string of a language into a Template."""
+    return Template(text, langcode)
+
+
+class Formatter:
+    """
+    Formats the strings of a mapping like `LanguageStore` or `LangDict` of a
+    language. Templates are compiled on first use and cached by key.
+    """
+    def __init__(self, strings: Mapping[str, str], langcode: str) -> None:
+        self.strings = strings
+        self.langcode = langcode
+        self._templates: dict[str, Template] = {}
+
+    def template(self, key: str) -> Template:
+        try:
+            return self._templates[key]
+        except KeyError:
+            template = self._templates[key] = Template(
+                str(self.strings[key]), self.langcode
+            )
+            return template
+
+    def format(self, key: str, **values: Any) -> str:
+        return self.template(key).format(**values)
+
+    def clear(self) -> None:
+        """Forget all templates, e.g. because the strings changed."""
+        self._templates.clear()
@@ -43,7 +43,7 @@ class LangDict(dict):  # type: ignore[type-arg]
     def from_toml(cls, toml_str: str) -> "LangDict":
         """Create a LangDict instance from a toml string."""
         dict_ = tomllib.loads(toml_str)
-        obj = cls(tomllib.loads(toml_str)["strings"])
+        obj = cls(dict_["strings"])
         for key, value in dict_["meta"].items():
             setattr(obj, key, value)
         return obj
@@ -0,0 +1,150 @@
+"""
+Provides a service switching languages without blocking the mainloop.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+from .. import logger
+from ..concurrency.threads import start_helper_thread
+from .language_handler import DEFAULT_LANGUAGE
+from .store import LanguageStore
+
+if TYPE_CHECKING:
+    from ..text.layer import TextLayer
+
+SwitchListener = Callable[[LanguageStore], None]
+
+
+class LocalizationService:
+    """
+    Holds the active LanguageStore and keeps the texts of bound widgets (any
+    object with a `text` attribute, e.g. `Text`, `BitmapText` or `UILabel`)
+    in its language.
+
+    `switch()` loads a language on a helper thread. The new language becomes
+    active on the next call to `update()`, which should be called once per
+    frame, e.g. in `on_update()`. All bound widgets are then updated at once,
+    texts in one of `layers` are laid out only once in a deferred block.
+    """
+    def __init__(
+        self,
+        langcode: str,
+        langs_path: Optional[Path | str] = None,
+        default_langcode: str = DEFAULT_LANGUAGE,
+        layers: Iterable[TextLayer] = (),
+    ) -> None:
+        self.langs_path = langs_path
+        self.default_langcode = default_langcode
+        self.layers = list(layers)
+        self._store = self._load(langcode)
+        self._widgets: weakref.WeakKeyDictionary[
+            Any, tuple[str, dict[str, Any]]
+        ] = weakref.WeakKeyDictionary()
+        self._listeners: list[SwitchListener] = []
+        self._lock = threading.Lock()
+        self._pending: Optional[LanguageStore] = None
+        self._requested: Optional[str] = None
+
+    @property
+    def store(self) -> LanguageStore:
+        return self._store
+
+    @property
+    def langcode(self) -> str:
+        return self._store.langcode
+
+    @property
+    def loading(self) -> bool:
+        """Whether a switched to language hasn't become active yet."""
+        with self._lock:
+            return self._requested is not None
+
+    def _load(self, langcode: str) -> LanguageStore:
+        return LanguageStore(langcode, self.langs_path, self.default_langcode)
+
+    def resolve(self, key: str, **values: Any) -> str:
+        """The string of `key` in the active language, formatted if needed."""
+        if values:
+            return self._store.format(key, **values)
+        return self._store[key]
+
+    def bind(self, widget: Any, key: str, **values: Any) -> Any:
+        """
+        Show the string of `key` (formatted with `values`) on `widget` and
+        keep it updated. Widgets are referenced weakly. Returns the widget.
+        """
+        self._widgets[widget] = (key, values)
+        widget.text = self.resolve(key, **values)
+        return widget
+
+    def set_values(self, widget: Any, **values: Any) -> None:
+        """Update the values a bound widget's string is formatted with."""
+        key, _ = self._widgets[widget]
+        self.bind(widget, key, **values)
+
+    def unbind(self, widget: Any) -> None:
+        self._widgets.pop(widget, None)
+
+    def add_listener(self, listener: SwitchListener) -> None:
+        """Call `listener` with the new store after every switch."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: SwitchListener) -> None:
+        self._listeners.remove(listener)
+
+    def switch(self, langcode: str) -> None:
+        """
+        Load a language in the background, it becomes active with the next
+        `update()` after loading finished. A later switch supersedes earlier
+        ones still loading.
+        """
+        with self._lock:
+            self._requested = langcode
+        start_helper_thread(
+            target=self._load_in_background,
+            name=f"cme-localization-{langcode}",
+            args=(langcode,),
+            daemon=True,
+        )
+
+    def _load_in_background(self, langcode: str) -> None:
+        try:
+            store = self._load(langcode)
+        except Exception:
+            logger.error(
+                f"Failed to load language `{langcode}`", exc_info=True
+            )
+            store = None
+        with self._lock:
+            if self._requested != langcode:
+                return  # Superseded
+            self._requested = None
+            self._pending = store
+
+    def update(self, delta_time: float = 0) -> bool:
+        """
+        Activate a loaded language and update all bound widgets. Returns
+        whether the language was switched.
+        """
+        with self._lock:
+            store, self._pending = self._pending, None
+        if store is None:
+            return False
+        self._store = store
+        with ExitStack() as stack:
+            for layer in self.layers:
+                stack.enter_context(layer.deferred())
+            for widget, (key, values) in list(self._widgets.items()):
+                try:
+                    widget.text = self.resolve(key, **values)
+                except KeyError:
+                    pass  # Already reported by the store
+        for listener in self._listeners:
+            listener(store)
+        return True
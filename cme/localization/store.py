@@ -0,0 +1,131 @@
+"""
+Provides a language store with precomputed fallbacks to the default language.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional
+
+from .. import logger
+from .catalog import Catalog, load_strings
+from .formatting import Formatter, Template
+from .language_handler import DEFAULT_LANGUAGE, LangDict
+
+
+def flatten_strings(
+    strings: Mapping[str, Any],
+    prefix: str = "",
+) -> dict[str, str]:
+    """
+    Flatten nested tables of language strings into a single dict with dotted
+    keys, e.g. `{"menu": {"play": "Play"}}` into `{"menu.play": "Play"}`.
+    """
+    flat: dict[str, str] = {}
+    for key, value in strings.items():
+        if isinstance(value, Mapping):
+            flat.update(flatten_strings(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = str(value)
+    return flat
+
+
+class LanguageStore(Mapping[str, str]):
+    """
+    Read-only language strings of a language, falling back to the strings of
+    the default language for keys it's missing. Both languages are loaded
+    once on creation. Up to date catalogs (see `compile_catalog()`) stay
+    memory mapped while the store is alive and strings are only decoded when
+    first looked up. Lookups are plain dict lookups afterwards.
+
+    Keys missing from the language are logged once on creation, keys missing
+    from both languages once on their first lookup.
+
+    Use `format()` for strings with fields or plurals, see `formatting`.
+    """
+    def __init__(
+        self,
+        langcode: str,
+        langs_path: Optional[Path | str] = None,
+        default_langcode: str = DEFAULT_LANGUAGE,
+    ) -> None:
+        if langs_path is None:
+            try:
+                langs_path = LangDict.langs_path
+            except AttributeError:
+                raise RuntimeError(
+                    "Must call `LangDict.set_languages_path()` or pass "
+                    "`langs_path` before creating a LanguageStore."
+                ) from None
+        self.langcode = langcode
+        self.default_langcode = default_langcode
+        self.langs_path = Path(langs_path)
+
+        strings = self._load(langcode)
+        # Sources of strings, looked up in order
+        self._sources: tuple[Mapping[str, str], ...] = (strings,)
+        self._keys = dict.fromkeys(strings)
+        missing: set[str] = set()
+        if langcode != default_langcode:
+            defaults = self._load(default_langcode)
+            self._sources += (defaults,)
+            missing = {key for key in defaults if key not in self._keys}
+            self._keys.update(dict.fromkeys(sorted(missing)))
+            if missing:
+                logger.warning(
+                    f"{len(missing)} language strings don't exist in "
+                    f"`{langcode}` language, falling back to "
+                    f"`{default_langcode}`: {', '.join(sorted(missing))}"
+                )
+        # Strings that have been looked up
+        self._strings: dict[str, str] = {}
+        self.missing_keys = frozenset(missing)
+        self._reported: set[str] = set()
+        self._formatter = Formatter(self, langcode)
+
+    def _load(self, langcode: str) -> Mapping[str, str]:
+        return load_strings(self.langs_path / f"{langcode}.toml")
+
+    def __getitem__(self, key: str) -> str:
+        try:
+            return self._strings[key]
+        except KeyError:
+            pass
+        if key in self._keys:
+            for source in self._sources:
+                try:
+                    value = self._strings[key] = source[key]
+                    return value
+                except KeyError:
+                    pass
+        message = f"Language string `{key}` does not exist."
+        if key not in self._reported:
+            self._reported.add(key)
+            logger.warning(message)
+        raise KeyError(message)
+
+    def close(self) -> None:
+        """
+        Close the catalogs of the store. Strings that weren't looked up yet
+        can't be looked up anymore.
+        """
+        for source in self._sources:
+            if isinstance(source, Catalog):
+                source.close()
+
+    def template(self, key: str) -> Template:
+        """The compiled template of a string, cached by key."""
+        return self._formatter.template(key)
+
+    def format(self, key: str, **values: Any) -> str:
+        """Format the string of `key` with `values` using its template."""
+        return self._formatter.template(key).format(**values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -1,21 +1,43 @@
 """
 Module to configure the project-level logger.
-Provides logging functions.
+Provides logging functions, performance tracing (see `tracing`) and hot path
+instrumentation (see `instrumentation`).
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueListener
 from pathlib import Path
 from typing import Optional
 
+from . import instrumentation, tracing
+from .filters import DedupFilter, RateLimitFilter
 from .logger import LOGGER
+from .queued import DEFAULT_QUEUE_SIZE, BoundedQueueHandler
+from .rotating import (DEFAULT_MAX_BYTES, DEFAULT_MAX_TOTAL_BYTES,
+                       CompressingRotatingFileHandler, JsonLinesFormatter)
+
+# The handler added to LOGGER, the file handler itself if not queued
+_handler: Optional[logging.Handler] = None
+_file_handler: Optional[CompressingRotatingFileHandler] = None
+_listener: Optional[QueueListener] = None
 
 
 def configure_logger(
     *,
     logs_path: Path,
     level: Optional[int] = None,
+    queued: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    dedup_window: Optional[float] = None,
+    rate_limit: Optional[float] = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    rotate_interval: Optional[float] = None,
+    max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+    json_lines: bool = False,
 ) -> None:
     """
     Configure the Chilly Milly Logger.
@@ -26,19 +48,75 @@ def configure_logger(
     DEBUG, INFO, WARNING, ERROR, CRITICAL. If None it will be either DEBUG or
     WARNING, depending on the __debug__ constant. Defaults to None
     :type level: Optional[int], optional
+    :param queued: Whether to format and write records on a background
+    thread. Call `shutdown_logger()` to flush them, which also happens on
+    exit. Defaults to False
+    :type queued: bool, optional
+    :param queue_size: Records buffered for the background thread, further
+    records are dropped until there's space again. Defaults to
+    DEFAULT_QUEUE_SIZE
+    :type queue_size: int, optional
+    :param dedup_window: Seconds in which identical messages are collapsed
+    into one, see `DedupFilter`, e.g. 5.0. None to disable. Defaults to None
+    :type dedup_window: Optional[float], optional
+    :param rate_limit: Records per second passing at most, see
+    `RateLimitFilter`, e.g. 100.0. None to disable. Defaults to None
+    :type rate_limit: Optional[float], optional
+    :param max_bytes: Size after which `latest.log` is rotated. Rotated logs
+    are compressed in the background. Defaults to DEFAULT_MAX_BYTES
+    :type max_bytes: int, optional
+    :param rotate_interval: Seconds after which `latest.log` is rotated, None
+    to rotate only by size. Defaults to None
+    :type rotate_interval: Optional[float], optional
+    :param max_total_bytes: Size of all compressed logs together, the oldest
+    ones are deleted above it. Defaults to DEFAULT_MAX_TOTAL_BYTES
+    :type max_total_bytes: int, optional
+    :param json_lines: Whether to write one JSON object per record to
+    `latest.jsonl` instead of text to `latest.log`. Defaults to False
+    :type json_lines: bool, optional
     """
+    global _handler, _file_handler, _listener
+
     if not level:
         level = logging.DEBUG if __debug__ else logging.WARNING
+    shutdown_logger()
 
     fmt_str = "[%(asctime)s] [%(levelname)s] %(message)s"
     datefmt_str = "%Y-%m-%d %H:%M:%S"
 
-    (logs_path / "latest.log").unlink(missing_ok=True)
-    main_handler = logging.FileHandler(logs_path / "latest.log")
+    main_handler = CompressingRotatingFileHandler(
+        logs_path,
+        "latest.jsonl" if json_lines else "latest.log",
+        max_bytes=max_bytes,
+        interval=rotate_interval,
+        max_total_bytes=max_total_bytes,
+    )
     main_handler.setLevel(level)
-    main_formatter = logging.Formatter(fmt=fmt_str, datefmt=datefmt_str)
+    main_formatter: logging.Formatter
+    if json_lines:
+        main_formatter = JsonLinesFormatter()
+    else:
+        main_formatter = logging.Formatter(fmt=fmt_str, datefmt=datefmt_str)
     main_handler.setFormatter(main_formatter)
-    LOGGER.addHandler(main_handler)
+    _file_handler = main_handler
+    handler: logging.Handler = main_handler
+    if queued:
+        queue_handler = BoundedQueueHandler(queue.Queue(queue_size))
+        queue_handler.setLevel(level)  # Don't queue what isn't written
+        _listener = QueueListener(
+            queue_handler.queue, main_handler, respect_handler_level=True
+        )
+        _listener.start()
+        handler = queue_handler
+    # Filters of the handler only see records passing its level, so records
+    # that are never written don't use up the rate limit. Dedup first, so
+    # collapsed messages don't use it up either.
+    if dedup_window is not None:
+        handler.addFilter(DedupFilter(dedup_window))
+    if rate_limit is not None:
+        handler.addFilter(RateLimitFilter(rate_limit))
+    LOGGER.addHandler(handler)
+    _handler = handler
 
     # XXX Stream handler didn't work for some reason. Also it would interfere
     # XXX with the debug console.
@@ -51,6 +129,27 @@ def configure_logger(
     #     LOGGER.addHandler(debug_handler)
 
 
+def shutdown_logger() -> None:
+    """
+    Remove and close the handlers added by `configure_logger()`. Queued
+    records are written and the background thread is stopped first. Called
+    on exit.
+    """
+    global _handler, _file_handler, _listener
+    if _handler is not None:
+        LOGGER.removeHandler(_handler)
+        _handler = None
+    if _listener is not None:
+        _listener.stop()  # Handles the remaining records first
+        _listener = None
+    if _file_handler is not None:
+        _file_handler.close()
+        _file_handler = None
+
+
+atexit.register(shutdown_logger)
+
+
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING  # noqa
 
 from .logger import critical, debug, error, info, warning  # noqa
@@ -67,4 +166,16 @@ __all__ = [
     "info",
     "WARNING",
     "warning",
+    "BoundedQueueHandler",
+    "CompressingRotatingFileHandler",
+    "configure_logger",
+    "DedupFilter",
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_TOTAL_BYTES",
+    "DEFAULT_QUEUE_SIZE",
+    "instrumentation",
+    "JsonLinesFormatter",
+    "RateLimitFilter",
+    "tracing",
+    "shutdown_logger",
 ]
@@ -0,0 +1,104 @@
+"""
+Provides filters keeping repeated log records, e.g. logged every frame, from
+flooding the log.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+# Suppressed messages remembered before expired ones are forgotten
+_MAX_KEYS = 1024
+
+
+class DedupFilter(logging.Filter):
+    """
+    Collapses identical messages (same level and text) within `window`
+    seconds. The first one passes, the others are counted. The next one
+    passing after the window notes how often the message was suppressed.
+    """
+    def __init__(
+        self,
+        window: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self.window = window
+        self.clock = clock
+        # Message key -> (time it passed last, suppressed since)
+        self._seen: dict[tuple[int, str], tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.levelno, record.getMessage())
+        now = self.clock()
+        with self._lock:
+            passed, suppressed = self._seen.get(key, (-self.window, 0))
+            if now - passed < self.window:
+                self._seen[key] = (passed, suppressed + 1)
+                return False
+            if len(self._seen) >= _MAX_KEYS:
+                self._forget_expired(now)
+            self._seen[key] = (now, 0)
+        if suppressed:
+            record.msg = (
+                f"{key[1]} (suppressed {suppressed} times in the last "
+                f"{now - passed:.1f}s)"
+            )
+            record.args = None
+        return True
+
+    def _forget_expired(self, now: float) -> None:
+        for key, (passed, _) in list(self._seen.items()):
+            if now - passed >= self.window:
+                del self._seen[key]
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets at most `rate` records per second pass, with bursts of up to
+    `burst` records (defaults to `rate`). Records at `exempt_level` or above
+    always pass and aren't counted. The next passing record notes how many
+    were dropped.
+    """
+    def __init__(
+        self,
+        rate: float = 100.0,
+        burst: Optional[float] = None,
+        exempt_level: int = logging.CRITICAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self.rate = rate
+        self.burst = rate if burst is None else burst
+        self.exempt_level = exempt_level
+        self.clock = clock
+        self.dropped = 0
+        self._tokens = self.burst
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.exempt_level:
+            return True
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            if self._tokens < 1:
+                self.dropped += 1
+                return False
+            self._tokens = max(0.0, self._tokens - 1)
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            record.msg = (
+                f"{record.getMessage()} ({dropped} records dropped by rate "
+                "limit)"
+            )
+            record.args = None
+        return True
@@ -0,0 +1,134 @@
+"""
+Opt-in instrumentation of the engine's hot paths.
+
+Functions decorated with `instrumented()` count their calls and the time
+spent in them, if the environment variable `CME_INSTRUMENT` is set (to
+anything but `0`) before cme is imported. Otherwise the decorator returns
+functions unchanged, so instrumentation costs nothing.
+
+Counters are aggregated per frame. `cme.window.Window` ends frames
+automatically, otherwise call `end_frame()` once per frame. If tracing is
+enabled as well, the calls per frame are recorded as trace counters.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Optional, TypeVar
+
+from . import tracing
+
+ENABLED = os.environ.get("CME_INSTRUMENT", "") not in ("", "0")
+# Frames kept by `frame_history()`
+HISTORY_FRAMES = 600
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class CallStats:
+    """Calls of an instrumented function and the seconds spent in them."""
+    __slots__ = ("calls", "seconds")
+
+    def __init__(self, calls: int = 0, seconds: float = 0) -> None:
+        self.calls = calls
+        self.seconds = seconds
+
+    @property
+    def seconds_per_call(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CallStats(calls={self.calls}, "
+            f"ms_per_call={self.seconds_per_call * 1000:.4f})"
+        )
+
+
+class _Counter:
+    __slots__ = ("calls", "ns")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.ns = 0
+
+
+_counters: dict[str, _Counter] = {}
+_totals: dict[str, CallStats] = {}
+_history: deque[dict[str, CallStats]] = deque(maxlen=HISTORY_FRAMES)
+
+
+def instrumented(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator counting calls of a function under `name` (defaults to its
+    qualified name), if instrumentation is enabled.
+    """
+    def decorator(func: F) -> F:
+        if not ENABLED:
+            return func
+        counter = _counters.setdefault(name or func.__qualname__, _Counter())
+        perf_counter_ns = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                counter.calls += 1
+                counter.ns += perf_counter_ns() - start
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def registered() -> list[str]:
+    """Names of all instrumented functions."""
+    return sorted(_counters)
+
+
+def end_frame(delta_time: float = 0) -> dict[str, CallStats]:
+    """
+    Finish the current frame and return the stats of the functions called
+    in it. Takes `delta_time` so it can be scheduled.
+    """
+    frame: dict[str, CallStats] = {}
+    for name, counter in _counters.items():
+        if not counter.calls:
+            continue
+        stats = frame[name] = CallStats(counter.calls, counter.ns / 1e9)
+        total = _totals.setdefault(name, CallStats())
+        total.calls += stats.calls
+        total.seconds += stats.seconds
+        counter.calls = counter.ns = 0
+    _history.append(frame)
+    if frame and tracing.is_tracing():
+        tracing.counter(
+            "instrumented calls", "instrumentation",
+            **{name: stats.calls for name, stats in frame.items()},
+        )
+    return frame
+
+
+def last_frame() -> dict[str, CallStats]:
+    """Stats of the last finished frame."""
+    return _history[-1] if _history else {}
+
+
+def frame_history() -> list[dict[str, CallStats]]:
+    """Stats of the last `HISTORY_FRAMES` finished frames, oldest first."""
+    return list(_history)
+
+
+def totals() -> dict[str, CallStats]:
+    """Stats of all finished frames together."""
+    return dict(_totals)
+
+
+def reset() -> None:
+    """Forget all stats."""
+    for counter in _counters.values():
+        counter.calls = counter.ns = 0
+    _totals.clear()
+    _history.clear()
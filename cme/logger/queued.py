@@ -0,0 +1,67 @@
+"""
+Provides a bounded, non-blocking queue handler.
+
+Records are passed to a `logging.handlers.QueueListener`, which formats and
+writes them on its own thread, so logging doesn't block the mainloop on disk
+I/O.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler
+
+# Records buffered before new ones are dropped
+DEFAULT_QUEUE_SIZE = 10_000
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler never blocking the logging thread. If the queue is full,
+    records are dropped and counted. A warning with the amount of dropped
+    records is queued as soon as there is space again.
+
+    The message arguments and the traceback of a record are rendered before
+    it's queued, as they may change until the listener handles it. Applying
+    the format happens on the listener thread.
+    """
+    def __init__(self, queue_: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(queue_)
+        self.queue: queue.Queue[logging.LogRecord]
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Like QueueHandler.prepare(), but leaves the formatting to the
+        # formatter of the listener's handler
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(
+                    record.exc_info
+                )
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped:
+            dropped_record = logging.LogRecord(
+                record.name, logging.WARNING, __file__, 0,
+                f"Dropped {self.dropped} log records, the log queue was full",
+                None, None,
+            )
+            try:
+                self.queue.put_nowait(dropped_record)
+            except queue.Full:
+                return
+            self.dropped = 0
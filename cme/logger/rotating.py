@@ -0,0 +1,169 @@
+"""
+Provides a rotating file handler compressing old logs and a JSON lines
+formatter.
+
+The handler writes to `latest.log` (or `latest.jsonl`). Once that file is
+too big or too old it's renamed to `<date>-<time>.log` and compressed on a
+helper thread. The oldest compressed logs are deleted while all of them
+together take more than `max_total_bytes`. Other files in the logs folder
+are left alone.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from logging.handlers import BaseRotatingHandler
+from pathlib import Path
+from typing import Any, Optional
+
+from ..concurrency.threads import start_helper_thread
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_MAX_TOTAL_BYTES = 50 * 1024 * 1024
+# Names of rotated logs, `<date>-<time>` with an index if taken already
+_ROTATED_NAME = r"\d{8}-\d{6}(?:-\d+)?"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": record.created,
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "logger": record.name,
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "process": record.process,
+        }
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class CompressingRotatingFileHandler(BaseRotatingHandler):
+    """
+    Writes to `logs_path / filename` and rotates it once it's bigger than
+    `max_bytes` or older than `interval` seconds (if not None). A log left
+    over from a previous run is rotated on creation.
+    """
+    def __init__(
+        self,
+        logs_path: Path,
+        filename: str = "latest.log",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        interval: Optional[float] = None,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+    ) -> None:
+        self.logs_path = Path(logs_path)
+        self._compress_lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.max_total_bytes = max_total_bytes
+        path = self.logs_path / filename
+        self._suffix = path.suffix
+        self._rotated = re.compile(_ROTATED_NAME + re.escape(self._suffix))
+        self._archived = re.compile(
+            _ROTATED_NAME + re.escape(f"{self._suffix}.gz")
+        )
+        if path.exists() and path.stat().st_size:
+            self._rotate_file(path)
+        # Left over if compression was interrupted on exit
+        for temp in self.logs_path.glob(f"*{self._suffix}.gz.tmp"):
+            if self._archived.fullmatch(temp.name[:-len(".tmp")]):
+                temp.unlink(missing_ok=True)
+        super().__init__(path, mode="a", encoding="utf-8", delay=False)
+        self._rollover_at = self._next_rollover()
+        # Compress logs a previous run didn't finish compressing
+        self._compress_in_background()
+
+    def _next_rollover(self) -> float:
+        return time.time() + self.interval if self.interval else float("inf")
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if time.time() >= self._rollover_at:
+            return True
+        if self.stream is None:
+            return False
+        return bool(self.stream.tell() >= self.max_bytes)
+
+    def doRollover(self) -> None:
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None  # type: ignore[assignment]
+        self._rotate_file(Path(self.baseFilename))
+        self.stream = self._open()
+        self._rollover_at = self._next_rollover()
+        self._compress_in_background()
+
+    def _rotate_file(self, path: Path) -> None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        target = self.logs_path / f"{stamp}{self._suffix}"
+        index = 1
+        while (
+            target.exists() or target.with_name(f"{target.name}.gz").exists()
+        ):
+            target = self.logs_path / f"{stamp}-{index}{self._suffix}"
+            index += 1
+        os.replace(path, target)
+
+    def _uncompressed_logs(self) -> list[Path]:
+        return [
+            path for path in self.logs_path.glob(f"*{self._suffix}")
+            if self._rotated.fullmatch(path.name)
+        ]
+
+    def _compress_in_background(self) -> None:
+        if self._uncompressed_logs():
+            start_helper_thread(
+                target=self.compress_logs,
+                name="cme-log-compression",
+                daemon=True,
+            )
+
+    def compress_logs(self) -> None:
+        """Compress rotated logs and delete the oldest ones over the cap."""
+        with self._compress_lock:
+            self._compress_logs()
+            self.enforce_disk_cap()
+
+    def _compress_logs(self) -> None:
+        for path in self._uncompressed_logs():
+            target = path.with_name(f"{path.name}.gz")
+            temp = path.with_name(f"{path.name}.gz.tmp")
+            try:
+                with open(path, "rb") as src, gzip.open(temp, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                os.replace(temp, target)
+                path.unlink()
+            except OSError:
+                temp.unlink(missing_ok=True)
+
+    def enforce_disk_cap(self) -> None:
+        """Delete the oldest compressed logs while they exceed the cap."""
+        archives = []
+        for path in self.logs_path.glob(f"*{self._suffix}.gz"):
+            if not self._archived.fullmatch(path.name):
+                continue
+            stat = path.stat()
+            archives.append((stat.st_mtime, stat.st_size, path))
+        archives.sort()
+        total = sum(size for _, size, _ in archives)
+        for _, size, path in archives:
+            if total <= self.max_total_bytes:
+                break
+            total -= size
+            path.unlink(missing_ok=True)
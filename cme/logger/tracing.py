@@ -0,0 +1,297 @@
+"""
+Lightweight performance tracing, exportable to the Chrome trace format
+(open the exported file in https://ui.perfetto.dev or chrome://tracing).
+
+Tracing is disabled until `enable_tracing()` is called, then spans and
+instant events are recorded:
+
+```py
+with tracing.span("physics"):
+    ...
+
+@tracing.traced()
+def load_level() -> None:
+    ...
+
+tracing.instant("level loaded", level=3)
+```
+
+Every thread records into its own ring buffer without locking. Buffers of
+threads that ended are kept until their events are exported, at most
+`MAX_FINISHED_THREADS` of them. Threads started with `start_helper_thread`
+and processes started with `start_worker_process` are traced as a whole
+automatically. Worker processes get the trace directory passed explicitly,
+so they're traced with any start method. They write their events into it
+when they finish, which `export_chrome_trace()` merges.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+# Events kept per thread, older ones are overwritten
+MAX_EVENTS_PER_THREAD = 100_000
+# Buffers of ended threads kept until exported, the oldest are dropped first
+MAX_FINISHED_THREADS = 64
+
+F = TypeVar("F", bound=Callable[..., Any])
+# (phase, name, category, timestamp in µs, duration in µs, args)
+_Event = tuple[str, str, str, float, float, Optional[dict[str, Any]]]
+
+_enabled = False
+_directory: Optional[Path] = None
+_local = threading.local()
+# Reentrant, as threads may end (and release their buffer) at any time
+_lock = threading.RLock()
+
+
+class _ThreadBuffer:
+    __slots__ = ("pid", "tid", "thread_name", "events", "finished")
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self.tid = threading.get_ident()
+        self.thread_name = threading.current_thread().name
+        self.events: deque[_Event] = deque(maxlen=MAX_EVENTS_PER_THREAD)
+        self.finished = False
+
+
+class _Owner:
+    """Kept in thread local storage, which is released when threads end."""
+    __slots__ = ("__weakref__",)
+
+
+# Buffers of all recording threads
+_buffers: list[_ThreadBuffer] = []
+
+
+def _now() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+def _buffer() -> deque[_Event]:
+    try:
+        return _local.events  # type: ignore[no-any-return]
+    except AttributeError:
+        buffer = _ThreadBuffer()
+        owner = _Owner()
+        weakref.finalize(owner, _thread_ended, buffer)
+        with _lock:  # Once per thread
+            _buffers.append(buffer)
+        _local.events = buffer.events
+        _local.owner = owner
+        return buffer.events
+
+
+def _thread_ended(buffer: _ThreadBuffer) -> None:
+    with _lock:
+        buffer.finished = True
+        finished = [buffer for buffer in _buffers if buffer.finished]
+        for old in finished[:-MAX_FINISHED_THREADS]:
+            _buffers.remove(old)
+        if not buffer.events and buffer in _buffers:
+            _buffers.remove(buffer)
+
+
+def _drop_finished() -> None:
+    """Release the buffers of ended threads after exporting them."""
+    with _lock:
+        _buffers[:] = [buffer for buffer in _buffers if not buffer.finished]
+
+
+def _reset_in_child() -> None:
+    # Forked processes inherit the buffers of the parent
+    global _local
+    _local = threading.local()
+    _buffers.clear()
+
+
+os.register_at_fork(after_in_child=_reset_in_child)
+
+
+def enable_tracing(directory: Optional[Path | str] = None) -> Path:
+    """
+    Start recording events. Worker processes write their events into
+    `directory`, a new temporary directory if None. Returns the directory.
+    """
+    global _enabled, _directory
+    _directory = Path(
+        tempfile.mkdtemp(prefix="cme-trace-") if directory is None
+        else directory
+    )
+    _directory.mkdir(parents=True, exist_ok=True)
+    _enabled = True
+    return _directory
+
+
+def trace_directory() -> Optional[Path]:
+    """
+    The directory worker processes write their events into, None if tracing
+    is disabled. Pass it to `enable_tracing()` in processes started without
+    `start_worker_process`.
+    """
+    return _directory if _enabled else None
+
+
+def disable_tracing() -> None:
+    """Stop recording events. Recorded events are kept until exported."""
+    global _enabled
+    _enabled = False
+
+
+def is_tracing() -> bool:
+    return _enabled
+
+
+class _Span:
+    __slots__ = ("name", "category", "args", "start")
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        args: Optional[dict[str, Any]],
+    ) -> None:
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self) -> _Span:
+        self.start = _now()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _buffer().append((
+            "X", self.name, self.category, self.start,
+            _now() - self.start, self.args,
+        ))
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoSpan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str, category: str = "cme", **args: Any) -> _Span | _NoSpan:
+    """Context manager recording its duration, if tracing is enabled."""
+    if not _enabled:
+        return _NO_SPAN
+    return _Span(name, category, args or None)
+
+
+def traced(
+    name: Optional[str] = None,
+    category: str = "cme",
+) -> Callable[[F], F]:
+    """Decorator recording every call as a span, if tracing is enabled."""
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, category, None):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def instant(name: str, category: str = "cme", **args: Any) -> None:
+    """Record a point in time, if tracing is enabled."""
+    if _enabled:
+        _buffer().append(("i", name, category, _now(), 0, args or None))
+
+
+def counter(name: str, category: str = "cme", **values: float) -> None:
+    """Record values shown as a graph, if tracing is enabled."""
+    if _enabled:
+        _buffer().append(("C", name, category, _now(), 0, values))
+
+
+def collect_events() -> list[dict[str, Any]]:
+    """Events recorded in this process, in the Chrome trace format."""
+    with _lock:
+        buffers = list(_buffers)
+    events: list[dict[str, Any]] = []
+    pid = os.getpid()
+    events.append({
+        "name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+        "args": {"name": f"pid {pid}"},
+    })
+    for buffer in buffers:
+        pid, tid = buffer.pid, buffer.tid
+        events.append({
+            "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+            "args": {"name": buffer.thread_name},
+        })
+        for phase, name, category, ts, dur, args in list(buffer.events):
+            event: dict[str, Any] = {
+                "name": name, "cat": category, "ph": phase, "ts": ts,
+                "pid": pid, "tid": tid,
+            }
+            if phase == "X":
+                event["dur"] = dur
+            elif phase == "i":
+                event["s"] = "t"
+            if args:
+                event["args"] = args
+            events.append(event)
+    return events
+
+
+def clear_trace() -> None:
+    """Forget all events recorded in this process."""
+    with _lock:
+        for buffer in _buffers:
+            buffer.events.clear()
+    _drop_finished()
+
+
+def dump_process_trace() -> Optional[Path]:
+    """
+    Write the events of this process into the trace directory, done by
+    worker processes when they finish.
+    """
+    if not _enabled or _directory is None:
+        return None
+    path = _directory / f"process-{os.getpid()}.json"
+    path.write_text(json.dumps(collect_events()), encoding="utf-8")
+    _drop_finished()
+    return path
+
+
+def export_chrome_trace(path: Path | str) -> Path:
+    """
+    Write all events of this process and of finished worker processes into a
+    Chrome trace file.
+    """
+    events = collect_events()
+    _drop_finished()
+    if _directory is not None and _directory.exists():
+        for file in sorted(_directory.glob("process-*.json")):
+            events.extend(json.loads(file.read_text(encoding="utf-8")))
+    path = Path(path)
+    path.write_text(
+        json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}),
+        encoding="utf-8",
+    )
+    return path
@@ -2,31 +2,69 @@
 Module to keep track of paths and manage game saves and settings.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .assets import ASSETS_PATH, AssetsPath, get_assets_path, set_assets_path
-from .paths import DATA_PATH, LOGS_PATH, SETTINGS_PATH
-from .saves import (GameSave, PickleGameSave, load_game_save,
-                    load_pickle_game_save, save_game_save,
-                    save_pickle_game_save)
-from .settings import (CUSTOM_SETTINGS_CLASS, Settings, load_settings,
-                       register_custom_settings_class, save_settings)
+from .catalog import SaveCatalog, get_save_catalog
+from .chunks import ChunkedSaveStore
+from .saves import (BinaryGameSave, GameSave, LazyBinarySave, PickleGameSave,
+                    game_save_path, list_binary_game_saves,
+                    load_binary_game_save, load_game_save,
+                    load_pickle_game_save, read_binary_save_summary,
+                    save_binary_game_save, save_binary_game_save_async,
+                    save_game_save, save_game_save_async,
+                    save_pickle_game_save, save_pickle_game_save_async)
+from .settings import (CUSTOM_SETTINGS_CLASS, Settings, SettingsTracker,
+                       load_settings, register_custom_settings_class,
+                       save_settings)
+from .writer import BackgroundWriter, atomic_write, get_save_writer
+
+if TYPE_CHECKING:
+    from .paths import DATA_PATH, LOGS_PATH, SETTINGS_PATH
+
+
+def __getattr__(name: str) -> Any:
+    # The path constants create directories, so only resolve them when used
+    if name in ("DATA_PATH", "LOGS_PATH", "SETTINGS_PATH"):
+        from . import paths
+        return getattr(paths, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "AssetsPath",
     "ASSETS_PATH",
+    "atomic_write",
+    "BackgroundWriter",
+    "BinaryGameSave",
+    "ChunkedSaveStore",
     "CUSTOM_SETTINGS_CLASS",
     "DATA_PATH",
     "GameSave",
+    "game_save_path",
     "get_assets_path",
+    "get_save_catalog",
+    "get_save_writer",
+    "LazyBinarySave",
+    "list_binary_game_saves",
+    "load_binary_game_save",
     "load_game_save",
     "load_pickle_game_save",
     "load_settings",
     "LOGS_PATH",
     "PickleGameSave",
+    "read_binary_save_summary",
     "register_custom_settings_class",
+    "SaveCatalog",
+    "save_binary_game_save",
+    "save_binary_game_save_async",
     "save_game_save",
+    "save_game_save_async",
     "save_pickle_game_save",
+    "save_pickle_game_save_async",
     "save_settings",
     "Settings",
+    "SettingsTracker",
     "SETTINGS_PATH",
     "set_assets_path",
 ]
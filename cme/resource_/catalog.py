@@ -0,0 +1,202 @@
+"""
+Provides a catalog of all game saves of a directory, stored in a single small
+json file. It maps profiles to their save slots and keeps metadata about
+each of them (modification time, size, checksum and the save's summary), so
+save menus can be rendered without opening any save.
+
+The standard save functions of the `saves` module keep the catalog of
+`DATA_PATH/saves` up to date.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import json
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+from .. import logger
+from .writer import atomic_write, last_checksum
+
+CATALOG_FILENAME = "catalog.json"
+_CATALOG_VERSION = 1
+
+
+class SaveCatalog:
+    """
+    Catalog of the saves in `directory`. Profiles are stored by name, saves
+    without a profile use the empty string. Slots are identified by the file
+    name of the save.
+
+    Each slot entry is a dictionary with the keys `file`, `saved_at` (unix
+    timestamp), `size` (bytes), `checksum` (crc32 as hex string) and
+    `summary`. Thread safe, as async saves update it from the writer thread.
+    """
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.file = self.directory / CATALOG_FILENAME
+        self._lock = threading.RLock()
+        self._profiles: Optional[dict[str, dict[str, dict[str, Any]]]] = None
+
+    def _load(self) -> dict[str, dict[str, dict[str, Any]]]:
+        if self._profiles is None:
+            try:
+                with open(self.file, "r", encoding="utf-8") as fp:
+                    data = json.load(fp, object_hook=_decode_bytes)
+                if data.get("version") != _CATALOG_VERSION:
+                    raise ValueError(
+                        f"Unknown catalog version {data.get('version')}"
+                    )
+                self._profiles = data["profiles"]
+            except FileNotFoundError:
+                self._profiles = {}
+            except (ValueError, KeyError):
+                logger.warning(
+                    f"Save catalog `{self.file}` is invalid, rebuilding it "
+                    "from scratch.",
+                    exc_info=True,
+                )
+                self._profiles = {}
+        return self._profiles
+
+    def _save(self) -> None:
+        data = {"version": _CATALOG_VERSION, "profiles": self._load()}
+
+        def write(fp: BinaryIO) -> None:
+            fp.write(json.dumps(data, default=_encode_bytes).encode("utf-8"))
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.file, write)
+
+    def profiles(self) -> list[Optional[str]]:
+        """All profiles that have at least one save. `None` for no profile."""
+        with self._lock:
+            return [
+                profile or None for profile, slots in self._load().items()
+                if slots
+            ]
+
+    def slots(
+        self,
+        profile: Optional[str] = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Returns the slot entries of a profile by slot (file) name."""
+        with self._lock:
+            return {
+                slot: dict(entry)
+                for slot, entry in self._load().get(profile or "", {}).items()
+            }
+
+    def get(
+        self,
+        slot: str,
+        profile: Optional[str] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Returns the entry of a single slot, None if it is not cataloged."""
+        return self.slots(profile).get(slot)
+
+    def record(
+        self,
+        file: str | Path,
+        profile: Optional[str] = None,
+        summary: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Add or update the entry of a save that has just been written.
+        `summary` has to be json serializable, except that it may contain
+        bytes (e.g. a thumbnail). The checksum computed while writing the
+        save is used if the save was just written by `atomic_write()` on
+        this thread and hasn't changed since, otherwise the save is read
+        again.
+        """
+        file = Path(file)
+        stat = file.stat()
+        crc = last_checksum(file)
+        entry = {
+            "file": file.name,
+            "saved_at": time.time(),
+            "size": stat.st_size,
+            "checksum": _checksum(file) if crc is None else f"{crc:08x}",
+            "summary": summary or {},
+        }
+        with self._lock:
+            self._load().setdefault(profile or "", {})[file.name] = entry
+            self._save()
+
+    def remove(self, slot: str, profile: Optional[str] = None) -> None:
+        """Remove a slot from the catalog. Doesn't delete the save itself."""
+        with self._lock:
+            profiles = self._load()
+            slots = profiles.get(profile or "", {})
+            if slots.pop(slot, None) is not None:
+                if not slots:
+                    del profiles[profile or ""]
+                self._save()
+
+    def verify(self, slot: str, profile: Optional[str] = None) -> bool:
+        """
+        Whether the save file of a slot still exists and matches the
+        cataloged checksum.
+        """
+        entry = self.get(slot, profile)
+        if entry is None:
+            return False
+        file = self.directory / entry["file"]
+        if not file.exists() or file.stat().st_size != entry["size"]:
+            return False
+        return bool(_checksum(file) == entry["checksum"])
+
+    def refresh(self) -> None:
+        """Drop all entries whose save file doesn't exist anymore."""
+        with self._lock:
+            changed = False
+            profiles = self._load()
+            for profile in list(profiles):
+                slots = profiles[profile]
+                for slot in list(slots):
+                    if not (self.directory / slots[slot]["file"]).exists():
+                        del slots[slot]
+                        changed = True
+                if not slots:
+                    del profiles[profile]
+            if changed:
+                self._save()
+
+
+def _checksum(file: Path) -> str:
+    crc = 0
+    with open(file, "rb") as fp:
+        while chunk := fp.read(io.DEFAULT_BUFFER_SIZE * 64):
+            crc = zlib.crc32(chunk, crc)
+    return f"{crc:08x}"
+
+
+def _encode_bytes(obj: Any) -> Any:
+    if isinstance(obj, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(obj).decode("ascii")}
+    raise TypeError(f"Cannot encode object of type {type(obj).__name__}")
+
+
+def _decode_bytes(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1 and "__bytes__" in obj:
+        return base64.b64decode(obj["__bytes__"])
+    return obj
+
+
+_CATALOGS: dict[Path, SaveCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def get_save_catalog(directory: str | Path) -> SaveCatalog:
+    """Returns the shared catalog instance of a save directory."""
+    directory = Path(directory)
+    with _CATALOGS_LOCK:
+        try:
+            return _CATALOGS[directory]
+        except KeyError:
+            catalog = _CATALOGS[directory] = SaveCatalog(directory)
+            return catalog
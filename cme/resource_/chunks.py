@@ -0,0 +1,349 @@
+"""
+Provides a chunked save store for large world state where only a small part
+changes between saves.
+
+Chunks (e.g. map regions) are appended to a journal file on `commit()`, but
+only if they changed, followed by a commit record. Opening a store verifies
+the records of the journal to build an index, chunks themselves are decoded
+when first accessed. Records after the last complete commit, e.g. of a commit
+interrupted by a crash, are discarded, so commits apply entirely or not at
+all. Once the journal mostly consists of outdated records, it is
+compacted into a new file containing only the latest version of each chunk.
+
+Chunk values may be anything the `codec` module can encode.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from contextlib import suppress
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+
+from . import codec, paths
+from .writer import atomic_write
+
+_MAGIC = b"CMEJ\x00\x02"
+# crc32 of lengths, key and payload, key length, payload length
+_RECORD_HEADER = struct.Struct("<IHI")
+_CRC = struct.Struct("<I")
+_LENGTHS = struct.Struct("<HI")
+# Payload lengths marking deletions and commit records
+_TOMBSTONE = 0xFFFFFFFF
+_COMMIT = 0xFFFFFFFE
+# Payload of commit records, the amount of records of the commit
+_COMMIT_PAYLOAD = struct.Struct("<I")
+_COMMIT_SIZE = _RECORD_HEADER.size + _COMMIT_PAYLOAD.size
+
+
+class ChunkedSaveStore:
+    """
+    A dictionary-like store of chunks, persisted in a journal file in
+    `DATA_PATH/saves` (or `directory`, if given). Not thread safe.
+
+    Assigning a chunk marks it as dirty. If a chunk value is mutated in place
+    call `mark_dirty()` instead. `commit()` then appends all dirty chunks.
+    """
+    def __init__(
+        self,
+        name: str,
+        profile: Optional[str] = None,
+        directory: Optional[str | Path] = None,
+        compaction_ratio: float = 2.0,
+        compaction_min_size: int = 1024 * 1024,
+    ) -> None:
+        """
+        `compaction_ratio` is the journal size in relation to the size of all
+        live chunks, above which a commit compacts the journal. Journals
+        smaller than `compaction_min_size` bytes are never compacted.
+        """
+        directory = (
+            paths.DATA_PATH / "saves" if directory is None
+            else Path(directory)
+        )
+        directory.mkdir(parents=True, exist_ok=True)
+        filename = f"{name}.journal" if not profile else (
+            f"{name}_{profile}.journal"
+        )
+        self.file = directory / filename
+        self.compaction_ratio = compaction_ratio
+        self.compaction_min_size = compaction_min_size
+
+        # key -> (record offset, record size)
+        self._index: dict[str, tuple[int, int]] = {}
+        self._cache: dict[str, Any] = {}
+        self._dirty: set[str] = set()
+        self._deleted: set[str] = set()
+        self._live_size = 0
+        self._file_size = 0
+        self._fp: Optional[BinaryIO] = None
+        self._scan()
+
+    def __enter__(self) -> ChunkedSaveStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._cache or (
+            key in self._index and key not in self._deleted
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if key in self._deleted:
+            raise KeyError(key)
+        offset, size = self._index[key]
+        value = self._read_record(key, offset, size)
+        self._cache[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._cache[key] = value
+        self._dirty.add(key)
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._cache.pop(key, None)
+        self._dirty.discard(key)
+        if key in self._index:
+            self._deleted.add(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> set[str]:
+        return (self._index.keys() - self._deleted) | self._cache.keys()
+
+    @property
+    def dirty(self) -> set[str]:
+        """Keys of chunks that will be written by the next `commit()`."""
+        return self._dirty | self._deleted
+
+    def mark_dirty(self, *keys: str) -> None:
+        """Mark chunks that have been mutated in place as changed."""
+        for key in keys:
+            if key not in self._cache:
+                raise KeyError(f"Chunk `{key}` has not been loaded.")
+            self._dirty.add(key)
+
+    def preload(self, keys: Iterable[str]) -> None:
+        """
+        Read multiple chunks at once, e.g. all chunks of the current area.
+        Reads happen in file order. Unknown keys are ignored.
+        """
+        positions = sorted(
+            (self._index[key], key) for key in keys
+            if key in self._index and key not in self._cache
+            and key not in self._deleted
+        )
+        for (offset, size), key in positions:
+            self._cache[key] = self._read_record(key, offset, size)
+
+    def unload(self, keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop cached chunks that have no uncommitted changes to free memory.
+        Without `keys`, all clean chunks are dropped.
+        """
+        if keys is None:
+            keys = list(self._cache)
+        for key in keys:
+            if key not in self._dirty and key in self._index:
+                self._cache.pop(key, None)
+
+    def commit(self) -> None:
+        """
+        Append all dirty chunks and a commit record to the journal and fsync
+        it. Compacts the journal afterwards if it grew too big.
+        """
+        if not self._dirty and not self._deleted:
+            return
+        records = []
+        for key in sorted(self._deleted):
+            records.append((key, _encode_record(key, None)))
+        for key in sorted(self._dirty):
+            records.append(
+                (key, _encode_record(key, codec.packb(self._cache[key])))
+            )
+
+        data = memoryview(b"".join(
+            [record for _, record in records]
+            + [_encode_commit(len(records))]
+        ))
+        offset = self._file_size
+        with open(self.file, "r+b", buffering=0) as fp:
+            # Overwrites whatever a failed commit left after the last commit
+            fp.seek(offset)
+            try:
+                while data:
+                    data = data[fp.write(data):]
+                fp.truncate()
+                os.fsync(fp.fileno())
+            except BaseException:
+                with suppress(OSError):
+                    fp.truncate(offset)
+                raise
+
+        for key, record in records:
+            if key in self._index:
+                self._live_size -= self._index[key][1]
+            if key in self._deleted:
+                del self._index[key]
+            else:
+                self._index[key] = (offset, len(record))
+                self._live_size += len(record)
+            offset += len(record)
+        self._file_size = offset + _COMMIT_SIZE
+        self._dirty.clear()
+        self._deleted.clear()
+
+        if (
+            self._file_size >= self.compaction_min_size
+            and self._file_size > self._live_size * self.compaction_ratio
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Atomically rewrite the journal so it only contains the latest record
+        of every chunk. Uncommitted changes are not written.
+        """
+        self._close_fp()
+        new_index: dict[str, tuple[int, int]] = {}
+
+        def write(fp: BinaryIO) -> None:
+            fp.write(_MAGIC)
+            offset = len(_MAGIC)
+            with open(self.file, "rb") as old_fp:
+                for key, (old_offset, size) in sorted(
+                    self._index.items(), key=lambda item: item[1]
+                ):
+                    old_fp.seek(old_offset)
+                    fp.write(old_fp.read(size))
+                    new_index[key] = (offset, size)
+                    offset += size
+            fp.write(_encode_commit(len(new_index)))
+
+        atomic_write(self.file, write)
+        self._index = new_index
+        self._file_size = len(_MAGIC) + self._live_size + _COMMIT_SIZE
+
+    def close(self) -> None:
+        """Close the journal. Uncommitted changes are discarded."""
+        self._close_fp()
+
+    def _close_fp(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def _scan(self) -> None:
+        if not self.file.exists():
+            with open(self.file, "wb") as fp:
+                fp.write(_MAGIC)
+                os.fsync(fp.fileno())
+            self._file_size = len(_MAGIC)
+            return
+
+        file_size = self.file.stat().st_size
+        with open(self.file, "rb") as fp:
+            if fp.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"`{self.file}` is not a chunk journal.")
+            offset = committed = len(_MAGIC)
+            # (key, offset, size) of the records of an unfinished commit,
+            # size is None for deletions
+            pending: list[tuple[str, int, Optional[int]]] = []
+            while offset + _RECORD_HEADER.size <= file_size:
+                header = fp.read(_RECORD_HEADER.size)
+                crc, key_length, payload_length = _RECORD_HEADER.unpack(
+                    header
+                )
+                if payload_length == _COMMIT:
+                    body_length = _COMMIT_PAYLOAD.size
+                elif payload_length == _TOMBSTONE:
+                    body_length = key_length
+                else:
+                    body_length = key_length + payload_length
+                size = _RECORD_HEADER.size + body_length
+                if offset + size > file_size:
+                    break  # Torn write at the end
+                body = fp.read(body_length)
+                if zlib.crc32(body, zlib.crc32(header[_CRC.size:])) != crc:
+                    break  # Garbage, e.g. zeros after a crash
+                if payload_length == _COMMIT:
+                    if _COMMIT_PAYLOAD.unpack(body)[0] != len(pending):
+                        break
+                    for key, record_offset, record_size in pending:
+                        if key in self._index:
+                            self._live_size -= self._index[key][1]
+                        if record_size is None:
+                            self._index.pop(key, None)
+                        else:
+                            self._index[key] = (record_offset, record_size)
+                            self._live_size += record_size
+                    pending.clear()
+                    committed = offset + size
+                else:
+                    pending.append((
+                        body[:key_length].decode("utf-8"),
+                        offset,
+                        None if payload_length == _TOMBSTONE else size,
+                    ))
+                offset += size
+
+        if committed != file_size:
+            # Drop the records of an interrupted commit
+            with open(self.file, "r+b") as fp:
+                fp.truncate(committed)
+        self._file_size = committed
+
+    def _read_record(self, key: str, offset: int, size: int) -> Any:
+        if self._fp is None:
+            self._fp = open(self.file, "rb")
+        self._fp.seek(offset)
+        record = self._fp.read(size)
+        crc, key_length, _ = _RECORD_HEADER.unpack_from(record)
+        if zlib.crc32(memoryview(record)[_CRC.size:]) != crc:
+            raise ValueError(f"Chunk `{key}` in `{self.file}` is corrupted.")
+        return codec.unpackb(record[_RECORD_HEADER.size + key_length:])
+
+
+def _pack_record(key_length: int, payload_length: int, body: bytes) -> bytes:
+    lengths = _LENGTHS.pack(key_length, payload_length)
+    return _CRC.pack(zlib.crc32(body, zlib.crc32(lengths))) + lengths + body
+
+
+def _encode_record(key: str, payload: Optional[bytes]) -> bytes:
+    key_bytes = key.encode("utf-8")
+    return _pack_record(
+        len(key_bytes),
+        _TOMBSTONE if payload is None else len(payload),
+        key_bytes + (payload or b""),
+    )
+
+
+def _encode_commit(count: int) -> bytes:
+    return _pack_record(0, _COMMIT, _COMMIT_PAYLOAD.pack(count))
@@ -0,0 +1,230 @@
+"""
+Compact binary encoding of json-like data, compatible with the MessagePack
+format. Supports None, bool, int (64 bit), float, str, bytes, lists, tuples
+(decoded as lists) and dicts.
+
+If the `msgpack` package is installed (the `msgpack` extra) its C
+implementation is used, otherwise a pure Python implementation producing
+identical output, which is considerably slower.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any, Callable
+
+_pack_be = {
+    fmt: struct.Struct(f">{fmt}").pack
+    for fmt in ("B", "H", "I", "Q", "b", "h", "i", "q", "d")
+}
+_unpack_be = {
+    fmt: struct.Struct(f">{fmt}").unpack_from
+    for fmt in ("B", "H", "I", "Q", "b", "h", "i", "q", "f", "d")
+}
+
+
+def _pack_into(obj: Any, buf: bytearray) -> None:
+    # Ordered by how common the types are in typical game saves
+    type_ = type(obj)
+    if type_ is str:
+        data = obj.encode("utf-8")
+        length = len(data)
+        if length < 32:
+            buf.append(0xa0 | length)
+        elif length < 0x100:
+            buf += b"\xd9" + _pack_be["B"](length)
+        elif length < 0x10000:
+            buf += b"\xda" + _pack_be["H"](length)
+        else:
+            buf += b"\xdb" + _pack_be["I"](length)
+        buf += data
+    elif type_ is int:
+        if 0 <= obj < 0x80:
+            buf.append(obj)
+        elif -32 <= obj < 0:
+            buf.append(obj & 0xff)
+        elif obj >= 0:
+            if obj < 0x100:
+                buf += b"\xcc" + _pack_be["B"](obj)
+            elif obj < 0x10000:
+                buf += b"\xcd" + _pack_be["H"](obj)
+            elif obj < 0x100000000:
+                buf += b"\xce" + _pack_be["I"](obj)
+            else:
+                buf += b"\xcf" + _pack_be["Q"](obj)
+        elif obj >= -0x80:
+            buf += b"\xd0" + _pack_be["b"](obj)
+        elif obj >= -0x8000:
+            buf += b"\xd1" + _pack_be["h"](obj)
+        elif obj >= -0x80000000:
+            buf += b"\xd2" + _pack_be["i"](obj)
+        else:
+            buf += b"\xd3" + _pack_be["q"](obj)
+    elif type_ is float:
+        buf += b"\xcb" + _pack_be["d"](obj)
+    elif type_ is dict:
+        length = len(obj)
+        if length < 16:
+            buf.append(0x80 | length)
+        elif length < 0x10000:
+            buf += b"\xde" + _pack_be["H"](length)
+        else:
+            buf += b"\xdf" + _pack_be["I"](length)
+        for key, value in obj.items():
+            _pack_into(key, buf)
+            _pack_into(value, buf)
+    elif type_ is list or type_ is tuple:
+        length = len(obj)
+        if length < 16:
+            buf.append(0x90 | length)
+        elif length < 0x10000:
+            buf += b"\xdc" + _pack_be["H"](length)
+        else:
+            buf += b"\xdd" + _pack_be["I"](length)
+        for item in obj:
+            _pack_into(item, buf)
+    elif obj is None:
+        buf.append(0xc0)
+    elif obj is True:
+        buf.append(0xc3)
+    elif obj is False:
+        buf.append(0xc2)
+    elif type_ is bytes or type_ is bytearray:
+        length = len(obj)
+        if length < 0x100:
+            buf += b"\xc4" + _pack_be["B"](length)
+        elif length < 0x10000:
+            buf += b"\xc5" + _pack_be["H"](length)
+        else:
+            buf += b"\xc6" + _pack_be["I"](length)
+        buf += obj
+    # Subclasses like IntEnum, slower path
+    elif isinstance(obj, int):
+        _pack_into(int(obj), buf)
+    elif isinstance(obj, float):
+        _pack_into(float(obj), buf)
+    elif isinstance(obj, str):
+        _pack_into(str(obj), buf)
+    elif isinstance(obj, bytes):
+        _pack_into(bytes(obj), buf)
+    elif isinstance(obj, dict):
+        _pack_into(dict(obj), buf)
+    elif isinstance(obj, (list, tuple)):
+        _pack_into(list(obj), buf)
+    else:
+        raise TypeError(f"Cannot encode object of type {type_.__name__}")
+
+
+def _py_packb(obj: Any) -> bytes:
+    buf = bytearray()
+    _pack_into(obj, buf)
+    return bytes(buf)
+
+
+def _unpack_from(data: memoryview, pos: int) -> tuple[Any, int]:
+    byte = data[pos]
+    pos += 1
+    if byte < 0x80:
+        return byte, pos
+    if 0xa0 <= byte <= 0xbf:
+        end = pos + (byte & 0x1f)
+        return str(data[pos:end], "utf-8"), end
+    if 0x80 <= byte <= 0x8f:
+        return _unpack_map(data, pos, byte & 0x0f)
+    if 0x90 <= byte <= 0x9f:
+        return _unpack_array(data, pos, byte & 0x0f)
+    if byte >= 0xe0:
+        return byte - 0x100, pos
+    if byte == 0xc0:
+        return None, pos
+    if byte == 0xc2:
+        return False, pos
+    if byte == 0xc3:
+        return True, pos
+    try:
+        fmt, size, kind = _VARIABLE[byte]
+    except KeyError:
+        raise ValueError(
+            f"Invalid or unsupported type byte {byte:#x} at {pos - 1}"
+        )
+    value = _unpack_be[fmt](data, pos)[0]
+    pos += size
+    if kind == "value":
+        return value, pos
+    if kind == "str":
+        return str(data[pos:pos + value], "utf-8"), pos + value
+    if kind == "bin":
+        return bytes(data[pos:pos + value]), pos + value
+    if kind == "array":
+        return _unpack_array(data, pos, value)
+    return _unpack_map(data, pos, value)
+
+
+def _unpack_array(data: memoryview, pos: int, length: int) -> tuple[Any, int]:
+    items = []
+    for _ in range(length):
+        item, pos = _unpack_from(data, pos)
+        items.append(item)
+    return items, pos
+
+
+def _unpack_map(data: memoryview, pos: int, length: int) -> tuple[Any, int]:
+    dictionary = {}
+    for _ in range(length):
+        key, pos = _unpack_from(data, pos)
+        dictionary[key], pos = _unpack_from(data, pos)
+    return dictionary, pos
+
+
+# type byte -> (struct format, size of the format, kind)
+_VARIABLE: dict[int, tuple[str, int, str]] = {
+    0xcc: ("B", 1, "value"),
+    0xcd: ("H", 2, "value"),
+    0xce: ("I", 4, "value"),
+    0xcf: ("Q", 8, "value"),
+    0xd0: ("b", 1, "value"),
+    0xd1: ("h", 2, "value"),
+    0xd2: ("i", 4, "value"),
+    0xd3: ("q", 8, "value"),
+    0xca: ("f", 4, "value"),
+    0xcb: ("d", 8, "value"),
+    0xd9: ("B", 1, "str"),
+    0xda: ("H", 2, "str"),
+    0xdb: ("I", 4, "str"),
+    0xc4: ("B", 1, "bin"),
+    0xc5: ("H", 2, "bin"),
+    0xc6: ("I", 4, "bin"),
+    0xdc: ("H", 2, "array"),
+    0xdd: ("I", 4, "array"),
+    0xde: ("H", 2, "map"),
+    0xdf: ("I", 4, "map"),
+}
+
+
+def _py_unpackb(data: bytes | memoryview) -> Any:
+    view = memoryview(data)
+    obj, pos = _unpack_from(view, 0)
+    if pos != len(view):
+        raise ValueError(f"Extra data after position {pos}")
+    return obj
+
+
+packb: Callable[[Any], bytes]
+unpackb: Callable[[bytes | memoryview], Any]
+
+try:
+    import msgpack
+
+    def packb(obj: Any) -> bytes:
+        """Encode `obj` into bytes."""
+        return msgpack.packb(obj, use_bin_type=True)  # type: ignore
+
+    def unpackb(data: bytes | memoryview) -> Any:
+        """Decode bytes created by `packb()`."""
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+    ACCELERATED = True
+except ImportError:
+    packb = _py_packb
+    unpackb = _py_unpackb
+    ACCELERATED = False
@@ -0,0 +1,123 @@
+"""
+Streaming compression for save files. Supported formats are `"gzip"` and
+`"lzma"` from the standard library and `"zstd"` if the `zstandard` package is
+installed. Compressed files are recognized by their magic bytes, so loading
+never needs to know which format (if any) a file was written with.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import lzma
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Literal, Optional, cast
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+Compression = Literal["gzip", "lzma", "zstd"]
+
+# Levels favoring speed, as saves are written while the game is running.
+# Higher levels barely shrink typical save data further but cost a lot more.
+DEFAULT_LEVELS: dict[str, int] = {
+    "gzip": 6,
+    "lzma": 2,
+    "zstd": 3,
+}
+
+_MAGIC: dict[bytes, Compression] = {
+    b"\x1f\x8b": "gzip",
+    b"\xfd7zXZ\x00": "lzma",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+_MAGIC_LENGTH = max(len(magic) for magic in _MAGIC)
+
+
+def available_compressions() -> list[Compression]:
+    """The compression formats that can be used in this environment."""
+    if zstandard is None:
+        return ["gzip", "lzma"]
+    return ["gzip", "lzma", "zstd"]
+
+
+def detect_compression(header: bytes) -> Optional[Compression]:
+    """
+    Returns the compression format of a file starting with `header`, or None
+    if it isn't compressed.
+    """
+    for magic, compression in _MAGIC.items():
+        if header.startswith(magic):
+            return compression
+    return None
+
+
+@contextlib.contextmanager
+def compressed_writer(
+    fp: BinaryIO,
+    compression: Optional[Compression],
+    level: Optional[int] = None,
+) -> Iterator[BinaryIO]:
+    """
+    Wrap a binary file object so everything written to the yielded file
+    object is compressed on the fly. The compressed stream is finished when
+    the context exits, `fp` itself stays open. If `compression` is None `fp`
+    is yielded as is.
+    """
+    if compression is None:
+        yield fp
+        return
+    if level is None:
+        level = DEFAULT_LEVELS[compression]
+    stream: Any
+    if compression == "gzip":
+        # mtime=0 keeps the output deterministic
+        stream = gzip.GzipFile(
+            fileobj=fp, mode="wb", compresslevel=level, mtime=0
+        )
+    elif compression == "lzma":
+        stream = lzma.LZMAFile(fp, mode="wb", preset=level)
+    elif compression == "zstd":
+        if zstandard is None:
+            raise ValueError(
+                "zstd compression requires the `zstandard` package."
+            )
+        stream = zstandard.ZstdCompressor(level=level).stream_writer(
+            fp, closefd=False
+        )
+    else:
+        raise ValueError(f"Unknown compression `{compression}`.")
+    with stream:
+        yield cast(BinaryIO, stream)
+
+
+@contextlib.contextmanager
+def open_decompressed(file: str | Path) -> Iterator[BinaryIO]:
+    """
+    Open a file for reading, transparently decompressing it if it has been
+    written compressed. Data is decompressed as it is read.
+    """
+    with open(file, "rb") as fp:
+        compression = detect_compression(fp.read(_MAGIC_LENGTH))
+        fp.seek(0)
+        if compression is None:
+            yield fp
+            return
+        stream: Any
+        if compression == "gzip":
+            stream = gzip.GzipFile(fileobj=fp, mode="rb")
+        elif compression == "lzma":
+            stream = lzma.LZMAFile(fp, mode="rb")
+        else:
+            if zstandard is None:
+                raise ValueError(
+                    f"`{file}` is zstd compressed, which requires the "
+                    "`zstandard` package."
+                )
+            stream = zstandard.ZstdDecompressor().stream_reader(
+                fp, closefd=False
+            )
+        with stream:
+            yield cast(BinaryIO, stream)
@@ -1,24 +1,70 @@
 """
 Holds several path constants.
+
+The paths depend on `config.app_name`, which is set by `init_cme()`, so they
+are determined (and their directories created) when they are first accessed
+instead of on import.
 """
 
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import Callable
+
+from .. import config
+
+_app_name = ""
+
+
+def _get_app_name() -> str:
+    global _app_name
+    if not _app_name:
+        try:
+            _app_name = config.app_name
+        except AttributeError:
+            import random
+            _app_name = f"unnamed_cme_game_{random.randint(0, 1_000_000)}"
+    return _app_name
+
+
+def get_data_path() -> Path:
+    """Appdata path of the game, created if it doesn't exist."""
+    from pyglet import resource
+    path = Path(resource.get_data_path(_get_app_name()))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def get_settings_path() -> Path:
+    """Settings path of the game, created if it doesn't exist."""
+    from pyglet import resource
+    path = Path(resource.get_settings_path(_get_app_name()))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def get_logs_path() -> Path:
+    """Logs path inside the data path, created if it doesn't exist."""
+    path = get_data_path() / "logs"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
-from pyglet import resource
 
-try:
-    from ..config import app_name
-except ImportError:
-    import random
-    app_name = f"unnamed_cme_game_{random.randint(0, 1_000_000)}"
+_PATH_GETTERS: dict[str, Callable[[], Path]] = {
+    "DATA_PATH": get_data_path,
+    "SETTINGS_PATH": get_settings_path,
+    "LOGS_PATH": get_logs_path,
+}
 
-# Appdata and settings path
-DATA_PATH = Path(resource.get_data_path(app_name))
-DATA_PATH.mkdir(parents=True, exist_ok=True)
-SETTINGS_PATH = Path(resource.get_settings_path(app_name))
-SETTINGS_PATH.mkdir(parents=True, exist_ok=True)
 
-# Logs
-LOGS_PATH = DATA_PATH / "logs"
-LOGS_PATH.mkdir(parents=True, exist_ok=True)
+def __getattr__(name: str) -> Path:
+    try:
+        getter = _PATH_GETTERS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    path = getter()
+    globals()[name] = path  # Later accesses don't go through __getattr__
+    return path
@@ -2,18 +2,35 @@
 Provides an interface to manage game saves. For flexibility and to allow
 multiple types of saves to exist, no special load and save functionality is
 provided.
+
+Saves are always written atomically, so a crash while saving never leaves a
+corrupted save behind. The `*_async` variants additionally move serializing
+and writing to a background thread, coalescing rapid successive saves.
+
+`GameSave` and `PickleGameSave` can be compressed by setting their
+`COMPRESSION` class attribute. Compression is streamed and detected
+automatically when loading, so existing uncompressed saves keep working.
+
+Saves written to the standard directory using the `save_*` functions are
+recorded in the save catalog of that directory (see the `catalog` module).
 """
 
 
 from __future__ import annotations
 
 import abc
+import copy
 import json
 import pickle
+import struct
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Callable, Optional
 
-from .paths import DATA_PATH
+from .. import logger
+from . import codec, paths
+from .catalog import get_save_catalog
+from .compression import Compression, compressed_writer, open_decompressed
+from .writer import WriteCallback, WriteFunc, atomic_write, get_save_writer
 
 
 class GameSave(metaclass=abc.ABCMeta):
@@ -32,7 +49,13 @@ class GameSave(metaclass=abc.ABCMeta):
     Unimplemented staticmethods:
 
     `defaults()`
+
+    Set `COMPRESSION` to `"gzip"`, `"lzma"` or `"zstd"` to compress saved
+    files, optionally with a `COMPRESSION_LEVEL` other than the default of
+    the format (see `compression.DEFAULT_LEVELS`).
     """
+    COMPRESSION: Optional[Compression] = None
+    COMPRESSION_LEVEL: Optional[int] = None
 
     @classmethod
     def __subclasshook__(cls, subclass: Any) -> Any:
@@ -58,9 +81,9 @@ class GameSave(metaclass=abc.ABCMeta):
 
     @classmethod
     def from_file(cls, file: str | Path) -> GameSave:
-        """Instantiates the class from a json file."""
-        with open(file, mode="r") as fp:
-            return cls.from_json(fp.read())
+        """Instantiates the class from a (possibly compressed) json file."""
+        with open_decompressed(file) as fp:
+            return cls._deserialize(json.load(fp))
 
     @classmethod
     def from_json(cls, json_str: str) -> GameSave:
@@ -97,9 +120,80 @@ class GameSave(metaclass=abc.ABCMeta):
         """Returns an instance of the class with default settings."""
         return cls._deserialize(cls.defaults())
 
+    def summary(self) -> dict[str, Any]:
+        """
+        Returns a small dictionary describing the save (e.g. playtime or
+        level) that is stored in the save catalog. Override this, defaults to
+        an empty dictionary.
+        """
+        return {}
+
     def save_to_file(self, file: str | Path) -> None:
-        with open(file, "w") as fp:
-            json.dump(self._serialize(), fp)
+        """Atomically writes the serialized object to a json file."""
+        atomic_write(file, _json_writer(
+            self._serialize(), self.COMPRESSION, self.COMPRESSION_LEVEL
+        ))
+
+    def save_to_file_async(
+        self,
+        file: str | Path,
+        callback: Optional[WriteCallback] = None,
+    ) -> None:
+        """
+        Like `save_to_file()`, but only takes a snapshot of the serialized
+        object on the calling thread. Encoding and writing happen in the
+        background. `callback` is called from the writer thread with the path
+        once the file has been written.
+        """
+        snapshot = copy.deepcopy(self._serialize())
+        get_save_writer().submit(file, _json_writer(
+            snapshot, self.COMPRESSION, self.COMPRESSION_LEVEL
+        ), callback)
+
+
+def _json_writer(
+    dictionary: dict[str, Any],
+    compression: Optional[Compression] = None,
+    level: Optional[int] = None,
+) -> WriteFunc:
+    def write(fp: BinaryIO) -> None:
+        # `json.dump()` streams using the slow pure Python encoder, while
+        # encoding everything with `json.dumps()` at once needs the whole
+        # string in memory. Encoding one top-level entry at a time is fast
+        # and keeps only the biggest entry in memory.
+        with compressed_writer(fp, compression, level) as out:
+            out.write(b"{")
+            for i, (key, value) in enumerate(dictionary.items()):
+                if i:
+                    out.write(b", ")
+                out.write(json.dumps({key: value})[1:-1].encode("utf-8"))
+            out.write(b"}")
+    return write
+
+
+def game_save_path(extension: str, profile: Optional[str] = None) -> Path:
+    """
+    Returns the path of a save in the standard directory, i.e.
+    `DATA_PATH/saves/gamesave.<extension>` or
+    `DATA_PATH/saves/gamesave_<profile>.<extension>`.
+    """
+    filename = (
+        f"gamesave.{extension}" if not profile
+        else f"gamesave_{profile}.{extension}"
+    )
+    return paths.DATA_PATH / "saves" / filename
+
+
+def _catalog_save(
+    file: Path,
+    profile: Optional[str],
+    summary: dict[str, Any],
+) -> None:
+    # The save itself succeeded at this point, so don't raise
+    try:
+        get_save_catalog(file.parent).record(file, profile, summary)
+    except Exception:
+        logger.error(f"Failed to catalog save `{file}`.", exc_info=True)
 
 
 def load_game_save(
@@ -110,8 +204,7 @@ def load_game_save(
     Load GameSave object from standard directory.
     Optionally takes a profile name to support multiple accounts/profiles.
     """
-    filename = "gamesave.json" if not profile else f"gamesave_{profile}.json"
-    return game_save_class.from_file(DATA_PATH / "saves" / filename)
+    return game_save_class.from_file(game_save_path("json", profile))
 
 
 def save_game_save(game_save: GameSave, profile: Optional[str] = None) -> None:
@@ -119,9 +212,31 @@ def save_game_save(game_save: GameSave, profile: Optional[str] = None) -> None:
     Save the given GameSave object to the standard directory.
     Optionally takes a profile name to suppport multiple accounts/profiles.
     """
-    filename = "gamesave.json" if not profile else f"gamesave_{profile}.json"
-    (DATA_PATH / "saves").mkdir(exist_ok=True)
-    game_save.save_to_file(DATA_PATH / "saves" / filename)
+    file = game_save_path("json", profile)
+    file.parent.mkdir(exist_ok=True)
+    game_save.save_to_file(file)
+    _catalog_save(file, profile, game_save.summary())
+
+
+def save_game_save_async(
+    game_save: GameSave,
+    profile: Optional[str] = None,
+    callback: Optional[WriteCallback] = None,
+) -> None:
+    """
+    Like `save_game_save()`, but writes in the background. See
+    `GameSave.save_to_file_async()`.
+    """
+    file = game_save_path("json", profile)
+    file.parent.mkdir(exist_ok=True)
+    summary = copy.deepcopy(game_save.summary())
+
+    def on_written(file: Path) -> None:
+        _catalog_save(file, profile, summary)
+        if callback:
+            callback(file)
+
+    game_save.save_to_file_async(file, on_written)
 
 
 class PickleGameSave(metaclass=abc.ABCMeta):
@@ -135,7 +250,13 @@ class PickleGameSave(metaclass=abc.ABCMeta):
     Unimplemented staticmethods:
 
     `defaults()`
+
+    Set `COMPRESSION` to `"gzip"`, `"lzma"` or `"zstd"` to compress saved
+    files, optionally with a `COMPRESSION_LEVEL` other than the default of
+    the format (see `compression.DEFAULT_LEVELS`).
     """
+    COMPRESSION: Optional[Compression] = None
+    COMPRESSION_LEVEL: Optional[int] = None
 
     @classmethod
     def __subclasshook__(cls, subclass: Any) -> Any:
@@ -161,14 +282,17 @@ class PickleGameSave(metaclass=abc.ABCMeta):
 
     @classmethod
     def from_file(cls, file: str | Path) -> PickleGameSave:
-        """Instantiates the class from a pickle file."""
-        with open(file, mode="rb") as fp:
-            return cls.from_pickle(fp.read())
+        """Instantiates the class from a (possibly compressed) pickle file."""
+        with open_decompressed(file) as fp:
+            return cls._with_missing_defaults(pickle.load(fp))
 
     @classmethod
     def from_pickle(cls, pickle_byte_str: bytes) -> PickleGameSave:
         """Instantiates the class from a pickle bytestring."""
-        new: PickleGameSave = pickle.loads(pickle_byte_str)
+        return cls._with_missing_defaults(pickle.loads(pickle_byte_str))
+
+    @classmethod
+    def _with_missing_defaults(cls, new: PickleGameSave) -> PickleGameSave:
         for key, value in cls.defaults().items():
             if not hasattr(new, key):
                 setattr(new, key, value)  # Basic backwards compatibility
@@ -194,9 +318,45 @@ class PickleGameSave(metaclass=abc.ABCMeta):
         defaults = cls.defaults()
         return cls(**defaults)
 
+    def summary(self) -> dict[str, Any]:
+        """
+        Returns a small dictionary describing the save (e.g. playtime or
+        level) that is stored in the save catalog. Override this, defaults to
+        an empty dictionary.
+        """
+        return {}
+
     def save_to_file(self, file: str | Path) -> None:
-        with open(file, "wb") as fp:
-            pickle.dump(self, fp)
+        """Atomically pickles the object into a file."""
+        def write(fp: BinaryIO) -> None:
+            with compressed_writer(
+                fp, self.COMPRESSION, self.COMPRESSION_LEVEL
+            ) as out:
+                pickle.dump(self, out)
+
+        atomic_write(file, write)
+
+    def save_to_file_async(
+        self,
+        file: str | Path,
+        callback: Optional[WriteCallback] = None,
+    ) -> None:
+        """
+        Like `save_to_file()`, but writes in the background. `callback` is
+        called from the writer thread with the path once the file has been
+        written.
+        The object is pickled on the calling thread, as pickling is the
+        cheapest way to snapshot an arbitrary object graph. Compression
+        happens in the background.
+        """
+        data = pickle.dumps(self)
+        compression, level = self.COMPRESSION, self.COMPRESSION_LEVEL
+
+        def write(fp: BinaryIO) -> None:
+            with compressed_writer(fp, compression, level) as out:
+                out.write(data)
+
+        get_save_writer().submit(file, write, callback)
 
 
 def load_pickle_game_save(
@@ -207,8 +367,7 @@ def load_pickle_game_save(
     Load PickleGameSave object from standard directory.
     Optionally takes a profile name to support multiple accounts/profiles.
     """
-    filename = "gamesave.pkl" if not profile else f"gamesave_{profile}.pkl"
-    return game_save_class.from_file(DATA_PATH / "saves" / filename)
+    return game_save_class.from_file(game_save_path("pkl", profile))
 
 
 def save_pickle_game_save(
@@ -219,6 +378,427 @@ def save_pickle_game_save(
     Save the given PickleGameSave object to the standard directory.
     Optionally takes a profile name to support multiple accounts/profiles.
     """
-    filename = "gamesave.pkl" if not profile else f"gamesave_{profile}.pkl"
-    (DATA_PATH / "saves").mkdir(exist_ok=True)
-    game_save.save_to_file(DATA_PATH / "saves" / filename)
+    file = game_save_path("pkl", profile)
+    file.parent.mkdir(exist_ok=True)
+    game_save.save_to_file(file)
+    _catalog_save(file, profile, game_save.summary())
+
+
+def save_pickle_game_save_async(
+    game_save: PickleGameSave,
+    profile: Optional[str] = None,
+    callback: Optional[WriteCallback] = None,
+) -> None:
+    """
+    Like `save_pickle_game_save()`, but writes in the background. See
+    `PickleGameSave.save_to_file_async()`.
+    """
+    file = game_save_path("pkl", profile)
+    file.parent.mkdir(exist_ok=True)
+    summary = copy.deepcopy(game_save.summary())
+
+    def on_written(file: Path) -> None:
+        _catalog_save(file, profile, summary)
+        if callback:
+            callback(file)
+
+    game_save.save_to_file_async(file, on_written)
+
+
+# Binary save layout (format version 2):
+# header | summary length | summary | index length | index | fields...
+# The index maps every field to its offset and length relative to the first
+# field, so single fields can be decoded without touching the others.
+# Format version 1 consisted of the header and the whole dictionary.
+
+# Magic bytes, format version, schema version
+_BINARY_HEADER = struct.Struct("<4sHI")
+_BINARY_LENGTH = struct.Struct("<I")
+_BINARY_MAGIC = b"CMES"
+_BINARY_FORMAT_VERSION = 2
+
+
+class BinaryGameSave(metaclass=abc.ABCMeta):
+    """
+    Interface class for managing game saves and serializing them into a
+    compact binary format (see the `codec` module). Smaller than `GameSave`
+    and, unlike `PickleGameSave`, not tied to the class layout. It's only
+    faster than `GameSave` with the `msgpack` extra installed, the pure
+    Python codec used otherwise is slower than the json module.
+
+    Every file starts with a small summary returned by `summary()`, which can
+    be read without loading the save, e.g. for a save slot menu (see
+    `read_binary_save_summary()` and `LazyBinarySave`).
+
+    Every file stores the `SCHEMA_VERSION` of the class that wrote it. When
+    loading an older file, the serialized dictionary is passed through
+    `MIGRATIONS`, which maps a schema version to a function migrating a
+    dictionary of that version to the next one:
+
+    ```python
+    class MyGameSave(BinaryGameSave):
+        SCHEMA_VERSION = 2
+        MIGRATIONS = {1: lambda old: {**old, "coins": 0}}
+    ```
+
+    Subclass this and implement the unimplemented methods:
+
+    `update()`, `_serialize()`
+
+    Unimplemented classmethods:
+
+    `_deserialize()`
+
+    Unimplemented staticmethods:
+
+    `defaults()`
+    """
+
+    SCHEMA_VERSION: int = 1
+    MIGRATIONS: dict[int, Callable[[dict[str, Any]], dict[str, Any]]] = {}
+
+    @classmethod
+    def __subclasshook__(cls, subclass: Any) -> Any:
+        return (
+            hasattr(subclass, "from_file")
+            and callable(subclass.from_file)
+            and hasattr(subclass, "from_bytes")
+            and callable(subclass.from_bytes)
+            and hasattr(subclass, "defaults")
+            and callable(subclass.defaults)
+            and hasattr(subclass, "_deserialize")
+            and callable(subclass._deserialize)
+            and hasattr(subclass, "_serialize")
+            and callable(subclass._serialize)
+            and hasattr(subclass, "update")
+            and callable(subclass.update)
+            and hasattr(subclass, "with_defaults")
+            and callable(subclass.with_defaults)
+            and hasattr(subclass, "save_to_file")
+            and callable(subclass.save_to_file)
+            or NotImplemented
+        )
+
+    @classmethod
+    def from_file(cls, file: str | Path) -> BinaryGameSave:
+        """Instantiates the class from a binary save file."""
+        with open(file, mode="rb") as fp:
+            return cls.from_bytes(fp.read())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> BinaryGameSave:
+        """Instantiates the class from a binary save."""
+        format_version, schema_version = _check_binary_header(
+            data[:_BINARY_HEADER.size]
+        )
+        if format_version == 1:
+            dictionary = codec.unpackb(data[_BINARY_HEADER.size:])
+        else:
+            view = memoryview(data)
+            pos = _BINARY_HEADER.size
+            summary_length, = _BINARY_LENGTH.unpack_from(view, pos)
+            pos += _BINARY_LENGTH.size + summary_length
+            index_length, = _BINARY_LENGTH.unpack_from(view, pos)
+            pos += _BINARY_LENGTH.size
+            index = codec.unpackb(view[pos:pos + index_length])
+            body = pos + index_length
+            dictionary = {
+                key: codec.unpackb(
+                    view[body + offset:body + offset + length]
+                )
+                for key, (offset, length) in index.items()
+            }
+        return cls._deserialize(cls.migrate(dictionary, schema_version))
+
+    @classmethod
+    def migrate(
+        cls,
+        dictionary: dict[str, Any],
+        schema_version: int,
+    ) -> dict[str, Any]:
+        """
+        Brings a serialized dictionary of `schema_version` up to the current
+        `SCHEMA_VERSION` using `MIGRATIONS`. Override for custom behavior.
+        """
+        if schema_version > cls.SCHEMA_VERSION:
+            raise ValueError(
+                f"Save has schema version {schema_version}, but "
+                f"{cls.__name__} only supports up to {cls.SCHEMA_VERSION}."
+            )
+        while schema_version < cls.SCHEMA_VERSION:
+            try:
+                migration = cls.MIGRATIONS[schema_version]
+            except KeyError:
+                raise ValueError(
+                    f"{cls.__name__} is missing a migration from schema "
+                    f"version {schema_version}."
+                )
+            dictionary = migration(dictionary)
+            schema_version += 1
+        return dictionary
+
+    @staticmethod
+    @abc.abstractmethod
+    def defaults() -> dict[str, Any]:
+        """
+        Returns a dictionary containing a serialized BinaryGameSave object
+        with default values.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def _deserialize(cls, dictionary: dict[str, Any]) -> BinaryGameSave:
+        """Instantiates the class from a serialized dictionary."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _serialize(self) -> dict[str, Any]:
+        """Serializes the object into a dictionary."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update(self, **kwargs: Any) -> None:
+        """Updates multiple entries at once."""
+        raise NotImplementedError
+
+    @classmethod
+    def with_defaults(cls) -> BinaryGameSave:
+        """Returns an instance of the class with default settings."""
+        return cls._deserialize(cls.defaults())
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Returns a small dictionary stored in front of the save and in the
+        save catalog, e.g. playtime, level or a thumbnail. Override this,
+        defaults to an empty dictionary.
+        """
+        return {}
+
+    def to_bytes(self) -> bytes:
+        """Serializes the object into the binary save format."""
+        return _binary_encode(
+            self.SCHEMA_VERSION, self._serialize(), self.summary()
+        )
+
+    def save_to_file(self, file: str | Path) -> None:
+        """Atomically writes the serialized object to a binary file."""
+        data = self.to_bytes()
+        atomic_write(file, lambda fp: fp.write(data))
+
+    def save_to_file_async(
+        self,
+        file: str | Path,
+        callback: Optional[WriteCallback] = None,
+    ) -> None:
+        """
+        Like `save_to_file()`, but only takes a snapshot of the serialized
+        object on the calling thread. Encoding and writing happen in the
+        background. `callback` is called from the writer thread with the path
+        once the file has been written.
+        """
+        snapshot = copy.deepcopy(self._serialize())
+        summary = copy.deepcopy(self.summary())
+        schema_version = self.SCHEMA_VERSION
+        get_save_writer().submit(
+            file,
+            lambda fp: fp.write(
+                _binary_encode(schema_version, snapshot, summary)
+            ),
+            callback,
+        )
+
+
+def _binary_encode(
+    schema_version: int,
+    dictionary: dict[str, Any],
+    summary: dict[str, Any],
+) -> bytes:
+    fields = [codec.packb(value) for value in dictionary.values()]
+    index = {}
+    offset = 0
+    for key, field in zip(dictionary, fields):
+        index[key] = (offset, len(field))
+        offset += len(field)
+    summary_bytes = codec.packb(summary)
+    index_bytes = codec.packb(index)
+    return b"".join((
+        _BINARY_HEADER.pack(
+            _BINARY_MAGIC, _BINARY_FORMAT_VERSION, schema_version
+        ),
+        _BINARY_LENGTH.pack(len(summary_bytes)),
+        summary_bytes,
+        _BINARY_LENGTH.pack(len(index_bytes)),
+        index_bytes,
+        *fields,
+    ))
+
+
+def _check_binary_header(header: bytes) -> tuple[int, int]:
+    """Returns format and schema version of a binary save header."""
+    if len(header) < _BINARY_HEADER.size:
+        raise ValueError("Not a binary game save.")
+    magic, format_version, schema_version = _BINARY_HEADER.unpack(header)
+    if magic != _BINARY_MAGIC:
+        raise ValueError("Not a binary game save.")
+    if format_version > _BINARY_FORMAT_VERSION:
+        raise ValueError(
+            f"Binary save format version {format_version} is not "
+            "supported by this version of the engine."
+        )
+    return format_version, schema_version
+
+
+class LazyBinarySave:
+    """
+    Read-only view of a binary save file that only decodes what is accessed.
+    Opening it reads the header and the summary, the field index is read on
+    first field access and every field is decoded on first access.
+
+    Fields are returned as stored, without applying migrations. Use `load()`
+    to get a fully loaded and migrated BinaryGameSave instance.
+    """
+    def __init__(self, file: str | Path) -> None:
+        self.file = Path(file)
+        with open(self.file, "rb") as fp:
+            self.format_version, self.schema_version = _check_binary_header(
+                fp.read(_BINARY_HEADER.size)
+            )
+            self.summary: dict[str, Any] = {}
+            if self.format_version >= 2:
+                self.summary = codec.unpackb(_read_length_prefixed(fp))
+            self._index_offset = fp.tell()
+        self._index: Optional[dict[str, tuple[int, int]]] = None
+        self._body_offset = 0
+        self._fields: dict[str, Any] = {}
+
+    def __contains__(self, field: object) -> bool:
+        return field in self._get_index()
+
+    def __getitem__(self, field: str) -> Any:
+        index = self._get_index()
+        try:
+            return self._fields[field]
+        except KeyError:
+            pass
+        offset, length = index[field]
+        with open(self.file, "rb") as fp:
+            fp.seek(self._body_offset + offset)
+            value = codec.unpackb(fp.read(length))
+        self._fields[field] = value
+        return value
+
+    def get(self, field: str, default: Any = None) -> Any:
+        try:
+            return self[field]
+        except KeyError:
+            return default
+
+    def fields(self) -> list[str]:
+        """The names of all fields stored in the file."""
+        return list(self._get_index())
+
+    def load(
+        self,
+        game_save_class: type[BinaryGameSave],
+    ) -> BinaryGameSave:
+        """Fully load the save file as `game_save_class`."""
+        return game_save_class.from_file(self.file)
+
+    def _get_index(self) -> dict[str, tuple[int, int]]:
+        if self._index is not None:
+            return self._index
+        if self.format_version == 1:
+            # Old saves have no index, so everything has to be decoded
+            with open(self.file, "rb") as fp:
+                fp.seek(_BINARY_HEADER.size)
+                self._fields = codec.unpackb(fp.read())
+            self._index = {key: (0, 0) for key in self._fields}
+            return self._index
+        with open(self.file, "rb") as fp:
+            fp.seek(self._index_offset)
+            self._index = codec.unpackb(_read_length_prefixed(fp))
+            self._body_offset = fp.tell()
+        return self._index
+
+
+def _read_length_prefixed(fp: BinaryIO) -> bytes:
+    length, = _BINARY_LENGTH.unpack(fp.read(_BINARY_LENGTH.size))
+    return fp.read(length)
+
+
+def read_binary_save_summary(file: str | Path) -> dict[str, Any]:
+    """
+    Read only the summary of a binary save file, without loading the rest.
+    Saves written before summaries existed return an empty dictionary.
+    """
+    with open(file, "rb") as fp:
+        format_version, _ = _check_binary_header(fp.read(_BINARY_HEADER.size))
+        if format_version == 1:
+            return {}
+        summary: dict[str, Any] = codec.unpackb(_read_length_prefixed(fp))
+        return summary
+
+
+def list_binary_game_saves() -> dict[Optional[str], dict[str, Any]]:
+    """
+    Returns the summaries of all binary game saves in the standard directory
+    by profile name. The default save without profile is listed as `None`.
+    Only the summaries are read.
+    """
+    summaries: dict[Optional[str], dict[str, Any]] = {}
+    for file in sorted(game_save_path("bin").parent.glob("gamesave*.bin")):
+        if file.stem == "gamesave":
+            profile = None
+        elif file.stem.startswith("gamesave_"):
+            profile = file.stem.removeprefix("gamesave_")
+        else:
+            continue
+        summaries[profile] = read_binary_save_summary(file)
+    return summaries
+
+
+def load_binary_game_save(
+    game_save_class: type[BinaryGameSave],
+    profile: Optional[str] = None,
+) -> BinaryGameSave:
+    """
+    Load BinaryGameSave object from standard directory.
+    Optionally takes a profile name to support multiple accounts/profiles.
+    """
+    return game_save_class.from_file(game_save_path("bin", profile))
+
+
+def save_binary_game_save(
+    game_save: BinaryGameSave,
+    profile: Optional[str] = None
+) -> None:
+    """
+    Save the given BinaryGameSave object to the standard directory.
+    Optionally takes a profile name to support multiple accounts/profiles.
+    """
+    file = game_save_path("bin", profile)
+    file.parent.mkdir(exist_ok=True)
+    game_save.save_to_file(file)
+    _catalog_save(file, profile, game_save.summary())
+
+
+def save_binary_game_save_async(
+    game_save: BinaryGameSave,
+    profile: Optional[str] = None,
+    callback: Optional[WriteCallback] = None,
+) -> None:
+    """
+    Like `save_binary_game_save()`, but writes in the background. See
+    `BinaryGameSave.save_to_file_async()`.
+    """
+    file = game_save_path("bin", profile)
+    file.parent.mkdir(exist_ok=True)
+    summary = copy.deepcopy(game_save.summary())
+
+    def on_written(file: Path) -> None:
+        _catalog_save(file, profile, summary)
+        if callback:
+            callback(file)
+
+    game_save.save_to_file_async(file, on_written)
@@ -4,19 +4,30 @@ optionally with multiple accounts/profiles as well as convenience functions.
 
 Register your implementation using the `register_custom_settings_class()`
 decorator.
+
+Settings edited live (e.g. by sliders in a settings menu) should be changed
+through a `SettingsTracker`, which only notifies the subsystems whose keys
+changed and writes the file in the background once editing has settled.
 """
 
 
 from __future__ import annotations
 
 import abc
+import atexit
+import contextlib
+import copy
 import json
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional
 
 from cme import logger
 
-from .paths import SETTINGS_PATH
+from . import paths
+from .writer import atomic_write
 
 # Saves a custom Settings class provided by the user
 CUSTOM_SETTINGS_CLASS: Optional[type[Settings]] = None
@@ -110,8 +121,283 @@ class Settings(metaclass=abc.ABCMeta):
         return cls._deserialize(cls.defaults())
 
     def save_to_file(self, file: str | Path) -> None:
-        with open(file, "w") as fp:
-            json.dump(self._serialize(), fp)
+        """Atomically writes the serialized object to a json file."""
+        _write_settings(file, self._serialize())
+
+
+def _write_settings(file: str | Path, dictionary: dict[str, Any]) -> None:
+    data = json.dumps(dictionary).encode("utf-8")
+
+    def write(fp: BinaryIO) -> None:
+        fp.write(data)
+
+    atomic_write(file, write)
+
+
+SettingsObserver = Callable[[Settings, set[str]], None]
+SettingsHandler = Callable[[dict[str, Any]], None]
+
+_MISSING = object()
+# Trackers with pending writes are flushed on interpreter shutdown
+_TRACKERS: weakref.WeakSet[SettingsTracker] = weakref.WeakSet()
+
+
+class SettingsTracker:
+    """
+    Tracks changes of a Settings object by comparing snapshots of its
+    serialized dictionary, so only the top-level keys that actually changed
+    are reported.
+
+    Observers are called with the settings and the set of changed keys on
+    the thread that made the change, optionally only if one of the keys they
+    are interested in changed. Register one observer per subsystem instead of
+    calling `Settings.apply()` for everything.
+
+    Handlers subscribed to specific keys using `subscribe()` are called with
+    the new serialized values of just these keys. Changes made inside a
+    `batch()` are reported once when the batch ends, so a handler subscribed
+    to several keys that changed together only runs once.
+
+    Changes are written to `file` on a background thread once no further
+    change was made for `delay` seconds, and only if anything changed since
+    the last write. The thread only runs while a write is pending, every
+    change pushes its deadline back.
+
+    ```python
+    tracker = SettingsTracker(settings)
+
+    @tracker.subscribe("fullscreen", "vsync")
+    def apply_window(changes):
+        ...  # Only recreates the window if one of these changed
+
+    # In a slider's on_change()
+    tracker.update(volume=event.new_value)
+
+    with tracker.batch():
+        tracker.update(fullscreen=True)
+        tracker.update(vsync=False)  # apply_window() runs once after this
+    ```
+    """
+    def __init__(
+        self,
+        settings: Settings,
+        profile: Optional[str] = None,
+        file: Optional[str | Path] = None,
+        delay: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Without `file`, the settings are written to the file `save_settings()`
+        uses for `profile`.
+        """
+        self.settings = settings
+        self.file = Path(file) if file is not None else _settings_path(
+            profile
+        )
+        self.delay = delay
+        self.clock = clock
+        self._snapshot = copy.deepcopy(settings._serialize())
+        self._observers: list[tuple[SettingsObserver, Optional[set[str]]]] = []
+        # key -> handlers, so dispatch only looks at the changed keys
+        self._subscriptions: dict[str, list[SettingsHandler]] = {}
+        self._batch_depth = 0
+        self._batch_changed: set[str] = set()
+        self._dirty: set[str] = set()
+        self._lock = threading.Lock()
+        # Notified when the deadline of the pending write changes
+        self._cond = threading.Condition(self._lock)
+        # Held while writing, so the lock above is never held during I/O
+        self._write_lock = threading.Lock()
+        self._deadline: Optional[float] = None
+        self._writer: Optional[threading.Thread] = None
+        _TRACKERS.add(self)
+
+    @property
+    def dirty(self) -> set[str]:
+        """Keys changed since the settings were last written."""
+        with self._lock:
+            return set(self._dirty)
+
+    def add_observer(
+        self,
+        observer: SettingsObserver,
+        keys: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Call `observer` whenever settings change. If `keys` is given, only
+        when at least one of these keys changed.
+        """
+        self._observers.append(
+            (observer, set(keys) if keys is not None else None)
+        )
+
+    def remove_observer(self, observer: SettingsObserver) -> None:
+        self._observers = [
+            entry for entry in self._observers if entry[0] != observer
+        ]
+
+    def subscribe(
+        self,
+        *keys: str,
+    ) -> Callable[[SettingsHandler], SettingsHandler]:
+        """
+        Decorator subscribing a handler to one or more keys. The handler is
+        called with a dictionary of the subscribed keys that changed and their
+        new serialized values.
+        """
+        if not keys:
+            raise ValueError("Subscribe to at least one key.")
+
+        def decorator(handler: SettingsHandler) -> SettingsHandler:
+            for key in keys:
+                self._subscriptions.setdefault(key, []).append(handler)
+            return handler
+        return decorator
+
+    def unsubscribe(self, handler: SettingsHandler) -> None:
+        """Remove a handler from all keys it is subscribed to."""
+        for key in list(self._subscriptions):
+            handlers = [h for h in self._subscriptions[key] if h != handler]
+            if handlers:
+                self._subscriptions[key] = handlers
+            else:
+                del self._subscriptions[key]
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer notifying observers and handlers until the outermost batch
+        ends, then notify them once about all keys that changed.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_changed:
+                changed, self._batch_changed = self._batch_changed, set()
+                self._notify(changed)
+
+    def update(self, *args: Any, **kwargs: Any) -> set[str]:
+        """
+        Calls `Settings.update()` and handles the resulting changes, see
+        `changed()`.
+        """
+        self.settings.update(*args, **kwargs)
+        return self.changed()
+
+    def changed(self, *keys: str) -> set[str]:
+        """
+        Call after modifying the settings directly. Detects which keys
+        changed, notifies the observers and schedules a write. Pass `keys` to
+        report keys as changed even if their serialized value is the same.
+        Returns the changed keys.
+        """
+        snapshot = copy.deepcopy(self.settings._serialize())
+        changed = set(keys)
+        for key in snapshot.keys() | self._snapshot.keys():
+            if snapshot.get(key, _MISSING) != self._snapshot.get(
+                key, _MISSING
+            ):
+                changed.add(key)
+        if not changed:
+            return changed
+
+        with self._cond:
+            self._snapshot = snapshot
+            self._dirty |= changed
+            # Delays the write until changes settle
+            self._deadline = self.clock() + self.delay
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer,
+                    name="cme-settings-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+            self._cond.notify()
+
+        if self._batch_depth:
+            self._batch_changed |= changed
+        else:
+            self._notify(changed)
+        return changed
+
+    def _notify(self, changed: set[str]) -> None:
+        for observer, observed in list(self._observers):
+            if observed is None or observed & changed:
+                try:
+                    observer(self.settings, changed)
+                except Exception:
+                    logger.error(
+                        f"Settings observer {observer!r} failed.",
+                        exc_info=True,
+                    )
+
+        # Every handler is called once, with all of its keys that changed
+        handler_changes: dict[SettingsHandler, dict[str, Any]] = {}
+        for key in sorted(changed):
+            for handler in self._subscriptions.get(key, ()):
+                handler_changes.setdefault(handler, {})[key] = (
+                    self._snapshot.get(key)
+                )
+        for handler, changes in handler_changes.items():
+            try:
+                handler(changes)
+            except Exception:
+                logger.error(
+                    f"Settings handler {handler!r} failed.", exc_info=True
+                )
+
+    def flush(self) -> None:
+        """Write pending changes immediately."""
+        with self._cond:
+            self._deadline = None
+            self._cond.notify()
+        self._write()
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._cond:
+                while (
+                    self._deadline is not None
+                    and self._deadline > self.clock()
+                ):
+                    self._cond.wait(self._deadline - self.clock())
+                if self._deadline is None:
+                    # Flushed, a later change starts a new thread
+                    self._writer = None
+                    return
+                self._deadline = None
+            self._write()
+
+    def _write(self) -> None:
+        with self._write_lock:
+            # Snapshots are replaced, never mutated, so writing one outside
+            # the lock is safe
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = self._snapshot
+            try:
+                self.file.parent.mkdir(parents=True, exist_ok=True)
+                _write_settings(self.file, snapshot)
+            except Exception:
+                logger.error(
+                    f"Failed to write settings to `{self.file}`.",
+                    exc_info=True,
+                )
+                return
+            with self._lock:
+                # Otherwise there were changes while writing
+                if self._snapshot is snapshot:
+                    self._dirty.clear()
+
+
+@atexit.register
+def _flush_trackers() -> None:
+    for tracker in list(_TRACKERS):
+        tracker.flush()
 
 
 def register_custom_settings_class(cls: type[Settings]) -> type[Settings]:
@@ -135,8 +421,7 @@ def load_settings(profile: Optional[str] = None) -> Settings:
         raise RuntimeError(
             "Couldn't find a registered implementation of the Settings class."
         )
-    filename = "settings.json" if not profile else f"settings_{profile}.json"
-    return CUSTOM_SETTINGS_CLASS.from_file(SETTINGS_PATH / filename)
+    return CUSTOM_SETTINGS_CLASS.from_file(_settings_path(profile))
 
 
 def save_settings(settings: Settings, profile: Optional[str] = None) -> None:
@@ -144,5 +429,9 @@ def save_settings(settings: Settings, profile: Optional[str] = None) -> None:
     Save the given Settings object.
     Optionally takes a profile name to suppport multiple accounts/profiles.
     """
+    settings.save_to_file(_settings_path(profile))
+
+
+def _settings_path(profile: Optional[str] = None) -> Path:
     filename = "settings.json" if not profile else f"settings_{profile}.json"
-    settings.save_to_file(SETTINGS_PATH / filename)
+    return paths.SETTINGS_PATH / filename
@@ -0,0 +1,220 @@
+"""
+Provides atomic file writes and a background writer thread, used to move
+serialization and disk I/O of saves off the main thread.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import stat
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional, cast
+
+from .. import logger
+
+WriteFunc = Callable[[BinaryIO], Any]
+WriteCallback = Callable[[Path], None]
+
+# (path, size, mtime in ns, crc32) of the last atomic write of each thread
+_last_write = threading.local()
+
+
+class _ChecksumFile:
+    """Forwards writes to `fp` and keeps the crc32 of everything written."""
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+        self.crc = 0
+
+    def write(self, data: Any) -> int:
+        written = self._fp.write(data)
+        self.crc = zlib.crc32(memoryview(data)[:written], self.crc)
+        return written
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fp, name)
+
+
+def atomic_write(file: str | Path, write: WriteFunc) -> None:
+    """
+    Write a file without ever leaving a partially written file behind.
+    `write` gets a binary file object of a temporary file in the same
+    directory, which is fsynced and then renamed over `file`. If anything
+    fails the original file stays untouched. The written file keeps the
+    permissions of the file it replaces, new files get the default ones.
+    The crc32 of the written bytes is available from `last_checksum()`.
+    """
+    file = Path(file)
+    fd, tmp_name = _create_temp(file)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            checksum_fp = _ChecksumFile(fp)
+            write(cast(BinaryIO, checksum_fp))
+            fp.flush()
+            os.fsync(fp.fileno())
+            written = os.fstat(fp.fileno())
+        mode = _file_mode(file)
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, file)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    _fsync_dir(file.parent)
+    _last_write.entry = (
+        file, written.st_size, written.st_mtime_ns, checksum_fp.crc
+    )
+
+
+def last_checksum(file: str | Path) -> Optional[int]:
+    """
+    The crc32 of the last `atomic_write()` of this thread, if it wrote
+    `file` and the file hasn't changed since. It can only be retrieved once.
+    Callbacks of `BackgroundWriter` run on the thread that wrote the file,
+    so they can use this as well.
+    """
+    entry: Optional[tuple[Path, int, int, int]] = getattr(
+        _last_write, "entry", None
+    )
+    if entry is None or entry[0] != Path(file):
+        return None
+    _last_write.entry = None
+    written_file, size, mtime_ns, crc = entry
+    try:
+        current = written_file.stat()
+    except OSError:
+        return None
+    if (current.st_size, current.st_mtime_ns) != (size, mtime_ns):
+        return None
+    return crc
+
+
+def _create_temp(file: Path) -> tuple[int, str]:
+    """
+    Like `tempfile.mkstemp()`, but with the default permissions (the umask
+    applied to 0o666) instead of ones only allowing the owner to read.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(tempfile.TMP_MAX):
+        name = str(file.with_name(f".{file.name}.{os.urandom(4).hex()}.tmp"))
+        try:
+            return os.open(name, flags, 0o666), name
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No unused temporary file name for `{file}`.")
+
+
+def _file_mode(file: Path) -> Optional[int]:
+    """The permissions of `file`, None if it doesn't exist."""
+    try:
+        return stat.S_IMODE(file.stat().st_mode)
+    except FileNotFoundError:
+        return None
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Make the rename itself durable. Not supported on Windows."""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class BackgroundWriter:
+    """
+    Writes files atomically on a background thread.
+
+    Writes to a file that is still waiting in the queue are coalesced: Only
+    the most recently submitted write is executed, and the callbacks of all
+    coalesced writes are called after it has finished. Callbacks are called
+    from the writer thread with the written path as only argument. Failed
+    writes are logged and don't call their callbacks.
+    """
+    def __init__(self, name: str = "cme-background-writer") -> None:
+        self.name = name
+        self._pending: dict[Path, tuple[WriteFunc, list[WriteCallback]]] = {}
+        self._cond = threading.Condition()
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(
+        self,
+        file: str | Path,
+        write: WriteFunc,
+        callback: Optional[WriteCallback] = None,
+    ) -> None:
+        """Queue an atomic write of `file`, see `atomic_write()`."""
+        file = Path(file)
+        with self._cond:
+            callbacks = []
+            if file in self._pending:
+                callbacks = self._pending.pop(file)[1]
+            if callback:
+                callbacks.append(callback)
+            self._pending[file] = (write, callbacks)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until all queued writes are done. Returns False if `timeout`
+        seconds have passed before.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: bool(self._pending))
+                file = next(iter(self._pending))
+                write, callbacks = self._pending.pop(file)
+                self._busy = True
+            try:
+                atomic_write(file, write)
+            except Exception:
+                logger.error(
+                    f"Background write of `{file}` failed.", exc_info=True
+                )
+            else:
+                for callback in callbacks:
+                    try:
+                        callback(file)
+                    except Exception:
+                        logger.error(
+                            f"Callback for background write of `{file}` "
+                            "failed.",
+                            exc_info=True,
+                        )
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+# Shared by all saves so rapid successive saves of one file coalesce
+_SAVE_WRITER: Optional[BackgroundWriter] = None
+
+
+def get_save_writer() -> BackgroundWriter:
+    """
+    Returns the writer used by asynchronous saves. It is flushed on
+    interpreter shutdown so queued saves aren't lost.
+    """
+    global _SAVE_WRITER
+    if _SAVE_WRITER is None:
+        _SAVE_WRITER = BackgroundWriter("cme-save-writer")
+        atexit.register(_SAVE_WRITER.flush)
+    return _SAVE_WRITER
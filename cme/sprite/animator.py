@@ -1,5 +1,6 @@
 from typing import Any, Callable, Iterable, Union
 
+from ..logger.instrumentation import instrumented
 from .sprite import Sprite
 
 
@@ -20,15 +21,23 @@ class Animator:
         self.callback = callback
         self._dest_attrs = kwargs
         self._original_attrs = self._cur_attrs(obj, kwargs)
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the destination values have been reached."""
+        return self._finished
 
     @staticmethod
     def _cur_attrs(obj: Any, attrs: Iterable[str]) -> dict[str, float]:
         return {k: getattr(obj, k) for k in attrs}
 
+    @instrumented()
     def update(self, delta_time: float) -> None:
         if self._remaining_seconds <= delta_time:
             for k, v in self._dest_attrs.items():
                 setattr(self._obj, k, v)
+            self._finished = True
             self.callback(self)
             return
         self._remaining_seconds -= delta_time
@@ -14,6 +14,7 @@ from arcade.types import Rect
 
 from .. import logger
 from ..enums import Facing
+from ..logger.instrumentation import instrumented
 from ..texture import load_texture
 from ..utils import point_in_rect
 
@@ -26,7 +27,13 @@ class Updater:
 class SimpleUpdater(Updater):
     """Just move, taking delta_time into account."""
 
+    @instrumented()
     def update(self, sprite: arcade.Sprite, delta_time: float) -> None:
+        self._move(sprite, delta_time)
+
+    @staticmethod
+    def _move(sprite: arcade.Sprite, delta_time: float) -> None:
+        # Not instrumented, so subclasses aren't counted as SimpleUpdater
         sprite.center_x += sprite.change_x * delta_time
         sprite.center_y += sprite.change_y * delta_time
         sprite.angle += sprite.change_angle * delta_time
@@ -38,8 +45,9 @@ class WallBounceUpdater(SimpleUpdater):
     def __init__(self, border: Rect) -> None:
         self.border = border
 
+    @instrumented()
     def update(self, sprite: arcade.Sprite, delta_time: float) -> None:
-        super().update(sprite, delta_time)
+        self._move(sprite, delta_time)
         if sprite.left < self.border.left:
             sprite.left = self.border.left
             sprite.change_x = -sprite.change_x
@@ -67,6 +75,7 @@ class StrictCollisionUpdater(Updater):
     def __init__(self, walls: arcade.SpriteList[Sprite]):
         self.walls = walls
 
+    @instrumented()
     def update(self, sprite: arcade.Sprite, delta_time: float) -> None:
         sprite.center_x += sprite.change_x * delta_time
         if arcade.check_for_collision_with_list(sprite, self.walls):
@@ -93,6 +102,7 @@ class TopDownUpdater(Updater):
         self.walls = walls
         self.border = border
 
+    @instrumented()
     def update(self, sprite: arcade.Sprite, delta_time: float) -> None:
         prev_x = sprite.center_x
         sprite.center_x += sprite.change_x * delta_time
@@ -256,6 +266,7 @@ class AnimatedSprite(Sprite):
     def animation_speed(self, value: int) -> None:
         self._animation_speed = value
 
+    @instrumented()
     def update_animation(self, delta_time: float = 1 / 60) -> None:
         """
         Updates the current texture by taking the next texture of the current
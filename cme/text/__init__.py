@@ -2,11 +2,14 @@
 from arcade.text import Text as ArcadeText
 from arcade.text import create_text_sprite, draw_text
 
+from .bitmap import BitmapText
+from .layer import TextLayer
 from .text import (HeadlineText, NormalText, PreconfiguredText, Text, center_x,
                    center_y)
 
 __all__ = [
     "ArcadeText",
+    "BitmapText",
     "center_x",
     "center_y",
     "create_text_sprite",
@@ -15,4 +18,5 @@ __all__ = [
     "NormalText",
     "PreconfiguredText",
     "Text",
+    "TextLayer",
 ]
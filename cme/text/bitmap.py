@@ -0,0 +1,170 @@
+"""
+Text drawn from pre-rasterized glyphs, for text changing every frame like
+damage numbers, score tickers and timers.
+
+Unlike `Text`, which lays out its pyglet Label again on every change,
+`BitmapText` is a row of sprites showing glyph textures. Changing the text
+only updates the sprites of the changed characters, and moves the following
+ones if the width changed. Many BitmapTexts can share one SpriteList, which
+draws all of them with a single call.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from arcade import BasicSprite, SpriteList, csscolor
+from arcade.types import Color, RGBOrA255
+
+from ..font.atlas import GlyphAtlas, get_glyph_atlas
+
+
+class BitmapText:
+    """
+    Single line of text at a baseline starting at `x`, `y`. Glyphs are taken
+    from `atlas`, defaulting to the one of the given font.
+
+    Only draw it using `draw()` if it has its own SpriteList, shared lists
+    are drawn by their owner.
+    """
+    def __init__(
+        self,
+        text: str = "",
+        x: float = 0,
+        y: float = 0,
+        color: RGBOrA255 = csscolor.WHITE,
+        font_size: float = 18,
+        font_name: str = "Arial",
+        bold: bool = False,
+        italic: bool = False,
+        sprite_list: Optional[SpriteList[BasicSprite]] = None,
+        atlas: Optional[GlyphAtlas] = None,
+    ) -> None:
+        if atlas is None:
+            atlas = get_glyph_atlas(font_name, font_size, bold, italic)
+        self.atlas = atlas
+        if sprite_list is None:
+            sprite_list = SpriteList()
+        self.sprite_list = sprite_list
+        self._x = x
+        self._y = y
+        self._color = Color.from_iterable(color)
+        self._visible = True
+        self._text = ""
+        self._width = 0.0
+        # Sprites are kept when the text gets shorter, for reuse
+        self._sprites: list[BasicSprite] = []
+        # Pen position of every sprite relative to x
+        self._pens: list[float] = []
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        old = self._text
+        if text == old:
+            return
+        sprites, pens, glyph = self._sprites, self._pens, self.atlas.glyph
+        x, y = self._x, self._y
+        pen = 0.0
+        for i, char in enumerate(text):
+            g = glyph(char)
+            position = (x + pen + g.center_x, y + g.center_y)
+            if i < len(old) and old[i] == char:
+                if pens[i] != pen:
+                    pens[i] = pen
+                    sprites[i].position = position
+            elif i < len(sprites):
+                sprite = sprites[i]
+                sprite.texture = g.texture
+                sprite.position = position
+                sprite.visible = self._visible
+                pens[i] = pen
+            else:
+                sprite = BasicSprite(
+                    g.texture, center_x=position[0], center_y=position[1],
+                    visible=self._visible,
+                )
+                sprite.color = self._color
+                sprites.append(sprite)
+                pens.append(pen)
+                self.sprite_list.append(sprite)
+            pen += g.advance
+        for sprite in sprites[len(text):len(old)]:
+            sprite.visible = False
+        self._text = text
+        self._width = pen
+
+    @property
+    def x(self) -> float:
+        return self._x
+
+    @x.setter
+    def x(self, x: float) -> None:
+        self.position = (x, self._y)
+
+    @property
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, y: float) -> None:
+        self.position = (self._x, y)
+
+    @property
+    def position(self) -> tuple[float, float]:
+        return self._x, self._y
+
+    @position.setter
+    def position(self, position: tuple[float, float]) -> None:
+        dx, dy = position[0] - self._x, position[1] - self._y
+        if not dx and not dy:
+            return
+        self._x, self._y = position
+        for sprite in self._sprites:
+            sprite.position = (
+                sprite.position[0] + dx, sprite.position[1] + dy
+            )
+
+    @property
+    def color(self) -> Color:
+        return self._color
+
+    @color.setter
+    def color(self, color: RGBOrA255) -> None:
+        self._color = Color.from_iterable(color)
+        for sprite in self._sprites:
+            sprite.color = self._color
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, visible: bool) -> None:
+        self._visible = visible
+        for sprite in self._sprites[:len(self._text)]:
+            sprite.visible = visible
+
+    @property
+    def content_width(self) -> float:
+        return self._width
+
+    @property
+    def content_height(self) -> float:
+        return self.atlas.line_height
+
+    def draw(self) -> None:
+        self.sprite_list.draw()
+
+    def delete(self) -> None:
+        """Remove the sprites of the text from its SpriteList."""
+        for sprite in self._sprites:
+            sprite.remove_from_sprite_lists()
+        self._sprites.clear()
+        self._pens.clear()
+        self._text = ""
+        self._width = 0.0
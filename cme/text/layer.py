@@ -0,0 +1,143 @@
+"""
+Draw many texts with a single call.
+
+Texts added to a `TextLayer` share its pyglet Batch, so the whole layer (e.g.
+all HUD texts) is drawn at once instead of text by text. Their draw order is
+determined by `z`, using one Group per z value.
+
+`PreconfiguredText` instances are added to the layer set as `DEFAULT_LAYER`
+on their class automatically.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, TypeVar
+
+import arcade
+from arcade import Text as ArcadeText
+from pyglet.graphics import Batch, Group
+from pyglet.text import Label
+
+TextT = TypeVar("TextT", bound=ArcadeText)
+
+
+class _Deferral:
+    """
+    Document event handlers pausing the layout of a label on its first
+    change. They're pushed after the label's own handlers, so they run first
+    and the label skips laying out.
+    """
+    __slots__ = ("label", "changed", "__weakref__")
+
+    def __init__(self, label: Label) -> None:
+        self.label = label
+        self.changed = False
+
+    def _on_change(self) -> None:
+        if not self.changed:
+            self.changed = True
+            self.label.begin_update()
+
+    def on_insert_text(self, *args: Any) -> None:
+        self._on_change()
+
+    def on_delete_text(self, *args: Any) -> None:
+        self._on_change()
+
+    def on_style_text(
+        self,
+        start: int,
+        end: int,
+        attributes: dict[str, Any],
+    ) -> None:
+        # Labels only update the vertex colors for color changes, which is
+        # cheaper than laying out again
+        if attributes.keys() != {"color"}:
+            self._on_change()
+
+
+class TextLayer:
+    """
+    A shared Batch of texts, drawn with one call to `draw()`. Changing many
+    texts inside `deferred()` lays out only the changed ones, once each.
+    """
+    def __init__(self) -> None:
+        self.batch = Batch()
+        self._groups: dict[int, Group] = {}
+        self._texts: set[ArcadeText] = set()
+        self._deferring = False
+
+    def __contains__(self, text: object) -> bool:
+        return text in self._texts
+
+    def __iter__(self) -> Iterator[ArcadeText]:
+        return iter(list(self._texts))
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def group(self, z: int = 0) -> Group:
+        """The Group of the layer drawing texts at `z`. Higher z on top."""
+        try:
+            return self._groups[z]
+        except KeyError:
+            group = self._groups[z] = Group(order=z)
+            return group
+
+    def add(self, text: TextT, z: Optional[int] = None) -> TextT:
+        """
+        Move a text into the layer and return it. `z` defaults to the z
+        coordinate of the text.
+        """
+        if z is None:
+            z = int(text.z)
+        batch, group = self.batch, self.group(z)
+        if text.batch is not batch or text.group is not group:
+            label = text._label
+            label.begin_update()  # Lay out only once for both changes
+            text.batch = batch
+            text.group = group
+            label.end_update()
+        self._texts.add(text)
+        return text
+
+    def remove(self, text: ArcadeText) -> None:
+        """Remove a text from the layer, it is drawn on its own again."""
+        self._texts.remove(text)
+        text._label.batch = None  # Gives the label its own Batch
+
+    def clear(self) -> None:
+        """Remove all texts from the layer."""
+        for text in self:
+            self.remove(text)
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """
+        Defer laying out the texts of the layer until the block ends. Texts
+        whose text or style changed are laid out once, no matter how often
+        they changed, others not at all. Sizes like `content_width` of
+        changed texts are outdated inside the block.
+        """
+        if self._deferring:  # Nested, the outer block lays out
+            yield
+            return
+        self._deferring = True
+        deferrals = [_Deferral(text._label) for text in self._texts]
+        for deferral in deferrals:
+            deferral.label.document.push_handlers(deferral)
+        try:
+            yield
+        finally:
+            self._deferring = False
+            for deferral in deferrals:
+                deferral.label.document.remove_handlers(deferral)
+            for deferral in deferrals:
+                if deferral.changed:
+                    deferral.label.end_update()
+
+    def draw(self) -> None:
+        """Draw all texts of the layer."""
+        with arcade.get_window().ctx.pyglet_rendering():
+            self.batch.draw()
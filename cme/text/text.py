@@ -7,6 +7,7 @@ from pyglet.graphics import Batch, Group
 
 from .. import logger
 from ..utils import get_optimal_font_size
+from .layer import TextLayer
 
 
 def center_x(text: ArcadeText, width: int) -> None:
@@ -82,6 +83,10 @@ class PreconfiguredText(Text):
 
     You also don't have to provide a text or position at first so you can set
     them later i.e. in an align method.
+
+    Instances are added to `layer`, defaulting to DEFAULT_LAYER, unless a
+    batch is passed. Set e.g. a shared HUD layer as DEFAULT_LAYER to draw all
+    texts of a class with one call to `TextLayer.draw()`.
     """
 
     DEFAULT_FONT_SIZE: float = 0
@@ -94,6 +99,7 @@ class PreconfiguredText(Text):
     DEFAULT_ANCHOR_Y: str = "baseline"
     DEFAULT_MULTILINE: bool = False
     DEFAULT_ROTATION: float = 0
+    DEFAULT_LAYER: Optional[TextLayer] = None
 
     def __init__(
         self,
@@ -114,6 +120,7 @@ class PreconfiguredText(Text):
         batch: Optional[Batch] = None,
         group: Optional[Group] = None,
         z: int = 0,
+        layer: Optional[TextLayer] = None,
     ):
         if font_size is None:
             font_size = self.DEFAULT_FONT_SIZE
@@ -135,6 +142,13 @@ class PreconfiguredText(Text):
             multiline = self.DEFAULT_MULTILINE
         if rotation is None:
             rotation = self.DEFAULT_ROTATION
+        if layer is None:
+            layer = self.DEFAULT_LAYER
+        if layer is not None and batch is None:
+            batch = layer.batch
+            group = layer.group(z)
+        else:
+            layer = None
 
         super().__init__(
             text,
@@ -155,6 +169,8 @@ class PreconfiguredText(Text):
             group,
             z,
         )
+        if layer is not None:
+            layer.add(self, z)
 
 
 class HeadlineText(PreconfiguredText):
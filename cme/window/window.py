@@ -7,6 +7,8 @@ from typing import Optional
 import arcade
 import pyglet
 
+from ..logger import instrumentation
+
 
 class Window(arcade.Window):
     """
@@ -54,6 +56,19 @@ class Window(arcade.Window):
             gl_api=gl_api,
             draw_rate=draw_rate,
         )
+        if instrumentation.ENABLED:
+            pyglet.clock.schedule_interval(self._end_frame, update_rate)
+
+    def _end_frame(self, delta_time: float) -> None:
+        if not instrumentation.ENABLED:
+            # Disabled at runtime
+            pyglet.clock.unschedule(self._end_frame)
+            return
+        instrumentation.end_frame(delta_time)
+
+    def close(self) -> None:
+        pyglet.clock.unschedule(self._end_frame)
+        super().close()  # type: ignore[no-untyped-call]
 
     def on_resize(self, width: int, height: int) -> None:
         super().on_resize(width, height)
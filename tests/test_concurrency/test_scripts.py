@@ -0,0 +1,196 @@
+from typing import Any, Generator
+
+from cme.concurrency import (ScriptEvent, ScriptRunner, WaitEvent, WaitFrames,
+                             WaitSeconds, WaitTween)
+from cme.sprite import Animator
+
+
+def test_wait_seconds_and_frames() -> None:
+    log: list[str] = []
+
+    def script() -> Generator[Any, None, None]:
+        log.append("start")
+        yield WaitSeconds(1)
+        log.append("seconds")
+        yield WaitFrames(2)
+        log.append("frames")
+        yield
+        log.append("end")
+
+    runner = ScriptRunner()
+    handle = runner.start(script())
+    assert log == []
+    runner.update(0.5)
+    assert log == ["start"]
+    runner.update(0.5)
+    assert log == ["start"]
+    runner.update(0.5)
+    assert log == ["start", "seconds"]
+    runner.update(0.1)
+    assert log == ["start", "seconds"]
+    runner.update(0.1)
+    assert log == ["start", "seconds", "frames"]
+    runner.update(0.1)
+    assert log == ["start", "seconds", "frames", "end"]
+    assert handle.finished
+    assert len(runner) == 0
+
+
+def test_wait_tween() -> None:
+    class Obj:
+        value = 0.0
+
+    obj = Obj()
+
+    def script() -> Generator[Any, None, None]:
+        yield WaitTween(Animator(obj, 1, value=10))
+        obj.value = -1
+
+    runner = ScriptRunner()
+    runner.start(script())
+    runner.update(0)
+    runner.update(0.5)
+    assert obj.value == 5
+    runner.update(0.5)
+    assert obj.value == -1
+
+
+def test_shared_tween_is_updated_once() -> None:
+    class Obj:
+        value = 0.0
+
+    obj = Obj()
+    animator = Animator(obj, 1, value=10)
+    resumed = []
+
+    def script(name: str) -> Generator[Any, None, None]:
+        yield WaitTween(animator)
+        resumed.append(name)
+
+    runner = ScriptRunner()
+    runner.start(script("a"))
+    runner.start(script("b"))
+    runner.update(0)
+    runner.update(0.25)
+    assert obj.value == 2.5
+    runner.update(0.75)
+    assert resumed == ["a", "b"]
+
+
+def test_wait_event() -> None:
+    event = ScriptEvent()
+    resumed: list[int] = []
+
+    def script(i: int) -> Generator[Any, None, None]:
+        yield WaitEvent(event)
+        resumed.append(i)
+
+    runner = ScriptRunner()
+    for i in range(1000):
+        runner.start(script(i))
+    runner.update(1)
+    runner.update(1)
+    assert resumed == []
+    event.set()
+    runner.update(0)
+    assert len(resumed) == 1000
+    assert len(runner) == 0
+
+
+def test_cancel_and_errors() -> None:
+    cleaned_up: list[bool] = []
+
+    def script() -> Generator[Any, None, None]:
+        try:
+            yield 10
+        finally:
+            cleaned_up.append(True)
+
+    def failing() -> Generator[Any, None, None]:
+        yield
+        raise ValueError("Oops")
+
+    runner = ScriptRunner()
+    handle = runner.start(script())
+    runner.start(failing())
+    runner.update(0)
+    assert len(runner) == 2
+    handle.cancel()
+    runner.update(0)
+    assert cleaned_up == [True]
+    assert len(runner) == 0
+
+
+def test_cancel_self_and_stop_all_from_script() -> None:
+    cleaned_up: list[str] = []
+    runner = ScriptRunner()
+
+    def cancelling() -> Generator[Any, None, None]:
+        try:
+            handle.cancel()
+            yield
+            cleaned_up.append("resumed")
+        finally:
+            cleaned_up.append("cancelling")
+
+    def stopping() -> Generator[Any, None, None]:
+        try:
+            yield
+            runner.stop_all()
+            yield
+            cleaned_up.append("resumed")
+        finally:
+            cleaned_up.append("stopping")
+
+    def waiting() -> Generator[Any, None, None]:
+        yield WaitEvent(event)
+
+    event = ScriptEvent()
+    handle = runner.start(cancelling())
+    runner.update(0)
+    assert handle.finished
+    assert cleaned_up == ["cancelling"]
+    assert len(runner) == 0
+
+    runner.start(stopping())
+    waiter = runner.start(waiting())
+    runner.start(iter([10]))  # type: ignore[arg-type]
+    runner.update(0)
+    assert len(runner) == 3
+    runner.update(0)
+    assert cleaned_up == ["cancelling", "stopping"]
+    assert waiter.finished
+    assert len(runner) == 0
+    assert event._waiters == []
+    assert runner._timers == []
+
+
+def test_cancel_removes_waiting_scripts() -> None:
+    event = ScriptEvent()
+
+    def script() -> Generator[Any, None, None]:
+        yield WaitEvent(event)
+        yield WaitSeconds(100)
+
+    runner = ScriptRunner()
+    first = runner.start(script())
+    second = runner.start(script())
+    runner.update(0)
+    first.cancel()
+    assert len(event._waiters) == 1
+    event.set()
+    runner.update(0)
+    second.cancel()
+    assert runner._timers == []
+    assert len(runner) == 0
+
+
+def test_bool_is_not_a_delay() -> None:
+    def script() -> Generator[Any, None, None]:
+        yield True
+
+    runner = ScriptRunner()
+    handle = runner.start(script())
+    runner.update(0)
+    assert handle.finished
+    assert len(runner) == 0
@@ -1,5 +1,74 @@
+from typing import Any
+
+import arcade
+import pytest
+from pyglet.text import Label
+
 from cme import font
+from cme.font import metrics
 
 
 def test_exports_load_font() -> None:
     assert hasattr(font, "load_font") and callable(font.load_font)
+
+
+@pytest.mark.requires_window
+def test_font_metrics_match_labels(initialize_window: None) -> None:
+    text = "Hello World!"
+    label = Label(text, font_name="Arial", font_size=24)
+    width, height = font.measure_text_exact(text, "Arial", 24)
+    assert (width, height) == (label.content_width, label.content_height)
+
+    metrics = font.get_font_metrics("Arial")
+    assert metrics is font.get_font_metrics("Arial")
+    scaled_width, _ = metrics.measure(text, 24)
+    assert scaled_width == pytest.approx(width, rel=0.1)
+
+
+@pytest.mark.requires_window
+def test_optimal_font_size_fits(
+    initialize_window: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    text = "Score: 12345"
+    measured = []
+    measure_text_exact = font.measure_text_exact
+
+    def measure(*args: Any) -> tuple[float, float]:
+        measured.append(args)
+        return measure_text_exact(*args)
+
+    monkeypatch.setattr(metrics, "measure_text_exact", measure)
+    size = font.optimal_font_size(text, "Arial", 300, 80)
+    assert len(measured) <= 1
+    width, height = measure_text_exact(text, "Arial", size)
+    assert width <= 300 and height <= 80
+    width, height = measure_text_exact(text, "Arial", size + 2)
+    assert width > 300 or height > 80
+    assert font.optimal_font_size(text, "Arial", 10_000, 10_000) == 512
+
+
+@pytest.mark.requires_window
+def test_optimal_font_size_memo(
+    initialize_window: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    font.optimal_font_size("Memo", "Arial", 200, 50)
+    hits = font.optimal_font_size.cache_info().hits
+    font.optimal_font_size("Memo", "Arial", 200, 50)
+    assert font.optimal_font_size.cache_info().hits == hits + 1
+
+    monkeypatch.setattr(arcade, "load_font", lambda path: None)
+    font.load_font("Custom.ttf")
+    assert font.optimal_font_size.cache_info().currsize == 0
+
+
+@pytest.mark.requires_window
+def test_glyph_atlas(initialize_window: None) -> None:
+    atlas = font.get_glyph_atlas("Arial", 24)
+    assert atlas is font.get_glyph_atlas("Arial", 24)
+    glyph = atlas.glyph("A")
+    assert glyph is atlas.glyph("A")
+    assert glyph.texture.image.getpixel((0, 0))[:3] == (255, 255, 255)
+    assert atlas.glyph("€").advance > 0  # Rasterized on first use
+
+    font.clear_glyph_atlases()
+    assert font.get_glyph_atlas("Arial", 24) is not atlas
@@ -0,0 +1,88 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from cme.localization import (Catalog, LanguageStore, catalog_path,
+                              compile_catalog, compile_catalogs, load_catalog,
+                              load_strings)
+
+
+@pytest.fixture
+def sample_files_dir() -> str:  # type: ignore
+    """Provides a tempdir with files `en_US.toml` and `de_DE.toml`."""
+    with TemporaryDirectory() as tempdir:
+        with open(Path(tempdir) / "en_US.toml", "w", encoding="utf-8") as fp:
+            fp.write(
+                "[meta]\nlangcode=\"en_US\"\n[strings]\nhello=\"Hello\""
+                "\nfallback=\"Fallback\"\n[strings.menu]\nplay=\"Play\""
+            )
+        with open(Path(tempdir) / "de_DE.toml", "w", encoding="utf-8") as fp:
+            fp.write(
+                "[meta]\nlangcode=\"de_DE\"\n[strings]\nhello=\"Hallo\""
+                "\ngreeting=\"Grüß dich\""
+            )
+        yield tempdir
+
+
+def test_compile_and_load(sample_files_dir: str) -> None:
+    toml_path = Path(sample_files_dir) / "en_US.toml"
+    path = compile_catalog(toml_path)
+    assert path == catalog_path(toml_path)
+
+    catalog = Catalog(path)
+    assert catalog.meta == {"langcode": "en_US"}
+    assert catalog["hello"] == "Hello"
+    assert catalog["menu.play"] == "Play"
+    assert "missing" not in catalog
+    with pytest.raises(KeyError):
+        catalog["missing"]
+    assert sorted(catalog) == ["fallback", "hello", "menu.play"]
+    assert catalog.to_dict() == load_strings(toml_path)
+    catalog.close()
+
+
+def test_many_strings(sample_files_dir: str) -> None:
+    toml_path = Path(sample_files_dir) / "big.toml"
+    toml_path.write_text(
+        "[strings]\n"
+        + "".join(f"key_{i}=\"Value {i}\"\n" for i in range(2000)),
+        encoding="utf-8",
+    )
+    catalog = Catalog(compile_catalog(toml_path))
+    assert len(catalog) == 2000
+    assert all(catalog[f"key_{i}"] == f"Value {i}" for i in range(2000))
+    catalog.close()
+
+
+def test_stale_catalog_falls_back(sample_files_dir: str) -> None:
+    toml_path = Path(sample_files_dir) / "de_DE.toml"
+    compile_catalog(toml_path)
+    catalog = load_catalog(toml_path)
+    assert catalog is not None
+    catalog.close()
+
+    toml_path.write_text(
+        "[meta]\nlangcode=\"de_DE\"\n[strings]\nhello=\"Servus\"",
+        encoding="utf-8",
+    )
+    stat = toml_path.stat()
+    os.utime(toml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_catalog(toml_path) is None
+    assert load_strings(toml_path) == {"hello": "Servus"}
+
+
+def test_store_uses_catalogs(sample_files_dir: str) -> None:
+    compiled = compile_catalogs(sample_files_dir)
+    assert len(compiled) == 2
+    store = LanguageStore("de_DE", sample_files_dir)
+    # Memory mapped, nothing decoded but the keys
+    assert all(isinstance(source, Catalog) for source in store._sources)
+    assert store._strings == {}
+    assert store.missing_keys == {"fallback", "menu.play"}
+    assert len(store) == 4
+    assert store["greeting"] == "Grüß dich"
+    assert store["fallback"] == "Fallback"
+    assert store._strings == {"greeting": "Grüß dich", "fallback": "Fallback"}
+    store.close()
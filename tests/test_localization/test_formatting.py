@@ -0,0 +1,105 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from cme.localization import (Formatter, LanguageStore, compile_template,
+                              plural_category)
+
+
+@pytest.mark.parametrize("langcode, n, category", [
+    ("en_US", 1, "one"),
+    ("en_US", 0, "other"),
+    ("de_DE", 2, "other"),
+    ("fr_FR", 0, "one"),
+    ("ru_RU", 21, "one"),
+    ("ru_RU", 23, "few"),
+    ("ru_RU", 11, "many"),
+    ("pl_PL", 22, "few"),
+    ("pl_PL", 25, "many"),
+    ("ja_JP", 1, "other"),
+])
+def test_plural_category(langcode: str, n: int, category: str) -> None:
+    assert plural_category(langcode, n) == category
+
+
+def test_fields() -> None:
+    template = compile_template("{name} has {score:05d} {{points}}", "en_US")
+    assert template.format(name="Kim", score=42) == "Kim has 00042 {points}"
+    with pytest.raises(KeyError):
+        template.format(name="Kim")
+
+
+def test_conversions_and_field_expressions() -> None:
+    class Player:
+        name = "Kim"
+
+    template = compile_template(
+        "{player.name!r} found {loot[0]} and {loot[1]!s:>4}", "en_US"
+    )
+    assert template.format(player=Player(), loot=["gold", 5]) == (
+        "'Kim' found gold and    5"
+    )
+
+
+def test_plural() -> None:
+    template = compile_template(
+        "{player}: {n, plural, =0 {No coins} one {# coin} other {# coins}}",
+        "en_US",
+    )
+    assert template.format(player="A", n=0) == "A: No coins"
+    assert template.format(player="A", n=1) == "A: 1 coin"
+    assert template.format(player="A", n=12) == "A: 12 coins"
+
+    russian = compile_template(
+        "{n, plural, one {# монета} few {# монеты} other {# монет}}", "ru_RU"
+    )
+    assert russian.format(n=3) == "3 монеты"
+    assert russian.format(n=5) == "5 монет"  # many falls back to other
+
+
+def test_unchanged_values_reuse_result() -> None:
+    template = compile_template("{n} coins", "en_US")
+    first = template.format(n=1000)
+    assert template.format(n=1000) is first
+    assert template.format(n=1001) == "1001 coins"
+    assert template.format(n=1) == "1 coins"
+    assert template.format(n=1.0) == "1.0 coins"
+    assert template.format(n=True) == "True coins"
+
+
+def test_mutable_values_are_not_reused() -> None:
+    template = compile_template("{items}", "en_US")
+    items = ["sword"]
+    assert template.format(items=items) == "['sword']"
+    items.append("shield")
+    assert template.format(items=items) == "['sword', 'shield']"
+
+
+@pytest.mark.parametrize("text", [
+    "{n", "}", "{n, plural, one {# coin}}", "{n, select, a {A}}",
+    "{n, plural, other {# coins}", "{0}", "{}", "{n!x}",
+])
+def test_invalid_templates(text: str) -> None:
+    with pytest.raises(ValueError):
+        compile_template(text, "en_US")
+
+
+def test_formatter_caches_templates() -> None:
+    formatter = Formatter({"coins": "{n} coins"}, "en_US")
+    assert formatter.template("coins") is formatter.template("coins")
+    assert formatter.format("coins", n=2) == "2 coins"
+    with pytest.raises(KeyError):
+        formatter.template("missing")
+
+
+def test_language_store_format() -> None:
+    with TemporaryDirectory() as tempdir:
+        (Path(tempdir) / "en_US.toml").write_text(
+            "[meta]\nlangcode=\"en_US\"\n[strings]\n"
+            "coins=\"{n, plural, one {# coin} other {# coins}}\"",
+            encoding="utf-8",
+        )
+        store = LanguageStore("en_US", tempdir)
+        assert store.format("coins", n=1) == "1 coin"
+        assert store.template("coins") is store.template("coins")
@@ -0,0 +1,77 @@
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+import pytest
+
+from cme import logger
+from cme.localization import LanguageStore, LocalizationService
+
+
+@pytest.fixture
+def sample_files_dir() -> str:  # type: ignore
+    """Provides a tempdir with files `en_US.toml` and `de_DE.toml`."""
+    with TemporaryDirectory() as tempdir:
+        with open(Path(tempdir) / "en_US.toml", "w", encoding="utf-8") as fp:
+            fp.write(
+                "[meta]\nlangcode=\"en_US\"\n[strings]\nhello=\"Hello\""
+                "\ncoins=\"{n, plural, one {# coin} other {# coins}}\""
+            )
+        with open(Path(tempdir) / "de_DE.toml", "w", encoding="utf-8") as fp:
+            fp.write(
+                "[meta]\nlangcode=\"de_DE\"\n[strings]\nhello=\"Hallo\""
+                "\ncoins=\"{n, plural, one {# Münze} other {# Münzen}}\""
+            )
+        yield tempdir
+
+
+class Widget:
+    text = ""
+
+
+def wait_loaded(service: LocalizationService) -> None:
+    deadline = time.monotonic() + 5
+    while service.loading and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_switch_at_update(sample_files_dir: str) -> None:
+    service = LocalizationService("en_US", sample_files_dir)
+    greeting = service.bind(Widget(), "hello")
+    coins = service.bind(Widget(), "coins", n=3)
+    assert (greeting.text, coins.text) == ("Hello", "3 coins")
+
+    switched: list[LanguageStore] = []
+    service.add_listener(switched.append)
+    service.switch("de_DE")
+    wait_loaded(service)
+    assert greeting.text == "Hello"  # Not before the frame boundary
+    assert service.update()
+    assert service.langcode == "de_DE"
+    assert (greeting.text, coins.text) == ("Hallo", "3 Münzen")
+    assert switched == [service.store]
+    assert not service.update()
+
+    service.set_values(coins, n=1)
+    assert coins.text == "1 Münze"
+    service.unbind(coins)
+    service.switch("en_US")
+    wait_loaded(service)
+    service.update()
+    assert (greeting.text, coins.text) == ("Hello", "1 Münze")
+
+
+def test_failed_switch_keeps_language(
+    sample_files_dir: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    errors: list[Any] = []
+    monkeypatch.setattr(
+        logger, "error", lambda *args, **kwargs: errors.append(args)
+    )
+    service = LocalizationService("en_US", sample_files_dir)
+    service.switch("xx_XX")
+    wait_loaded(service)
+    assert not service.update()
+    assert service.langcode == "en_US"
+    assert len(errors) == 1
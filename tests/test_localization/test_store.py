@@ -0,0 +1,66 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+import pytest
+
+from cme import logger
+from cme.localization import LanguageStore, flatten_strings
+
+
+@pytest.fixture
+def sample_files_dir() -> str:  # type: ignore
+    """Provides a tempdir with files `en_US.toml` and `de_DE.toml`."""
+    with TemporaryDirectory() as tempdir:
+        with open(Path(tempdir) / "en_US.toml", "w", encoding="utf-8") as fp:
+            fp.write(
+                "[meta]\nlangcode=\"en_US\"\n[strings]\nhello=\"Hello\""
+                "\nfallback=\"Fallback\"\n[strings.menu]\nplay=\"Play\""
+                "\nquit=\"Quit\""
+            )
+        with open(Path(tempdir) / "de_DE.toml", "w", encoding="utf-8") as fp:
+            fp.write(
+                "[meta]\nlangcode=\"de_DE\"\n[strings]\nhello=\"Hallo\""
+                "\n[strings.menu]\nplay=\"Spielen\""
+            )
+        yield tempdir
+
+
+def test_flatten_strings() -> None:
+    assert flatten_strings({"a": "A", "b": {"c": 1, "d": {"e": "E"}}}) == {
+        "a": "A", "b.c": "1", "b.d.e": "E",
+    }
+
+
+def test_store_merges_fallbacks(sample_files_dir: str) -> None:
+    store = LanguageStore("de_DE", sample_files_dir)
+    assert store["hello"] == "Hallo"
+    assert store["menu.play"] == "Spielen"
+    assert store["fallback"] == "Fallback"
+    assert store["menu.quit"] == "Quit"
+    assert store.missing_keys == {"fallback", "menu.quit"}
+    assert len(store) == 4
+
+
+def test_store_reports_missing_keys_once(
+    sample_files_dir: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    warnings: list[Any] = []
+    monkeypatch.setattr(logger, "warning", warnings.append)
+    store = LanguageStore("de_DE", sample_files_dir)
+    assert len(warnings) == 1
+    for _ in range(3):
+        store["fallback"]
+        with pytest.raises(KeyError):
+            store["non-available-key"]
+    assert len(warnings) == 2
+    assert store.get("non-available-key") is None
+
+
+def test_store_requires_languages_path(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from cme.localization import LangDict
+    monkeypatch.delattr(LangDict, "langs_path", raising=False)
+    with pytest.raises(RuntimeError):
+        LanguageStore("en_US")
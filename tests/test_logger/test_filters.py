@@ -0,0 +1,44 @@
+import logging
+
+from cme import logger
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def record(msg: str, level: int = logging.WARNING) -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": msg, "levelno": level})
+
+
+def test_dedup_filter() -> None:
+    clock = Clock()
+    dedup = logger.DedupFilter(window=5, clock=clock)
+    assert dedup.filter(record("Facing unavailable"))
+    assert not any(dedup.filter(record("Facing unavailable"))
+                   for _ in range(10))
+    assert dedup.filter(record("Other message"))
+    assert dedup.filter(record("Facing unavailable", logging.ERROR))
+
+    clock.now = 6
+    passed = record("Facing unavailable")
+    assert dedup.filter(passed)
+    assert "suppressed 10 times" in passed.getMessage()
+    assert not dedup.filter(record("Facing unavailable"))
+
+
+def test_rate_limit_filter() -> None:
+    clock = Clock()
+    limit = logger.RateLimitFilter(rate=10, clock=clock)
+    results = [limit.filter(record(str(i))) for i in range(15)]
+    assert results.count(True) == 10
+    assert limit.filter(record("Critical", logging.CRITICAL))
+
+    clock.now = 1
+    passed = record("Later")
+    assert limit.filter(passed)
+    assert "5 records dropped" in passed.getMessage()
@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+from collections import deque
+
+import pytest
+
+from cme.logger import instrumentation, tracing
+from cme.sprite import SimpleUpdater
+
+
+@pytest.fixture
+def enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(instrumentation, "ENABLED", True)
+    monkeypatch.setattr(instrumentation, "_counters", {})
+    monkeypatch.setattr(instrumentation, "_totals", {})
+    monkeypatch.setattr(
+        instrumentation, "_history", deque(maxlen=10)
+    )
+
+
+@pytest.mark.skipif(instrumentation.ENABLED, reason="CME_INSTRUMENT is set")
+def test_disabled_returns_functions_unchanged() -> None:
+    def func() -> None:
+        pass
+
+    assert instrumentation.instrumented()(func) is func
+    assert not hasattr(SimpleUpdater.update, "__wrapped__")
+
+
+def test_frames(enabled: None) -> None:
+    @instrumentation.instrumented("work")
+    def work(value: int) -> int:
+        return value * 2
+
+    assert work(2) == 4
+    work(3)
+    frame = instrumentation.end_frame()
+    assert frame["work"].calls == 2
+    assert frame["work"].seconds_per_call > 0
+    assert instrumentation.end_frame() == {}
+    work(4)
+    instrumentation.end_frame()
+    assert instrumentation.totals()["work"].calls == 3
+    assert instrumentation.last_frame()["work"].calls == 1
+    assert len(instrumentation.frame_history()) == 3
+    assert instrumentation.registered() == ["work"]
+
+    instrumentation.reset()
+    assert instrumentation.totals() == {}
+
+
+def test_frames_are_traced(enabled: None) -> None:
+    @instrumentation.instrumented("traced work")
+    def work() -> None:
+        pass
+
+    tracing.enable_tracing()
+    try:
+        work()
+        instrumentation.end_frame()
+        (event,) = [
+            event for event in tracing.collect_events()
+            if event["name"] == "instrumented calls"
+        ]
+        assert event["args"] == {"traced work": 1}
+    finally:
+        tracing.disable_tracing()
+        tracing.clear_trace()
+
+
+def test_environment_variable_enables_hot_paths() -> None:
+    code = (
+        "import arcade\n"
+        "from cme.logger import instrumentation\n"
+        "from cme.sprite import SimpleUpdater, WallBounceUpdater\n"
+        "updater, sprite = SimpleUpdater(), arcade.Sprite()\n"
+        "for _ in range(3): updater.update(sprite, 1 / 60)\n"
+        "border = arcade.LBWH(-10, -10, 20, 20)\n"
+        "WallBounceUpdater(border).update(sprite, 1 / 60)\n"
+        "frame = instrumentation.end_frame()\n"
+        "print(frame['SimpleUpdater.update'].calls)\n"
+        "print(frame['WallBounceUpdater.update'].calls)\n"
+    )
+    env = {**os.environ, "CME_INSTRUMENT": "1", "PYGLET_SHADOW_WINDOW": "0"}
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, check=True,
+        capture_output=True, text=True,
+    ).stdout
+    # Wall bounce updates don't count as SimpleUpdater updates
+    assert output.split() == ["3", "1"]
@@ -1,5 +1,6 @@
 import atexit
 import logging
+import queue
 import shutil
 from pathlib import Path
 from tempfile import mkdtemp
@@ -30,3 +31,73 @@ def test_logger_functions() -> None:
         shutil.rmtree(tempdir)
 
     atexit.register(cleanup_logger)
+
+
+def test_queued_logger_flushes_on_shutdown() -> None:
+    tempdir = Path(mkdtemp())
+    try:
+        logger.configure_logger(
+            logs_path=tempdir, level=logger.INFO, queued=True
+        )
+        logger.debug("Not written")
+        args = ["before"]
+        logger.info("Args %s", args)
+        args[0] = "after"
+        try:
+            raise ValueError("Traceback")
+        except ValueError:
+            logger.error("Queued", exc_info=True)
+        logger.shutdown_logger()
+        content = (tempdir / "latest.log").read_text()
+        assert "Queued" in content and "ValueError: Traceback" in content
+        assert "Not written" not in content
+        assert "Args ['before']" in content
+    finally:
+        shutil.rmtree(tempdir)
+
+
+def test_filters_only_see_written_records() -> None:
+    tempdir = Path(mkdtemp())
+    try:
+        logger.configure_logger(
+            logs_path=tempdir, level=logger.WARNING, queued=True,
+            dedup_window=5.0, rate_limit=100.0,
+        )
+        for i in range(500):
+            logger.debug(f"Debug {i}")
+        logger.error("IMPORTANT ERROR")
+        logger.shutdown_logger()
+        assert "IMPORTANT ERROR" in (tempdir / "latest.log").read_text()
+    finally:
+        shutil.rmtree(tempdir)
+
+
+def test_configure_twice_replaces_handler() -> None:
+    tempdir = Path(mkdtemp())
+    try:
+        logger.configure_logger(logs_path=tempdir, level=logger.INFO)
+        logger.configure_logger(logs_path=tempdir, level=logger.INFO)
+        handlers = [
+            handler for handler in logger.LOGGER.handlers
+            if isinstance(handler, logger.CompressingRotatingFileHandler)
+        ]
+        assert len(handlers) == 1
+        logger.info("Once")
+        logger.shutdown_logger()
+        assert handlers[0] not in logger.LOGGER.handlers
+        assert (tempdir / "latest.log").read_text().count("Once") == 1
+    finally:
+        shutil.rmtree(tempdir)
+
+
+def test_bounded_queue_handler_drops() -> None:
+    records: queue.Queue[logging.LogRecord] = queue.Queue(2)
+    handler = logger.BoundedQueueHandler(records)
+    for i in range(5):
+        handler.handle(logging.makeLogRecord({"msg": str(i)}))
+    assert handler.dropped == 3
+    assert [records.get().msg for _ in range(2)] == ["0", "1"]
+    handler.handle(logging.makeLogRecord({"msg": "5"}))
+    assert records.get().msg == "5"
+    assert "Dropped 3" in records.get().getMessage()
+    assert handler.dropped == 0
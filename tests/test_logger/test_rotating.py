@@ -0,0 +1,79 @@
+import gzip
+import json
+import logging
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from cme import logger
+
+
+def make_record(msg: str) -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": msg, "levelno": logging.WARNING,
+                                  "levelname": "WARNING"})
+
+
+def test_rotation_and_compression() -> None:
+    with TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+        (path / "latest.log").write_text("Previous run\n")
+        handler = logger.CompressingRotatingFileHandler(
+            path, max_bytes=100, max_total_bytes=10_000
+        )
+        for i in range(20):
+            handler.emit(make_record(f"Message number {i}"))
+        handler.close()
+        handler.compress_logs()
+
+        archives = sorted(path.glob("*.log.gz"))
+        assert len(archives) >= 2
+        assert not [p for p in path.glob("*.log") if p.name != "latest.log"]
+        content = "".join(
+            gzip.open(archive, "rt").read() for archive in archives
+        ) + (path / "latest.log").read_text()
+        assert "Previous run" in content
+        assert all(f"Message number {i}\n" in content for i in range(20))
+
+
+def test_disk_cap() -> None:
+    with TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+        handler = logger.CompressingRotatingFileHandler(
+            path, max_bytes=1, max_total_bytes=0
+        )
+        for i in range(5):
+            handler.emit(make_record(f"Message {i}"))
+        handler.close()
+        handler.compress_logs()
+        assert not list(path.glob("*.gz"))
+
+
+def test_other_files_are_left_alone() -> None:
+    with TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+        (path / "crash.log").write_text("Crash\n")
+        (path / "notes.log.gz").write_bytes(b"notes")
+        (path / "20240101-120000.log.gz.tmp").write_bytes(b"partial")
+        handler = logger.CompressingRotatingFileHandler(
+            path, max_bytes=1, max_total_bytes=0
+        )
+        assert not (path / "20240101-120000.log.gz.tmp").exists()
+        handler.emit(make_record("Message"))
+        handler.close()
+        handler.compress_logs()
+        assert (path / "crash.log").read_text() == "Crash\n"
+        assert (path / "notes.log.gz").exists()
+
+
+def test_json_lines_formatter() -> None:
+    formatter = logger.JsonLinesFormatter()
+    try:
+        raise ValueError("Broken")
+    except ValueError:
+        record = make_record("Failed %s")
+        record.args = ("badly",)
+        record.exc_info = sys.exc_info()
+    data = json.loads(formatter.format(record))
+    assert data["message"] == "Failed badly"
+    assert data["level"] == "WARNING"
+    assert "ValueError: Broken" in data["exception"]
@@ -0,0 +1,112 @@
+import json
+import multiprocessing
+import threading
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from cme.concurrency import start_helper_thread, start_worker_process
+from cme.logger import tracing
+
+
+@pytest.fixture
+def trace_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    yield tracing.enable_tracing(tmp_path / "trace")
+    tracing.disable_tracing()
+    tracing.clear_trace()
+
+
+def events_named(name: str) -> list[dict[str, object]]:
+    return [
+        event for event in tracing.collect_events() if event["name"] == name
+    ]
+
+
+def test_disabled_records_nothing() -> None:
+    with tracing.span("disabled"):
+        tracing.instant("disabled")
+    assert not events_named("disabled")
+
+
+def test_spans_and_instants(trace_dir: Path) -> None:
+    @tracing.traced()
+    def work() -> int:
+        return 42
+
+    with tracing.span("frame", frame=1):
+        assert work() == 42
+        tracing.instant("marker")
+    tracing.counter("sprites", count=100)
+
+    (frame,) = events_named("frame")
+    assert frame["ph"] == "X" and frame["args"] == {"frame": 1}
+    (call,) = events_named(
+        "test_spans_and_instants.<locals>.work"
+    )
+    assert frame["ts"] <= call["ts"]  # type: ignore[operator]
+    assert events_named("marker")[0]["ph"] == "i"
+    assert events_named("sprites")[0]["args"] == {"count": 100}
+
+
+def test_helper_threads_are_traced(trace_dir: Path) -> None:
+    done = threading.Event()
+    start_helper_thread(
+        target=lambda: None, name="loader", callback=lambda _: done.set()
+    )
+    assert done.wait(5)
+    (thread_span,) = events_named("loader")
+    assert thread_span["cat"] == "thread"
+    assert thread_span["tid"] != threading.get_ident()
+
+
+def test_worker_processes_are_exported(
+    trace_dir: Path, tmp_path: Path
+) -> None:
+    def work() -> int:
+        with tracing.span("in worker"):
+            return 1
+
+    queue = start_worker_process(target=work, name="worker")
+    assert queue.get(timeout=10) == 1
+    path = tracing.export_chrome_trace(tmp_path / "trace.json")
+    events = json.loads(path.read_text())["traceEvents"]
+    worker = [event for event in events if event["name"] == "in worker"]
+    assert len(worker) == 1
+    assert any(event["name"] == "worker" for event in events)
+    assert not events_named("in worker")  # Recorded in the worker
+
+
+def traced_work() -> int:
+    with tracing.span("in spawned worker"):
+        return 2
+
+
+def test_spawned_worker_processes_are_traced(
+    trace_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    context = multiprocessing.get_context("spawn")
+    # Like on Windows and macOS
+    monkeypatch.setattr(multiprocessing, "Queue", context.Queue)
+    monkeypatch.setattr(multiprocessing, "Process", context.Process)
+    queue = start_worker_process(target=traced_work)
+    assert queue.get(timeout=30) == 2
+    path = tracing.export_chrome_trace(tmp_path / "trace.json")
+    events = json.loads(path.read_text())["traceEvents"]
+    assert any(event["name"] == "in spawned worker" for event in events)
+
+
+def test_buffers_of_ended_threads_are_released(trace_dir: Path) -> None:
+    def work() -> None:
+        tracing.instant("in thread")
+
+    for _ in range(3):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+    assert len(events_named("in thread")) == 3
+    tracing.collect_events()
+    assert sum(buffer.finished for buffer in tracing._buffers) == 3
+    tracing.export_chrome_trace(trace_dir / "trace.json")
+    assert not any(buffer.finished for buffer in tracing._buffers)
+    assert not events_named("in thread")
@@ -0,0 +1,27 @@
+from typing import Any, Optional
+
+from cme import resource_
+
+
+class SampleGameSave(resource_.GameSave):
+    def __init__(self, level: int, items: Optional[list[Any]] = None) -> None:
+        self.level = level
+        self.items = items if items is not None else []
+
+    def update(self, **kwargs: Any) -> None:
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def summary(self) -> dict[str, Any]:
+        return {"level": self.level}
+
+    def _serialize(self) -> dict[str, Any]:
+        return {"level": self.level, "items": self.items}
+
+    @classmethod
+    def _deserialize(cls, dictionary: dict[str, Any]) -> "SampleGameSave":
+        return cls(**dictionary)
+
+    @staticmethod
+    def defaults() -> dict[str, Any]:
+        return {"level": 1, "items": []}
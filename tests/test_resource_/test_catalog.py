@@ -0,0 +1,94 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cme import resource_
+from cme.resource_ import paths
+
+from .conftest import SampleGameSave
+
+
+def test_record_and_reload(tmp_path: Path) -> None:
+    file = tmp_path / "gamesave.bin"
+    file.write_bytes(b"data")
+    catalog = resource_.SaveCatalog(tmp_path)
+    catalog.record(file, "alice", {"thumbnail": b"\x89PNG", "level": 2})
+    entry = resource_.SaveCatalog(tmp_path).get("gamesave.bin", "alice")
+    assert entry is not None
+    assert entry["size"] == 4
+    assert entry["summary"] == {"thumbnail": b"\x89PNG", "level": 2}
+    assert catalog.profiles() == ["alice"]
+
+
+def test_verify_and_refresh(tmp_path: Path) -> None:
+    file = tmp_path / "gamesave.json"
+    file.write_bytes(b"{}")
+    catalog = resource_.SaveCatalog(tmp_path)
+    catalog.record(file)
+    assert catalog.verify("gamesave.json")
+    file.write_bytes(b"[]")
+    assert not catalog.verify("gamesave.json")
+    file.unlink()
+    catalog.refresh()
+    assert catalog.get("gamesave.json") is None
+    assert catalog.profiles() == []
+
+
+def test_invalid_catalog_is_rebuilt(tmp_path: Path) -> None:
+    (tmp_path / resource_.catalog.CATALOG_FILENAME).write_text("garbage")
+    assert resource_.SaveCatalog(tmp_path).profiles() == []
+
+
+def test_save_functions_update_catalog(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(paths, "DATA_PATH", tmp_path)
+    resource_.save_game_save(SampleGameSave(3))
+    resource_.save_game_save_async(SampleGameSave(5), "bob")
+    assert resource_.get_save_writer().flush(5)
+    catalog = resource_.get_save_catalog(tmp_path / "saves")
+    assert catalog.slots()["gamesave.json"]["summary"] == {"level": 3}
+    assert catalog.slots("bob")["gamesave_bob.json"]["summary"] == {
+        "level": 5
+    }
+    assert catalog.verify("gamesave_bob.json", "bob")
+
+
+def test_checksum_is_computed_while_writing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(paths, "DATA_PATH", tmp_path)
+    resource_.save_game_save(SampleGameSave(3))
+    resource_.save_game_save_async(SampleGameSave(5), "bob")
+    assert resource_.get_save_writer().flush(5)
+
+    def fail(file: Path) -> str:
+        raise AssertionError(f"{file} was read again")
+
+    # Only verify() reads the saves
+    catalog = resource_.get_save_catalog(tmp_path / "saves")
+    assert catalog.verify("gamesave.json")
+    assert catalog.verify("gamesave_bob.json", "bob")
+    monkeypatch.setattr(resource_.catalog, "_checksum", fail)
+    resource_.save_game_save(SampleGameSave(4))
+    resource_.save_game_save_async(SampleGameSave(6), "bob")
+    assert resource_.get_save_writer().flush(5)
+    monkeypatch.undo()
+    assert catalog.verify("gamesave.json")
+    assert catalog.verify("gamesave_bob.json", "bob")
+
+
+def test_checksum_of_changed_file_is_not_reused(tmp_path: Path) -> None:
+    file = tmp_path / "gamesave.json"
+    catalog = resource_.SaveCatalog(tmp_path)
+    resource_.atomic_write(file, lambda fp: fp.write(b"{}"))
+    file.write_bytes(b"[1]")  # Replaced before it was recorded
+    catalog.record(file)
+    assert catalog.verify("gamesave.json")
+
+    resource_.atomic_write(file, lambda fp: fp.write(b"{}"))
+    catalog.record(file)
+    file.write_bytes(b"[]")
+    catalog.record(file)  # The checksum of the write was used already
+    assert catalog.verify("gamesave.json")
@@ -0,0 +1,207 @@
+import errno
+import io
+import random
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from cme.resource_ import ChunkedSaveStore, chunks
+
+
+def test_commit_and_lazy_load(tmp_path: Path) -> None:
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        store["0,0"] = {"tiles": [1, 2, 3]}
+        store["0,1"] = {"tiles": [4, 5, 6]}
+        assert store.dirty == {"0,0", "0,1"}
+        store.commit()
+        assert store.dirty == set()
+
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        assert store.keys() == {"0,0", "0,1"}
+        assert store._cache == {}  # Nothing decoded yet
+        assert store["0,1"] == {"tiles": [4, 5, 6]}
+        assert set(store._cache) == {"0,1"}
+        store.preload(["0,0", "unknown"])
+        assert set(store._cache) == {"0,0", "0,1"}
+
+
+def test_only_dirty_chunks_are_written(tmp_path: Path) -> None:
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        for i in range(10):
+            store[str(i)] = list(range(100))
+        store.commit()
+        size = store.file.stat().st_size
+        store["3"].append(100)
+        store.mark_dirty("3")
+        store.commit()
+        record_size = store.file.stat().st_size - size
+        # One of ten chunks and a commit record
+        assert 0 < record_size < size / 8
+        store.commit()  # Nothing dirty, nothing written
+        assert store.file.stat().st_size == size + record_size
+
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        assert store["3"][-1] == 100
+
+
+def test_delete(tmp_path: Path) -> None:
+    with ChunkedSaveStore("world", "profile", directory=tmp_path) as store:
+        store["a"] = 1
+        store["b"] = 2
+        store.commit()
+        del store["a"]
+        store.commit()
+    with ChunkedSaveStore("world", "profile", directory=tmp_path) as store:
+        assert "a" not in store
+        assert store.keys() == {"b"}
+
+
+def test_delete_then_read(tmp_path: Path) -> None:
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        store["a"] = 1
+        store.commit()
+        store.unload()
+        del store["a"]
+        assert "a" not in store
+        assert store.get("a") is None
+        assert store.keys() == set()
+        with pytest.raises(KeyError):
+            store["a"]
+        with pytest.raises(KeyError):
+            del store["a"]
+        store.preload(["a"])
+        assert store.keys() == set()
+        store.commit()
+        assert "a" not in store
+
+
+def test_compaction(tmp_path: Path) -> None:
+    store = ChunkedSaveStore(
+        "world", directory=tmp_path, compaction_ratio=1.1,
+        compaction_min_size=0,
+    )
+    store["static"] = "x" * 1000
+    for i in range(20):
+        store["counter"] = i
+        store.commit()
+    # Without compaction this would contain 20 counter records
+    assert store.file.stat().st_size < 1150
+    assert store["static"] == "x" * 1000
+    store.close()
+    store = ChunkedSaveStore("world", directory=tmp_path)
+    assert store["counter"] == 19
+    assert store["static"] == "x" * 1000
+    store.close()
+
+
+def test_torn_write_is_discarded(tmp_path: Path) -> None:
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        store["a"] = 1
+        store.commit()
+        store["a"] = 2
+        store.commit()
+        size = store.file.stat().st_size
+    with open(tmp_path / "world.journal", "r+b") as fp:
+        fp.truncate(size - 1)
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        assert store["a"] == 1
+
+
+def test_torn_commit_is_discarded(tmp_path: Path) -> None:
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        store["a"] = 1
+        store["b"] = 1
+        store.commit()
+        size = store.file.stat().st_size
+        store["a"] = 2
+        store["b"] = 2
+        store.commit()
+    # Everything but the commit record was written
+    with open(tmp_path / "world.journal", "r+b") as fp:
+        fp.truncate(fp.seek(0, 2) - 10)
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        assert store["a"] == 1
+        assert store["b"] == 1
+        assert store.file.stat().st_size == size
+
+
+def test_garbage_tail_is_discarded(tmp_path: Path) -> None:
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        store["a"] = 1
+        store.commit()
+        size = store.file.stat().st_size
+    with open(tmp_path / "world.journal", "ab") as fp:
+        fp.write(bytes(64))
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        assert store.keys() == {"a"}
+        assert store.file.stat().st_size == size
+
+
+def test_failed_commit_is_overwritten(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FullDisk(io.FileIO):
+        def write(self, data: Any) -> int:
+            super().write(bytes(data)[:len(data) // 2])
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        def truncate(self, size: Optional[int] = None) -> int:
+            raise OSError(errno.EIO, "Input/output error")
+
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        store["a"] = 1
+        store["b"] = 2
+        store.commit()
+        size = store.file.stat().st_size
+        store["a"] = 10
+        store["c"] = 3
+        monkeypatch.setattr(
+            chunks, "open",
+            lambda file, mode, buffering: FullDisk(file, mode.strip("b")),
+            raising=False,
+        )
+        with pytest.raises(OSError):
+            store.commit()
+        monkeypatch.undo()
+        assert store.file.stat().st_size > size  # Left the torn records
+        store.commit()
+    with ChunkedSaveStore("world", directory=tmp_path) as store:
+        assert {key: store[key] for key in store} == {"a": 10, "b": 2, "c": 3}
+
+
+def test_matches_dict(tmp_path: Path) -> None:
+    rng = random.Random(0)
+    model: dict[str, Any] = {}
+    committed: dict[str, Any] = {}
+    store = ChunkedSaveStore(
+        "world", directory=tmp_path, compaction_ratio=1.5,
+        compaction_min_size=0,
+    )
+    for _ in range(2000):
+        key = str(rng.randrange(8))
+        action = rng.randrange(7)
+        if action == 0:
+            model[key] = store[key] = rng.randrange(100)
+        elif action == 1:
+            if key in model:
+                del model[key]
+                del store[key]
+            else:
+                with pytest.raises(KeyError):
+                    del store[key]
+        elif action == 2:
+            store.commit()
+            committed = dict(model)
+        elif action == 3:
+            store.unload()
+        elif action == 4:
+            store.close()
+            store = ChunkedSaveStore("world", directory=tmp_path)
+            model = dict(committed)
+        elif action == 5:
+            store.preload([key])
+        assert (key in store) == (key in model)
+        assert store.get(key) == model.get(key)
+        assert store.keys() == model.keys()
+    store.close()
@@ -0,0 +1,49 @@
+import pytest
+
+from cme.resource_ import codec
+
+SAMPLES = [
+    None, True, False, 0, 1, 127, 128, 255, 256, 65535, 65536, 2 ** 32,
+    2 ** 64 - 1, -1, -32, -33, -128, -129, -32768, -32769, -2 ** 31,
+    -2 ** 31 - 1, -2 ** 63, 0.0, 1.5, -3.25e100, "", "a" * 31, "b" * 32,
+    "c" * 255, "d" * 256, "e" * 65536, "Grüße ✓", b"", b"\x00" * 300,
+    [], list(range(15)), list(range(16)), list(range(70000)),
+    {}, {str(i): i for i in range(15)}, {str(i): i for i in range(16)},
+    {1: "int key", "nested": {"list": [1, [2, [3, {"deep": None}]]]}},
+]
+
+
+@pytest.mark.parametrize("value", SAMPLES)
+def test_roundtrip(value: object) -> None:
+    assert codec._py_unpackb(codec._py_packb(value)) == value
+    assert codec.unpackb(codec.packb(value)) == value
+
+
+def test_tuples_decode_as_lists() -> None:
+    assert codec.unpackb(codec.packb((1, (2, 3)))) == [1, [2, 3]]
+
+
+def test_known_encoding() -> None:
+    assert codec._py_packb({"a": [1, -1, None]}) == (
+        b"\x81\xa1a\x93\x01\xff\xc0"
+    )
+
+
+def test_errors() -> None:
+    with pytest.raises(TypeError):
+        codec._py_packb(object())
+    with pytest.raises(ValueError):
+        codec._py_unpackb(b"\xc1")
+    with pytest.raises(ValueError):
+        codec._py_unpackb(b"\x01\x02")
+
+
+def test_subclasses() -> None:
+    from enum import IntEnum
+
+    class Level(IntEnum):
+        ONE = 1
+
+    assert codec.unpackb(codec._py_packb({"level": Level.ONE})) == {
+        "level": 1
+    }
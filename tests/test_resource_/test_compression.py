@@ -0,0 +1,89 @@
+import io
+import json
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from cme import resource_
+from cme.resource_ import compression
+
+from .conftest import SampleGameSave
+
+
+class CompressedGameSave(SampleGameSave):
+    COMPRESSION: Optional[compression.Compression] = "gzip"
+
+
+class CompressedPickleGameSave(resource_.PickleGameSave):
+    COMPRESSION: Optional[compression.Compression] = "lzma"
+
+    def __init__(self, tiles: list[int]) -> None:
+        self.tiles = tiles
+
+    def update(self, **kwargs: Any) -> None:
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    @staticmethod
+    def defaults() -> dict[str, Any]:
+        return {"tiles": []}
+
+
+@pytest.mark.parametrize(
+    "method", [None, *compression.available_compressions()]
+)
+def test_stream_roundtrip(
+    tmp_path: Path, method: Optional[compression.Compression]
+) -> None:
+    data = b"tile" * 10_000
+    file = tmp_path / "data"
+    with open(file, "wb") as fp:
+        with compression.compressed_writer(fp, method) as out:
+            out.write(data)
+    if method is not None:
+        assert file.stat().st_size < len(data)
+    assert compression.detect_compression(file.read_bytes()) == method
+    with compression.open_decompressed(file) as fp:
+        assert fp.read() == data
+
+
+def test_compressed_game_save(tmp_path: Path) -> None:
+    file = tmp_path / "save.json"
+    CompressedGameSave(4, [1, 2, 3] * 1000).save_to_file(file)
+    assert file.read_bytes().startswith(b"\x1f\x8b")
+    loaded = CompressedGameSave.from_file(file)
+    assert isinstance(loaded, CompressedGameSave)
+    assert loaded.level == 4
+    assert loaded.items == [1, 2, 3] * 1000
+
+
+def test_json_output_matches_json_dumps(tmp_path: Path) -> None:
+    class Plain(CompressedGameSave):
+        COMPRESSION = None
+
+    file = tmp_path / "save.json"
+    game_save = Plain(2, [5, 6])
+    game_save.save_to_file(file)
+    assert file.read_text() == json.dumps(game_save._serialize())
+
+
+def test_compressed_pickle_game_save(tmp_path: Path) -> None:
+    file = tmp_path / "save.pkl"
+    CompressedPickleGameSave([7] * 1000).save_to_file_async(file)
+    assert resource_.get_save_writer().flush(5)
+    assert file.read_bytes().startswith(b"\xfd7zXZ\x00")
+    loaded = CompressedPickleGameSave.from_file(file)
+    assert isinstance(loaded, CompressedPickleGameSave)
+    assert loaded.tiles == [7] * 1000
+
+
+def test_uncompressed_pickle_still_loads(tmp_path: Path) -> None:
+    file = tmp_path / "save.pkl"
+    buffer = io.BytesIO()
+    pickle.dump(CompressedPickleGameSave([1]), buffer)
+    file.write_bytes(buffer.getvalue())
+    loaded = CompressedPickleGameSave.from_file(file)
+    assert isinstance(loaded, CompressedPickleGameSave)
+    assert loaded.tiles == [1]
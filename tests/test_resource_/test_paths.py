@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from cme import resource_
 
 
@@ -11,3 +14,13 @@ def test_path_constants() -> None:
     ).startswith(
         str(resource_.DATA_PATH.resolve())
     )
+
+
+def test_import_has_no_side_effects() -> None:
+    code = (
+        "import sys, cme.resource_, cme.localization, cme.concurrency; "
+        "assert 'arcade' not in sys.modules; "
+        "assert 'pyglet' not in sys.modules; "
+        "assert 'DATA_PATH' not in vars(cme.resource_.paths)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,186 @@
+import os
+import stat
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import pytest
+
+from cme import resource_
+
+from .conftest import SampleGameSave
+
+
+def test_save_to_file_roundtrip(tmp_path: Path) -> None:
+    game_save = SampleGameSave(3, ["sword"])
+    game_save.save_to_file(tmp_path / "save.json")
+    loaded = SampleGameSave.from_file(tmp_path / "save.json")
+    assert isinstance(loaded, SampleGameSave)
+    assert loaded.level == 3
+    assert loaded.items == ["sword"]
+    # No temporary files are left behind
+    assert [p.name for p in tmp_path.iterdir()] == ["save.json"]
+
+
+def test_atomic_write_keeps_old_file_on_error(tmp_path: Path) -> None:
+    file = tmp_path / "save.json"
+    SampleGameSave(3, []).save_to_file(file)
+
+    def failing_write(fp: BinaryIO) -> None:
+        fp.write(b"{\"level\": ")
+        raise RuntimeError("Crash mid-write")
+
+    with pytest.raises(RuntimeError):
+        resource_.atomic_write(file, failing_write)
+    assert SampleGameSave.from_file(file).level == 3  # type: ignore
+    assert [p.name for p in tmp_path.iterdir()] == ["save.json"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_atomic_write_keeps_permissions(tmp_path: Path) -> None:
+    file = tmp_path / "save.json"
+    resource_.atomic_write(file, lambda fp: fp.write(b"{}"))
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(file.stat().st_mode) == 0o666 & ~umask
+    file.chmod(0o640)
+    resource_.atomic_write(file, lambda fp: fp.write(b"{}"))
+    assert stat.S_IMODE(file.stat().st_mode) == 0o640
+
+
+def test_save_to_file_async_snapshot(tmp_path: Path) -> None:
+    game_save = SampleGameSave(3, ["sword"])
+    written: list[Path] = []
+    game_save.save_to_file_async(tmp_path / "save.json", written.append)
+    game_save.items.append("shield")  # Not part of the snapshot
+    assert resource_.get_save_writer().flush(timeout=5)
+    assert written == [tmp_path / "save.json"]
+    loaded = SampleGameSave.from_file(tmp_path / "save.json")
+    assert loaded.items == ["sword"]  # type: ignore
+
+
+def test_background_writer_coalesces(tmp_path: Path) -> None:
+    writer = resource_.BackgroundWriter()
+    release = threading.Event()
+    writes: list[bytes] = []
+
+    def blocking_write(fp: BinaryIO) -> None:
+        release.wait(5)
+
+    def make_write(data: bytes) -> Any:
+        def write(fp: BinaryIO) -> None:
+            writes.append(data)
+            fp.write(data)
+        return write
+
+    callbacks: list[Path] = []
+    writer.submit(tmp_path / "blocker", blocking_write)
+    for i in range(5):
+        writer.submit(
+            tmp_path / "save", make_write(str(i).encode()), callbacks.append
+        )
+    release.set()
+    assert writer.flush(timeout=5)
+    assert writes == [b"4"]
+    assert callbacks == [tmp_path / "save"] * 5
+    assert (tmp_path / "save").read_bytes() == b"4"
+
+
+class SampleBinaryGameSave(resource_.BinaryGameSave):
+    SCHEMA_VERSION = 3
+    MIGRATIONS = {
+        1: lambda old: {**old, "coins": 0},
+        2: lambda old: {**old, "level": old["level"] * 10},
+    }
+
+    def __init__(self, level: int, coins: int) -> None:
+        self.level = level
+        self.coins = coins
+
+    def update(self, **kwargs: Any) -> None:
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def _serialize(self) -> dict[str, Any]:
+        return {"level": self.level, "coins": self.coins}
+
+    @classmethod
+    def _deserialize(
+        cls, dictionary: dict[str, Any]
+    ) -> "SampleBinaryGameSave":
+        return cls(**dictionary)
+
+    @staticmethod
+    def defaults() -> dict[str, Any]:
+        return {"level": 1, "coins": 0}
+
+
+def test_binary_save_roundtrip(tmp_path: Path) -> None:
+    SampleBinaryGameSave(4, 20).save_to_file(tmp_path / "save.bin")
+    loaded = SampleBinaryGameSave.from_file(tmp_path / "save.bin")
+    assert isinstance(loaded, SampleBinaryGameSave)
+    assert (loaded.level, loaded.coins) == (4, 20)
+
+
+def test_binary_save_migrations() -> None:
+    class OldGameSave(SampleBinaryGameSave):
+        SCHEMA_VERSION = 1
+
+        def _serialize(self) -> dict[str, Any]:
+            return {"level": self.level}
+
+    data = OldGameSave(2, 0).to_bytes()
+    loaded = SampleBinaryGameSave.from_bytes(data)
+    assert (loaded.level, loaded.coins) == (20, 0)  # type: ignore
+
+    newer = SampleBinaryGameSave(1, 1).to_bytes()
+    with pytest.raises(ValueError):
+        OldGameSave.from_bytes(newer)
+    with pytest.raises(ValueError):
+        SampleBinaryGameSave.from_bytes(b"JSON" + newer[4:])
+
+
+class SummarizedGameSave(SampleBinaryGameSave):
+    def summary(self) -> dict[str, Any]:
+        return {"level": self.level}
+
+
+def test_binary_save_summary_and_lazy_fields(tmp_path: Path) -> None:
+    SummarizedGameSave(4, 20).save_to_file(tmp_path / "save.bin")
+    assert resource_.read_binary_save_summary(tmp_path / "save.bin") == {
+        "level": 4
+    }
+    lazy = resource_.LazyBinarySave(tmp_path / "save.bin")
+    assert lazy.summary == {"level": 4}
+    assert lazy._index is None  # Nothing but the summary has been read
+    assert lazy["coins"] == 20
+    assert lazy._fields == {"coins": 20}
+    assert lazy.fields() == ["level", "coins"]
+    loaded = lazy.load(SummarizedGameSave)
+    assert (loaded.level, loaded.coins) == (4, 20)  # type: ignore
+
+
+def test_binary_save_format_1_compatibility(tmp_path: Path) -> None:
+    from cme.resource_ import codec
+    from cme.resource_.saves import _BINARY_HEADER
+    data = _BINARY_HEADER.pack(b"CMES", 1, 3) + codec.packb(
+        {"level": 2, "coins": 5}
+    )
+    (tmp_path / "old.bin").write_bytes(data)
+    loaded = SampleBinaryGameSave.from_file(tmp_path / "old.bin")
+    assert (loaded.level, loaded.coins) == (2, 5)  # type: ignore
+    assert resource_.read_binary_save_summary(tmp_path / "old.bin") == {}
+    assert resource_.LazyBinarySave(tmp_path / "old.bin")["coins"] == 5
+
+
+def test_list_binary_game_saves(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from cme.resource_ import paths
+    monkeypatch.setattr(paths, "DATA_PATH", tmp_path)
+    resource_.save_binary_game_save(SummarizedGameSave(1, 0))
+    resource_.save_binary_game_save(SummarizedGameSave(7, 0), "alice")
+    assert resource_.list_binary_game_saves() == {
+        None: {"level": 1},
+        "alice": {"level": 7},
+    }
@@ -1,3 +1,7 @@
+import json
+import threading
+import time
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -32,3 +36,136 @@ def test_settings_interface() -> None:
     from cme import resource_
     with pytest.raises(TypeError):
         resource_.Settings()  # type: ignore
+
+
+class TrackedSettings(resource_.Settings):
+    def __init__(self, volume: int = 50, language: str = "en") -> None:
+        self.volume = volume
+        self.language = language
+
+    def apply(self) -> None:
+        pass
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def _serialize(self) -> dict[str, Any]:
+        return {"volume": self.volume, "language": self.language}
+
+    @classmethod
+    def _deserialize(cls, dictionary: dict[str, Any]) -> "TrackedSettings":
+        return cls(**dictionary)
+
+    @staticmethod
+    def defaults() -> dict[str, Any]:
+        return {"volume": 50, "language": "en"}
+
+
+def test_settings_tracker_observers(tmp_path: Path) -> None:
+    tracker = resource_.SettingsTracker(
+        TrackedSettings(), file=tmp_path / "settings.json", delay=60
+    )
+    calls: list[set[str]] = []
+    tracker.add_observer(lambda _, keys: calls.append(keys), keys=["volume"])
+    assert tracker.update(language="de") == {"language"}
+    assert tracker.update(volume=50) == set()
+    assert tracker.update(volume=60) == {"volume"}
+    assert calls == [{"volume"}]
+    assert tracker.dirty == {"language", "volume"}
+
+
+def test_settings_tracker_debounced_write(tmp_path: Path) -> None:
+    file = tmp_path / "settings.json"
+    tracker = resource_.SettingsTracker(TrackedSettings(), file=file, delay=60)
+    for volume in range(10):
+        tracker.update(volume=volume)
+    assert not file.exists()
+    tracker.flush()
+    assert json.loads(file.read_text()) == {"volume": 9, "language": "en"}
+    assert tracker.dirty == set()
+
+    tracker.delay = 0.01
+    tracker.update(volume=20)
+    deadline = time.monotonic() + 5
+    while tracker.dirty and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert json.loads(file.read_text())["volume"] == 20
+
+
+def test_settings_tracker_pushes_deadline_back(tmp_path: Path) -> None:
+    file = tmp_path / "settings.json"
+    now = [0.0]
+    tracker = resource_.SettingsTracker(
+        TrackedSettings(), file=file, delay=3, clock=lambda: now[0]
+    )
+    tracker.update(volume=0)
+    writer = tracker._writer
+    for volume in range(1, 5):
+        now[0] += 1
+        tracker.update(volume=volume)
+        assert tracker._writer is writer  # No thread per change
+    assert tracker._deadline == 7
+    now[0] = 6.9
+    with tracker._cond:
+        tracker._cond.notify()
+    # Changes never settled for 3 seconds
+    assert not file.exists()
+    now[0] = 7
+    with tracker._cond:
+        tracker._cond.notify()
+    assert writer is not None
+    writer.join(5)
+    assert json.loads(file.read_text())["volume"] == 4
+    assert tracker._writer is None
+
+
+def test_settings_tracker_writes_without_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tracker = resource_.SettingsTracker(
+        TrackedSettings(), file=tmp_path / "settings.json", delay=60
+    )
+    writing = threading.Event()
+    release = threading.Event()
+
+    def slow_write(file: Path, dictionary: dict[str, Any]) -> None:
+        writing.set()
+        release.wait(5)
+
+    monkeypatch.setattr(resource_.settings, "_write_settings", slow_write)
+    tracker.update(volume=10)
+    thread = threading.Thread(target=tracker.flush)
+    thread.start()
+    assert writing.wait(5)
+    # Doesn't wait for the write
+    assert tracker.update(volume=20) == {"volume"}
+    release.set()
+    thread.join(5)
+    # The second change wasn't written yet
+    assert tracker.dirty == {"volume"}
+
+
+def test_settings_tracker_subscriptions_and_batch(tmp_path: Path) -> None:
+    tracker = resource_.SettingsTracker(
+        TrackedSettings(), file=tmp_path / "settings.json", delay=60
+    )
+    window_calls: list[dict[str, Any]] = []
+    audio_calls: list[dict[str, Any]] = []
+    tracker.subscribe("language", "volume")(window_calls.append)
+    tracker.subscribe("volume")(audio_calls.append)
+
+    tracker.update(language="de")
+    assert window_calls == [{"language": "de"}]
+    assert audio_calls == []
+
+    with tracker.batch():
+        tracker.update(language="fr")
+        tracker.update(volume=10)
+        assert len(window_calls) == 1
+    assert window_calls[-1] == {"language": "fr", "volume": 10}
+    assert audio_calls == [{"volume": 10}]
+
+    tracker.unsubscribe(audio_calls.append)
+    tracker.update(volume=20)
+    assert len(audio_calls) == 1
@@ -0,0 +1,54 @@
+import arcade
+import pytest
+
+from cme.font import get_glyph_atlas
+from cme.text import BitmapText
+
+
+@pytest.mark.requires_window
+def test_text_sprites(initialize_window: arcade.Window) -> None:
+    text = BitmapText("1234", 100, 50, font_size=24)
+    atlas = get_glyph_atlas("Arial", 24)
+    assert text.atlas is atlas
+    assert len(text.sprite_list) == 4
+    assert text.content_width == pytest.approx(atlas.text_width("1234"))
+    assert text.sprite_list[0].texture is atlas.glyph("1").texture
+    text.draw()
+
+
+@pytest.mark.requires_window
+def test_updates_changed_characters_only(
+    initialize_window: arcade.Window,
+) -> None:
+    text = BitmapText("100", font_size=24)
+    first, second, third = text.sprite_list
+    positions = [sprite.position for sprite in text.sprite_list]
+
+    text.text = "109"
+    assert list(text.sprite_list) == [first, second, third]
+    assert third.texture is text.atlas.glyph("9").texture
+    assert first.texture is text.atlas.glyph("1").texture
+    assert [first.position, second.position] == positions[:2]
+
+    text.text = "1"
+    assert len(text.sprite_list) == 3
+    assert not second.visible and not third.visible
+    text.text = "12"
+    assert second.visible and len(text.sprite_list) == 3
+
+    text.position = (10, 20)
+    assert first.position == (positions[0][0] + 10, positions[0][1] + 20)
+
+    text.delete()
+    assert len(text.sprite_list) == 0
+
+
+@pytest.mark.requires_window
+def test_shared_sprite_list(initialize_window: arcade.Window) -> None:
+    sprite_list: arcade.SpriteList[arcade.BasicSprite] = arcade.SpriteList()
+    texts = [
+        BitmapText(str(i), i * 10, 0, sprite_list=sprite_list)
+        for i in range(20)
+    ]
+    assert len(sprite_list) == sum(len(text.text) for text in texts)
+    sprite_list.draw()
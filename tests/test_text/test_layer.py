@@ -0,0 +1,75 @@
+from typing import Any
+
+import arcade
+import pytest
+from pyglet.graphics import Batch
+from pyglet.text import Label
+
+from cme.text import NormalText, PreconfiguredText, Text, TextLayer
+
+
+@pytest.mark.requires_window
+def test_add_and_remove(initialize_window: arcade.Window) -> None:
+    layer = TextLayer()
+    text = layer.add(Text("Score", 0, 0), z=2)
+    assert text in layer and len(layer) == 1
+    assert text.batch is layer.batch
+    assert text.group is layer.group(2)
+    assert layer.group(2).order == 2
+
+    layer.remove(text)
+    assert text not in layer
+    assert text.batch is not layer.batch
+    layer.draw()
+    text.draw()
+
+
+@pytest.mark.requires_window
+def test_default_layer(
+    initialize_window: arcade.Window, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    layer = TextLayer()
+    monkeypatch.setattr(PreconfiguredText, "DEFAULT_LAYER", layer)
+    text = NormalText("Lives: 3", z=1)
+    assert text in layer
+    assert text.group is layer.group(1)
+
+    own_batch = NormalText("Paused", batch=Batch())
+    assert own_batch not in layer
+
+
+@pytest.mark.requires_window
+def test_deferred_lays_out_dirty_texts_once(
+    initialize_window: arcade.Window, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    layer = TextLayer()
+    changed = layer.add(Text("1", 0, 0))
+    unchanged = layer.add(Text("Unchanged", 0, 0))
+    width = changed.content_width
+
+    updated: list[Label] = []
+    get_lines = Label._get_lines
+
+    def counting_get_lines(self: Label) -> Any:
+        updated.append(self)
+        return get_lines(self)
+
+    monkeypatch.setattr(Label, "_get_lines", counting_get_lines)
+    with layer.deferred():
+        changed.text = "12"
+        changed.text = "123"
+        changed.font_size = 30
+    assert updated == [changed._label]
+    assert unchanged._label not in updated
+    assert changed.content_width > width
+    layer.draw()
+
+    updated.clear()
+    changed.text = "1"  # Laid out immediately again
+    assert updated == [changed._label]
+
+    updated.clear()
+    with layer.deferred():
+        changed.color = (255, 0, 0, 255)  # Only updates the vertex colors
+    assert updated == []
+    assert changed._label.color == (255, 0, 0, 255)